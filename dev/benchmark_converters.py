@@ -0,0 +1,389 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+# ruff: noqa: T201
+
+import argparse
+import gc
+import json
+import platform
+import re
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from io import BytesIO, StringIO
+from pathlib import Path
+from statistics import mean
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from lxml import etree
+from openpyxl.reader.excel import load_workbook
+from requests_mock import ANY, Mocker
+
+sys.path.append(str(Path(Path(__file__).parent.parent, 'src')))  # noqa: E402
+
+from parkapi_sources import ParkAPISources
+from parkapi_sources.converters.base_converter import BaseConverter
+from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter, ParkingSpotPullConverter
+from parkapi_sources.converters.base_converter.push import CsvConverter, JsonConverter, XlsxConverter, XmlConverter
+
+DATA_PATH = Path(Path(__file__).parent.parent, 'tests', 'converters', 'data')
+
+MOBILITHEK_CONFIG: dict[str, str] = {
+    'PARK_API_MOBILITHEK_CERT': '/dev/null',
+    'PARK_API_MOBILITHEK_KEY': '/dev/null',
+}
+
+
+def mobilithek_case(source_uid: str, config_key: str, static_file: str, realtime_file: str) -> 'BenchmarkCase':
+    """
+    Mobilithek converters use the same URL for static and realtime data, so they get different subscription ids.
+    """
+    return BenchmarkCase(
+        source_uid=source_uid,
+        responses={r'subscriptionID=1$': static_file, r'subscriptionID=2$': realtime_file},
+        config={
+            **MOBILITHEK_CONFIG,
+            f'PARK_API_MOBILITHEK_{config_key}_STATIC_SUBSCRIPTION_ID': 1,
+            f'PARK_API_MOBILITHEK_{config_key}_REALTIME_SUBSCRIPTION_ID': 2,
+        },
+    )
+
+
+def kienzler_case(source_uid: str, config_prefix: str, file_name: str) -> 'BenchmarkCase':
+    """
+    Kienzler converters set their required config keys per instance, so the ids have to be set explicitly.
+    """
+    return BenchmarkCase(
+        source_uid=source_uid,
+        responses={'.*': file_name},
+        config={f'PARK_API_KIENZLER_{config_prefix}_IDS': 'benchmark'},
+    )
+
+
+@dataclass
+class BenchmarkCase:
+    source_uid: str
+    # Fixture files which are passed to the handle method of push converters, one call per file
+    files: list[str] = field(default_factory=list)
+    # Fixture files which are returned for requests of pull converters with URLs matching the regex
+    responses: dict[str, str] = field(default_factory=dict)
+    # Required config keys of the converter are set to dummy values, this is for everything else
+    config: dict[str, Any] = field(default_factory=dict)
+
+
+BENCHMARK_CASES: list[BenchmarkCase] = [
+    # Pull converters
+    BenchmarkCase('bahn_v2', responses={'.*': 'bahn_v2.json'}),
+    BenchmarkCase('basel', responses={'.*': 'basel.json'}),
+    BenchmarkCase('bfrk_bw_bike', responses={'.*': 'bfrk_bw_bike.json'}),
+    BenchmarkCase('bfrk_bw_car', responses={'.*': 'bfrk_bw_car.json'}),
+    BenchmarkCase('bielefeld', responses={'.*': 'bielefeld.csv'}),
+    BenchmarkCase('ellwangen_sensit', responses={'.*': 'ellwangen_sensit.json'}),
+    BenchmarkCase('freiburg_disabled_sensors', responses={'.*': 'freiburg_disabled_sensors.geojson'}),
+    BenchmarkCase('freiburg_disabled_static', responses={'.*': 'freiburg_disabled_static.geojson'}),
+    BenchmarkCase('freiburg_p_r_sensors', responses={'.*': 'freiburg_p_r_sensors.json'}),
+    BenchmarkCase('freiburg_p_r_static', responses={'.*': 'freiburg_p_r_static.json'}),
+    BenchmarkCase('freiburg_scanner', responses={'.*': 'freiburg_scanner.geojson'}),
+    BenchmarkCase('freiburg_vag_bike', responses={'.*': 'freiburg_vag_bike.geojson'}),
+    BenchmarkCase('heidelberg', responses={'.*': 'heidelberg.json'}),
+    BenchmarkCase('heidelberg_disabled', responses={'.*': 'heidelberg_disabled.geojson'}),
+    BenchmarkCase('heidelberg_easypark', responses={'.*': 'heidelberg_easypark.geojson'}),
+    BenchmarkCase(
+        'heilbronn_goldbeck',
+        responses={
+            'facilities': 'heilbronn_goldbeck_facilities.json',
+            'occupancies': 'heilbronn_goldbeck_occupancies.json',
+        },
+    ),
+    BenchmarkCase('herrenberg', responses={'.*': 'herrenberg.json'}),
+    BenchmarkCase('herrenberg_bike', responses={'.*': 'herrenberg_bike.json'}),
+    BenchmarkCase('jena', responses={'.*': 'jena.geojson'}),
+    BenchmarkCase('karlsruhe', responses={'.*': 'karlsruhe.json'}),
+    BenchmarkCase('karlsruhe_bike', responses={'.*': 'karlsruhe_bike.json'}),
+    BenchmarkCase(
+        'karlsruhe_disabled',
+        responses={'geoserver': 'karlsruhe_disabled_static.geojson', 'devices': 'karlsruhe_disabled_realtime.json'},
+        config={'PARK_API_KARLSRUHE_DISABLED_AUTH': 'benchmark'},
+    ),
+    kienzler_case('kienzler_bike_and_ride', 'BIKE_AND_RIDE', 'kienzler.json'),
+    kienzler_case('kienzler_karlruhe', 'KARLSRUHE', 'kienzler.json'),
+    kienzler_case('kienzler_neckarsulm', 'NECKARSULM', 'kienzler.json'),
+    kienzler_case('kienzler_offenburg', 'OFFENBURG', 'kienzler.json'),
+    kienzler_case('kienzler_rad_safe', 'RADSAFE', 'kienzler.json'),
+    kienzler_case('kienzler_stuttgart', 'STUTTGART', 'kienzler.json'),
+    BenchmarkCase('kienzler_ulm', responses={'.*': 'kienzler_ulm.json'}),
+    kienzler_case('kienzler_vrn', 'VRN', 'kienzler.json'),
+    kienzler_case('kienzler_vvs', 'VVS', 'kienzler_vvs.json'),
+    BenchmarkCase('konstanz', responses={'.*': 'konstanz.json'}),
+    BenchmarkCase('konstanz_bike', responses={'.*': 'konstanz_bike.geojson'}),
+    BenchmarkCase('konstanz_disabled', responses={'.*': 'konstanz_disabled.geojson'}),
+    BenchmarkCase('opendata_swiss', responses={'.*': 'opendata_swiss.json'}),
+    BenchmarkCase('radvis_bw', responses={'.*': 'radvis_bw.json'}),
+    BenchmarkCase('velobrix', responses={'.*': 'velobrix.json'}),
+    BenchmarkCase('vrn_p_r', responses={'.*': 'vrn_p_r.json'}),
+    mobilithek_case('aachen', 'AACHEN', 'aachen-static.xml', 'aachen-realtime.xml'),
+    mobilithek_case(
+        'friedrichshafen_sensors',
+        'FRIEDRICHSHAFEN_SENSORS',
+        'friedrichshafen-sensors-static.xml',
+        'friedrichshafen-sensors-realtime.xml',
+    ),
+    mobilithek_case('vrs_bondorf', 'VRS_BONDORF', 'vrs_bondorf-static.xml', 'vrs_bondorf-realtime.xml'),
+    mobilithek_case('vrs_kirchheim', 'VRS_KIRCHHEIM', 'vrs_kirchheim-static.xml', 'vrs_kirchheim-realtime.xml'),
+    mobilithek_case('vrs_neustadt', 'VRS_NEUSTADT', 'vrs_neustadt-static.xml', 'vrs_neustadt-realtime.xml'),
+    mobilithek_case('vrs_vaihingen', 'VRS_VAIHINGEN', 'vrs_vaihingen-static.xml', 'vrs_vaihingen-realtime.xml'),
+    # Push converters
+    BenchmarkCase('bb_parkhaus', files=['bb_parkhaus.xlsx']),
+    BenchmarkCase('buchen', files=['mannheim.json']),
+    BenchmarkCase('ellwangen', files=['ellwangen.xlsx']),
+    BenchmarkCase('esslingen', files=['esslingen.geojson']),
+    BenchmarkCase('friedrichshafen_easypark', files=['friedrichshafen_easypark.csv']),
+    BenchmarkCase('goldbeck', files=['goldbeck.xlsx']),
+    BenchmarkCase('huefner', files=['huefner.xlsx']),
+    BenchmarkCase('keltern', files=['keltern.xlsx']),
+    BenchmarkCase('ladenburg_parkraumcheck', files=['ladenburg_parkraumcheck.geojson']),
+    BenchmarkCase('mannheim', files=['mannheim.json']),
+    BenchmarkCase('neckarsulm', files=['neckarsulm.csv']),
+    BenchmarkCase('neckarsulm_bike', files=['neckarsulm_bike.csv']),
+    BenchmarkCase('park_raum_check_kehl', files=['park_raum_check_kehl.geojson']),
+    BenchmarkCase('park_raum_check_sachsenheim', files=['park_raum_check_sachsenheim.geojson']),
+    BenchmarkCase('pforzheim', files=['pforzheim.json']),
+    BenchmarkCase('pum_bw', files=['pum_bw.xlsx']),
+    BenchmarkCase('radolfzell', files=['radolfzell.geojson']),
+    BenchmarkCase('reutlingen', files=['reutlingen.csv']),
+    BenchmarkCase('reutlingen_bike', files=['reutlingen_bike.csv']),
+    BenchmarkCase('reutlingen_disabled', files=['reutlingen_disabled.csv']),
+    BenchmarkCase('stuttgart', files=['stuttgart-static.xml', 'stuttgart-realtime.xml']),
+    BenchmarkCase('vrs-p-r', files=['vrs_p_r.xlsx']),
+]
+
+BENCHMARK_CASES_BY_UID: dict[str, BenchmarkCase] = {case.source_uid: case for case in BENCHMARK_CASES}
+
+STATIC_GEOJSON_REASON = 'loads its static data as GeoJSON from the parkapi-static-data repository'
+
+# Registered sources without a benchmark case, with the reason why they cannot run offline on the test fixtures
+SKIPPED_SOURCES: dict[str, str] = {
+    'aalen': STATIC_GEOJSON_REASON,
+    'apcoa': 'has no fixture in the test data',
+    'bietigheim_bissingen': STATIC_GEOJSON_REASON,
+    'freiburg': STATIC_GEOJSON_REASON,
+    'p_m_bw': STATIC_GEOJSON_REASON,
+    'p_m_sensade': 'needs a login token and requests each parking lot separately',
+    'pbw': 'returns a response per city depending on the request parameters',
+    'toll_collect': 'has no static fixture in the test data',
+    'ulm': STATIC_GEOJSON_REASON,
+    'ulm_sensors': STATIC_GEOJSON_REASON,
+}
+
+
+def get_converter(case: BenchmarkCase) -> BaseConverter:
+    converter_class = ParkAPISources.converter_registry.get_converter_class(case.source_uid)
+    config = {config_key: 'benchmark' for config_key in converter_class.required_config_keys}
+    config.update(case.config)
+    return ParkAPISources(config=config, converter_uids=[case.source_uid]).converter_by_uid[case.source_uid]
+
+
+def handle_file(converter: BaseConverter, data: bytes) -> int:
+    """
+    Parses the raw data like the service which receives it would do, and passes it to the push converter.
+    """
+    if isinstance(converter, XmlConverter):
+        root = etree.fromstring(data, parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+        inputs, _ = converter.handle_xml(root)
+    elif isinstance(converter, XlsxConverter):
+        inputs, _ = converter.handle_xlsx(load_workbook(BytesIO(data)))
+    elif isinstance(converter, CsvConverter):
+        inputs, _ = converter.handle_csv_string(StringIO(data.decode('utf-8-sig')))
+    elif isinstance(converter, JsonConverter):
+        inputs, _ = converter.handle_json(json.loads(data))
+    else:
+        raise ValueError(f'{converter.source_info.uid} is no supported push converter.')
+    return len(inputs)
+
+
+def fetch(converter: BaseConverter) -> int:
+    record_count = 0
+    if isinstance(converter, ParkingSitePullConverter):
+        static_inputs, realtime_inputs, _ = converter.get_parking_sites()
+        record_count += len(static_inputs) + len(realtime_inputs)
+    if isinstance(converter, ParkingSpotPullConverter):
+        static_inputs, realtime_inputs, _ = converter.get_parking_spots()
+        record_count += len(static_inputs) + len(realtime_inputs)
+    return record_count
+
+
+def get_peak_rss() -> int:
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def run_case(source_uid: str, rounds: int, warmup_rounds: int) -> dict[str, Any]:
+    """
+    Runs in its own process, so peak RSS is measured per source.
+    """
+    case = BENCHMARK_CASES_BY_UID[source_uid]
+    converter = get_converter(case)
+
+    with Mocker() as requests_mock:
+        for url_regex, file_name in case.responses.items():
+            requests_mock.register_uri(
+                ANY,
+                re.compile(url_regex),
+                content=Path(DATA_PATH, file_name).read_bytes(),
+            )
+
+        if case.files:
+            file_datas = [Path(DATA_PATH, file_name).read_bytes() for file_name in case.files]
+            run: Callable[[], int] = lambda: sum(handle_file(converter, data) for data in file_datas)  # noqa: E731
+        else:
+            run = lambda: fetch(converter)  # noqa: E731
+
+        for _ in range(warmup_rounds):
+            run()
+
+        durations: list[float] = []
+        gc_collections: list[int] = []
+        record_count = 0
+        for _ in range(rounds):
+            gc.collect()
+            collections_before = sum(stats['collections'] for stats in gc.get_stats())
+            start = perf_counter()
+            record_count = run()
+            durations.append(perf_counter() - start)
+            gc_collections.append(sum(stats['collections'] for stats in gc.get_stats()) - collections_before)
+
+        # Tracing slows down everything a lot, so allocations are measured in a separate round
+        gc.collect()
+        allocated_blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        run()
+        _, peak_traced_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocated_blocks = sys.getallocatedblocks() - allocated_blocks_before
+
+    best_duration = min(durations)
+    return {
+        'source_uid': source_uid,
+        'records': record_count,
+        'wall_time': best_duration,
+        'mean_wall_time': mean(durations),
+        'records_per_second': record_count / best_duration if best_duration > 0 else None,
+        'peak_rss_bytes': get_peak_rss(),
+        'peak_traced_bytes': peak_traced_bytes,
+        'allocated_blocks': allocated_blocks,
+        'gc_collections': mean(gc_collections),
+    }
+
+
+def run_isolated(source_uid: str, rounds: int, warmup_rounds: int) -> dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        try:
+            return executor.submit(run_case, source_uid, rounds, warmup_rounds).result()
+        except Exception as e:
+            return {'source_uid': source_uid, 'error': repr(e)}
+
+
+def get_regressions(results: list[dict], baseline_path: Path, max_slowdown: float) -> list[str]:
+    baseline_results_by_uid: dict[str, dict] = {
+        result['source_uid']: result for result in json.loads(baseline_path.read_text())['results']
+    }
+    regressions: list[str] = []
+    for result in results:
+        baseline_result = baseline_results_by_uid.get(result['source_uid'])
+        if baseline_result is None or 'error' in baseline_result:
+            continue
+        if 'error' in result:
+            regressions.append(f'{result["source_uid"]}: failed with {result["error"]}')
+            continue
+        slowdown = result['wall_time'] / baseline_result['wall_time']
+        if slowdown > max_slowdown:
+            regressions.append(f'{result["source_uid"]}: {slowdown:.2f}x slower than baseline')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='ParkAPI-Sources converter benchmark',
+        description='Measures converter throughput on the test fixtures with mocked HTTP requests, each source in its '
+        'own process.',
+    )
+    parser.add_argument('-s', '--source', dest='sources', nargs='+', help='Limit to specific sources.')
+    parser.add_argument('-r', '--rounds', type=int, default=5, help='Measured rounds per source.')
+    parser.add_argument('-w', '--warmup-rounds', dest='warmup_rounds', type=int, default=1)
+    parser.add_argument('-o', '--output', dest='output_file', help='Write results as JSON to this file.')
+    parser.add_argument('-b', '--baseline', dest='baseline_file', help='JSON results of an earlier run to compare.')
+    parser.add_argument(
+        '--max-slowdown',
+        dest='max_slowdown',
+        type=float,
+        default=1.25,
+        help='Exit with status 1 if a source got slower than this factor compared to the baseline.',
+    )
+    args = parser.parse_args()
+
+    registered_source_uids: list[str] = sorted(ParkAPISources.converter_registry.uids)
+    for source_uid in registered_source_uids:
+        if source_uid not in BENCHMARK_CASES_BY_UID and source_uid not in SKIPPED_SOURCES:
+            sys.exit(f'Error: {source_uid} has neither a benchmark case nor a reason to skip it.')
+
+    source_uids: list[str] = args.sources or registered_source_uids
+    for source_uid in source_uids:
+        if source_uid in SKIPPED_SOURCES:
+            print(f'Skipping {source_uid}: {SKIPPED_SOURCES[source_uid]}', file=sys.stderr)
+        elif source_uid not in BENCHMARK_CASES_BY_UID:
+            sys.exit(f'Error: there is no benchmark case for {source_uid}.')
+    source_uids = [source_uid for source_uid in source_uids if source_uid not in SKIPPED_SOURCES]
+
+    results: list[dict[str, Any]] = []
+    print(
+        f'{"source":<28} {"records":>8} {"wall ms":>9} {"records/s":>11} {"peak RSS MB":>12} {"traced MB":>10} '
+        f'{"blocks":>9} {"gc":>6}',
+    )
+    for source_uid in source_uids:
+        result = run_isolated(source_uid, args.rounds, args.warmup_rounds)
+        results.append(result)
+        if 'error' in result:
+            print(f'{source_uid:<28} error: {result["error"]}')
+            continue
+        print(
+            f'{source_uid:<28} {result["records"]:>8} {result["wall_time"] * 1000:>9.2f} '
+            f'{result["records_per_second"] or 0:>11.0f} {result["peak_rss_bytes"] / 1024**2:>12.1f} '
+            f'{result["peak_traced_bytes"] / 1024**2:>10.1f} {result["allocated_blocks"]:>9} '
+            f'{result["gc_collections"]:>6.0f}',
+        )
+
+    if args.output_file is not None:
+        try:
+            package_version: Optional[str] = version('parkapi_sources')
+        except PackageNotFoundError:
+            package_version = None
+        output = {
+            'created_at': datetime.now(tz=timezone.utc).isoformat(),
+            'package_version': package_version,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'rounds': args.rounds,
+            'warmup_rounds': args.warmup_rounds,
+            'results': results,
+        }
+        Path(args.output_file).write_text(json.dumps(output, indent=2))
+
+    if args.baseline_file is not None:
+        regressions = get_regressions(results, Path(args.baseline_file), args.max_slowdown)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
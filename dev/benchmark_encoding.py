@@ -0,0 +1,153 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+# ruff: noqa: T201
+
+import argparse
+import cProfile
+import json
+import pstats
+import re
+import sys
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from io import BytesIO, StringIO
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+import shapely
+from isodate import Duration, duration_isoformat
+from lxml import etree
+from openpyxl.reader.excel import load_workbook
+from requests_mock import ANY, Mocker
+from shapely.geometry.base import BaseGeometry
+
+sys.path.append(str(Path(Path(__file__).parent.parent, 'src')))  # noqa: E402
+sys.path.append(str(Path(__file__).parent))  # noqa: E402
+
+from benchmark_converters import BENCHMARK_CASES, DATA_PATH, BenchmarkCase, get_converter
+
+from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter, ParkingSpotPullConverter
+from parkapi_sources.converters.base_converter.push import CsvConverter, JsonConverter, XlsxConverter, XmlConverter
+from parkapi_sources.util import DefaultJSONEncoder, to_serializable_dict
+
+
+def legacy_convert_to_serializable_value(obj: Any) -> Any:
+    """
+    The isinstance chain DefaultJSONEncoder used before the per-class handlers, kept as reference.
+    """
+    if isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, timedelta) or isinstance(obj, Duration):
+        return duration_isoformat(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, BaseGeometry):
+        return shapely.geometry.mapping(obj)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
+
+class LegacyJSONEncoder(json.JSONEncoder):
+    def default(self, obj: Any):
+        return legacy_convert_to_serializable_value(obj)
+
+
+def get_inputs(case: BenchmarkCase) -> list:
+    converter = get_converter(case)
+    inputs: list = []
+    with Mocker() as requests_mock:
+        for url_regex, file_name in case.responses.items():
+            requests_mock.register_uri(ANY, re.compile(url_regex), content=Path(DATA_PATH, file_name).read_bytes())
+
+        if isinstance(converter, ParkingSitePullConverter):
+            static_inputs, realtime_inputs, _ = converter.get_parking_sites()
+            inputs += static_inputs + realtime_inputs
+        if isinstance(converter, ParkingSpotPullConverter):
+            static_inputs, realtime_inputs, _ = converter.get_parking_spots()
+            inputs += static_inputs + realtime_inputs
+
+    for file_name in case.files:
+        data = Path(DATA_PATH, file_name).read_bytes()
+        if isinstance(converter, XmlConverter):
+            root = etree.fromstring(data, parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+            file_inputs, _ = converter.handle_xml(root)
+        elif isinstance(converter, XlsxConverter):
+            file_inputs, _ = converter.handle_xlsx(load_workbook(BytesIO(data)))
+        elif isinstance(converter, CsvConverter):
+            file_inputs, _ = converter.handle_csv_string(StringIO(data.decode('utf-8-sig')))
+        elif isinstance(converter, JsonConverter):
+            file_inputs, _ = converter.handle_json(json.loads(data))
+        else:
+            raise ValueError(f'{case.source_uid} is no supported push converter.')
+        inputs += file_inputs
+
+    return inputs
+
+
+def legacy_encode(inputs: list) -> str:
+    return json.dumps([item.to_dict() for item in inputs], cls=LegacyJSONEncoder)
+
+
+def encode(inputs: list) -> str:
+    return json.dumps([to_serializable_dict(item) for item in inputs], cls=DefaultJSONEncoder)
+
+
+def measure(run: Callable[[], str], rounds: int) -> float:
+    durations: list[float] = []
+    for _ in range(rounds):
+        start = perf_counter()
+        run()
+        durations.append(perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='ParkAPI-Sources encoding benchmark',
+        description='Compares JSON encoding of the inputs of all benchmark fixtures with the former isinstance chain.',
+    )
+    parser.add_argument('-r', '--rounds', type=int, default=5, help='Measured rounds per encoder.')
+    parser.add_argument('-p', '--profile', action='store_true', help='Print the top entries of a profile per encoder.')
+    args = parser.parse_args()
+
+    inputs: list = []
+    for case in BENCHMARK_CASES:
+        inputs += get_inputs(case)
+
+    # Both encoders have to create exactly the same output
+    if legacy_encode(inputs) != encode(inputs):
+        sys.exit('Error: encoders create different output.')
+
+    legacy_duration = measure(lambda: legacy_encode(inputs), args.rounds)
+    duration = measure(lambda: encode(inputs), args.rounds)
+
+    print(f'{len(inputs)} inputs from {len(BENCHMARK_CASES)} sources')
+    print(f'{"encoder":<12} {"wall ms":>9} {"inputs/s":>11}')
+    for name, encoder_duration in (('isinstance', legacy_duration), ('dispatch', duration)):
+        print(f'{name:<12} {encoder_duration * 1000:>9.2f} {len(inputs) / encoder_duration:>11.0f}')
+    print(f'speedup: {legacy_duration / duration:.2f}x')
+
+    if args.profile:
+        for name, run in (('isinstance', legacy_encode), ('dispatch', encode)):
+            print(f'\n{name}:')
+            profile = cProfile.Profile()
+            profile.runcall(run, inputs)
+            pstats.Stats(profile).sort_stats('tottime').print_stats(8)
+
+
+if __name__ == '__main__':
+    main()
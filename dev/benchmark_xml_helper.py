@@ -0,0 +1,172 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+# ruff: noqa: T201
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional
+
+from lxml import etree
+
+sys.path.append(str(Path(Path(__file__).parent.parent, 'src')))  # noqa: E402
+
+from parkapi_sources.converters.base_converter.datex2 import (
+    InterUrbanParkingSiteMixin,
+    ParkingFacilityMixin,
+    ParkingRecordStatusMixin,
+    UrbanParkingSiteMixin,
+)
+from parkapi_sources.converters.stuttgart.converter import StuttgartPushConverter
+from parkapi_sources.util import XMLToDictConverter
+
+DEFAULT_DATA_PATH = Path(Path(__file__).parent.parent, 'tests', 'converters', 'data')
+
+
+def legacy_xml_to_dict(
+    tag: etree.Element,
+    ensure_array_keys: Optional[list[tuple[str, str]]] = None,
+    remote_type_tags: Optional[list[str]] = None,
+    conditional_remote_type_tags: Optional[list[tuple[str, str]]] = None,
+    ignore_attributes: Optional[list[str]] = None,
+) -> dict:
+    """
+    The recursive implementation XMLHelper.xml_to_dict used before XMLToDictConverter, kept as reference.
+    """
+    if ensure_array_keys is None:
+        ensure_array_keys = []
+    if remote_type_tags is None:
+        remote_type_tags = []
+    if conditional_remote_type_tags is None:
+        conditional_remote_type_tags = []
+    if ignore_attributes is None:
+        ignore_attributes = []
+
+    tag_name = etree.QName(tag).localname
+
+    ignore_all_attribs: bool = False
+    if tag.attrib:
+        ignore_all_attribs = True
+        for key in tag.attrib.keys():
+            if key not in ignore_attributes:
+                ignore_all_attribs = False
+
+    tag_dict = {tag_name: {} if (tag.attrib and not ignore_all_attribs) else None}
+    children = list(tag)
+    if children:
+        aggregated_child_dict = defaultdict(list)
+        for child in children:
+            child_dict = legacy_xml_to_dict(
+                child,
+                ensure_array_keys,
+                remote_type_tags,
+                conditional_remote_type_tags,
+                ignore_attributes,
+            )
+            for key, value in child_dict.items():
+                aggregated_child_dict[key].append(value)
+        tag_dict = {tag_name: {}}
+        for key, value in aggregated_child_dict.items():
+            if key == 'class':
+                key = 'class_'
+            if len(value) == 1 and (tag_name, key) not in ensure_array_keys:
+                value = value[0]
+            tag_dict[tag_name][key] = value
+
+    if tag.attrib and not ignore_all_attribs:
+        for key, value in tag.attrib.items():
+            if key not in ignore_attributes:
+                tag_dict[tag_name][key.replace('{http://www.w3.org/2001/XMLSchema-instance}', '')] = value
+
+    if tag.text:
+        text = tag.text.strip()
+        if children or (tag.attrib and not ignore_all_attribs):
+            if text:
+                tag_dict[tag_name]['_text'] = text
+        else:
+            tag_dict[tag_name] = text
+
+    if isinstance(tag_dict[tag_name], dict):
+        tag_items: list[tuple[str, str]] = [(key, value) for key, value in tag_dict[tag_name].items()]  # noqa: C416
+        if len(tag_items) == 1:
+            child_key = tag_items[0][0]
+            child_value = tag_items[0][1]
+            if child_key in remote_type_tags or (tag_name, child_key) in conditional_remote_type_tags:
+                tag_dict[tag_name] = child_value
+
+    if isinstance(tag_dict[tag_name], dict) and tag_name in remote_type_tags:
+        tag_dict = tag_dict[tag_name]
+
+    return tag_dict
+
+
+def get_merged_xml_to_dict_kwargs() -> dict:
+    """
+    Merges the options of all DATEX II mixins, so every fixture exercises all option types.
+    """
+    merged_kwargs: dict[str, list] = defaultdict(list)
+    for xml_to_dict_kwargs in [
+        UrbanParkingSiteMixin.static_xml_to_dict_kwargs,
+        InterUrbanParkingSiteMixin.static_xml_to_dict_kwargs,
+        ParkingFacilityMixin.static_xml_to_dict_kwargs,
+        ParkingRecordStatusMixin.realtime_xml_to_dict_kwargs,
+        StuttgartPushConverter.realtime_xml_to_dict_kwargs,
+    ]:
+        for key, values in xml_to_dict_kwargs.items():
+            merged_kwargs[key] += [value for value in values if value not in merged_kwargs[key]]
+    return dict(merged_kwargs)
+
+
+def measure(function: Callable[[], dict], rounds: int) -> float:
+    start = perf_counter()
+    for _ in range(rounds):
+        function()
+    return (perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='ParkAPI-Sources XML benchmark',
+        description='Compares XMLToDictConverter with the legacy recursive xml_to_dict on DATEX II fixtures',
+    )
+    parser.add_argument('data_path', nargs='?', default=str(DEFAULT_DATA_PATH))
+    parser.add_argument('-r', '--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    xml_to_dict_kwargs = get_merged_xml_to_dict_kwargs()
+    xml_to_dict_converter = XMLToDictConverter(**xml_to_dict_kwargs)
+
+    total_legacy_duration = 0.0
+    total_compiled_duration = 0.0
+    print(f'{"file":<45} {"legacy ms":>10} {"compiled ms":>12} {"speedup":>8}')
+    for file_path in sorted(Path(args.data_path).glob('*.xml')):
+        root = etree.parse(file_path, parser=etree.XMLParser(resolve_entities=False)).getroot()
+        if 'datex' not in (etree.QName(root).namespace or '').lower():
+            continue
+
+        if legacy_xml_to_dict(root, **xml_to_dict_kwargs) != xml_to_dict_converter.convert(root):
+            print(f'{file_path.name}: results differ', file=sys.stderr)
+            sys.exit(1)
+
+        legacy_duration = measure(lambda: legacy_xml_to_dict(root, **xml_to_dict_kwargs), args.rounds)
+        compiled_duration = measure(lambda: xml_to_dict_converter.convert(root), args.rounds)
+        total_legacy_duration += legacy_duration
+        total_compiled_duration += compiled_duration
+        print(
+            f'{file_path.name:<45} {legacy_duration * 1000:>10.2f} {compiled_duration * 1000:>12.2f} '
+            f'{legacy_duration / compiled_duration:>7.2f}x',
+        )
+
+    print(
+        f'{"total":<45} {total_legacy_duration * 1000:>10.2f} {total_compiled_duration * 1000:>12.2f} '
+        f'{total_legacy_duration / total_compiled_duration:>7.2f}x',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -3,4 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from .batch_runner import BatchRunner, SourceResult
 from .parkapi_sources import ParkAPISources
+from .realtime_delta import RealtimeChange, RealtimeChangeType, RealtimeDeltaTracker
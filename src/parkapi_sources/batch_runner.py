@@ -0,0 +1,425 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from itertools import count
+from math import inf
+from multiprocessing import get_context
+from multiprocessing.queues import SimpleQueue
+from queue import Empty, Queue
+from threading import Thread
+from time import monotonic
+from typing import Iterator, Optional
+
+from .converters.base_converter.pull import ParkingSitePullConverter, ParkingSpotPullConverter, PullConverter
+from .exceptions import ImportException, ImportParkingSiteException, ImportParkingSpotException, ImportSourceException
+from .models import (
+    RealtimeParkingSiteInput,
+    RealtimeParkingSpotInput,
+    SourceInfo,
+    StaticParkingSiteInput,
+    StaticParkingSpotInput,
+)
+from .realtime_delta import RealtimeChange, RealtimeDeltaTracker
+from .util import ConfigHelper, ExceptionState, RequestHelper, get_exception_state, restore_exception
+
+
+@dataclass
+class SourceResult:
+    source_info: SourceInfo
+    static_parking_site_inputs: list[StaticParkingSiteInput] = field(default_factory=list)
+    realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = field(default_factory=list)
+    static_parking_spot_inputs: list[StaticParkingSpotInput] = field(default_factory=list)
+    realtime_parking_spot_inputs: list[RealtimeParkingSpotInput] = field(default_factory=list)
+    # Contains the per-dataset exceptions as well as an ImportException which aborted the whole source
+    import_exceptions: list[ImportException] = field(default_factory=list)
+    # Unexpected exceptions are not converted to ImportExceptions, so they can be handled by the caller
+    exception: Optional[Exception] = None
+    timed_out: bool = False
+    # True if an ImportException aborted the source run, so the inputs are incomplete or empty
+    aborted: bool = False
+    duration: float = 0.0
+    # True if all static results came from the static result cache, so consumers can skip their own diffing
+    static_data_unchanged: bool = False
+    # Just set if the batch runner got a realtime delta tracker and the source run was complete
+    realtime_parking_site_changes: list[RealtimeChange] = field(default_factory=list)
+    realtime_parking_spot_changes: list[RealtimeChange] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return self.exception is None and not self.timed_out
+
+
+class BatchRunner:
+    """
+    Runs pull converters concurrently in threads. As converters spend most of their time waiting for upstream
+    responses, threads are sufficient to overlap their latencies.
+
+    If `source_timeout` is set, each source gets a wall-clock budget in seconds. A source exceeding it is reported as
+    timed out and its worker slot is given to the next source. Python threads cannot be killed, so the timed out
+    converter keeps running in the background until its own HTTP timeouts hit, and its late result is discarded.
+
+    If `realtime_delta_tracker` is set, realtime changes since the last complete run of each source are added to the
+    results. Sources which failed, timed out or were aborted by an ImportException keep their previous state.
+
+    If the converters have a metrics hook, the run time, record counts and error counts of each source are reported to
+    it, too.
+
+    If `use_processes` is set, sources run in up to `parallel` worker processes instead of threads, so CPU-bound static
+    imports use multiple cores. Each worker builds its own converter from the converter class and its config, so
+    converters have to be importable, and converter state like metrics hooks or HTTP sessions stays in the worker.
+    Timed out workers are not killed either, they just don't get new sources until they are done. Therefore, the time
+    budget of a source starts when a worker picks it up, so sources waiting for a free worker don't time out. The worker
+    pool is created at the first run and reused by later runs, so `close()` has to be called, or the batch runner has to
+    be used as context manager, in order to shut it down.
+    """
+
+    parallel: int
+    source_timeout: Optional[float]
+    include_parking_spots: bool
+    realtime_delta_tracker: Optional[RealtimeDeltaTracker]
+    use_processes: bool
+    _executor: Optional[ProcessPoolExecutor] = None
+    # Worker processes put the job id of each source they start here
+    _start_queue: Optional[SimpleQueue] = None
+    # Source uid and result queue of each submitted job, so start events get to the run the job belongs to
+    _jobs_by_id: dict[int, tuple[str, Queue]]
+    _job_ids: Iterator[int]
+
+    def __init__(
+        self,
+        parallel: int = 1,
+        source_timeout: Optional[float] = None,
+        include_parking_spots: bool = True,
+        realtime_delta_tracker: Optional[RealtimeDeltaTracker] = None,
+        use_processes: bool = False,
+    ):
+        if parallel < 1:
+            raise ValueError('parallel has to be at least 1.')
+        self.parallel = parallel
+        self.source_timeout = source_timeout
+        self.include_parking_spots = include_parking_spots
+        self.realtime_delta_tracker = realtime_delta_tracker
+        self.use_processes = use_processes
+        self._jobs_by_id = {}
+        self._job_ids = count()
+
+    def run(self, converters: list[PullConverter]) -> dict[str, SourceResult]:
+        # Pre-fill the result dict, so results keep the order of the given converters
+        results: dict[str, Optional[SourceResult]] = {converter.source_info.uid: None for converter in converters}
+        for result in self.iter_run(converters):
+            results[result.source_info.uid] = result
+
+        return results  # type: ignore
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+
+        # Timed out sources might still be running, so the worker processes are not waited for
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        # Stops the thread forwarding start events
+        self._start_queue.put(None)
+        self._start_queue = None
+
+    def __enter__(self) -> 'BatchRunner':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def iter_run(self, converters: list[PullConverter], ordered: bool = False) -> Iterator[SourceResult]:
+        """
+        Yields the result of each source as soon as it is done or timed out, so consumers can handle sources one after
+        another without keeping all results. Results are yielded in the order they are done, or in the order of the given
+        converters if `ordered` is set. Then, results of sources which are done early are kept until all sources before
+        them are done.
+        """
+        # Contains the result and whether the source run was complete, or the uid of a source a worker process started
+        result_queue: Queue[tuple[SourceResult, bool] | str] = Queue()
+        pending_converters: deque[PullConverter] = deque(converters)
+        running: dict[str, tuple[SourceInfo, float]] = {}
+        futures: list[Future] = []
+
+        try:
+            results = self._iter_run_loop(pending_converters, running, result_queue, futures)
+            yield from self._iter_in_order(converters, results) if ordered else results
+        finally:
+            # The worker pool is kept for the next run, so sources of this run which did not start yet are cancelled
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def _iter_in_order(converters: list[PullConverter], results: Iterator[SourceResult]) -> Iterator[SourceResult]:
+        # Reorder buffer keyed by converter index, which yields results as soon as all results before them were yielded
+        index_by_uid: dict[str, int] = {converter.source_info.uid: index for index, converter in enumerate(converters)}
+        waiting_results: dict[int, SourceResult] = {}
+        next_index = 0
+        for result in results:
+            waiting_results[index_by_uid[result.source_info.uid]] = result
+            while next_index in waiting_results:
+                yield waiting_results.pop(next_index)
+                next_index += 1
+
+    def _iter_run_loop(
+        self,
+        pending_converters: deque[PullConverter],
+        running: dict[str, tuple[SourceInfo, float]],
+        result_queue: Queue,
+        futures: list[Future],
+    ) -> Iterator[SourceResult]:
+        while pending_converters or running:
+            while pending_converters and len(running) < self.parallel:
+                converter = pending_converters.popleft()
+                if self.use_processes:
+                    # Sources can wait for a free worker process, so the deadline is set as soon as the worker starts
+                    running[converter.source_info.uid] = (converter.source_info, inf)
+                    futures.append(self._submit_converter(converter, result_queue))
+                else:
+                    deadline = inf if self.source_timeout is None else monotonic() + self.source_timeout
+                    running[converter.source_info.uid] = (converter.source_info, deadline)
+                    Thread(target=self._run_converter, args=(converter, result_queue), daemon=True).start()
+
+            next_deadline = min(deadline for _, deadline in running.values())
+            queued_items: list[tuple[SourceResult, bool] | str] = []
+            try:
+                queued_items.append(
+                    result_queue.get(timeout=None if next_deadline == inf else max(next_deadline - monotonic(), 0)),
+                )
+                # Consumers can take a while per yielded result, so results which arrived meanwhile are taken before
+                # deadlines are checked
+                while True:
+                    queued_items.append(result_queue.get_nowait())
+            except Empty:
+                pass
+
+            for queued_item in queued_items:
+                if isinstance(queued_item, str):
+                    if queued_item in running and self.source_timeout is not None:
+                        running[queued_item] = (running[queued_item][0], monotonic() + self.source_timeout)
+                    continue
+
+                result, complete = queued_item
+                # Results of timed out sources arrive late and are discarded, so they must not change the delta state
+                if result.source_info.uid not in running:
+                    continue
+                del running[result.source_info.uid]
+                if complete:
+                    self._add_realtime_changes(result)
+                yield result
+
+            now = monotonic()
+            for source_uid, (source_info, deadline) in list(running.items()):
+                if deadline > now:
+                    continue
+                del running[source_uid]
+                yield SourceResult(
+                    source_info=source_info,
+                    import_exceptions=[
+                        ImportSourceException(
+                            source_uid=source_uid,
+                            message=f'Source exceeded its time budget of {self.source_timeout} seconds.',
+                        ),
+                    ],
+                    timed_out=True,
+                    duration=self.source_timeout,
+                )
+
+    def _run_converter(self, converter: PullConverter, result_queue: Queue) -> None:
+        result_queue.put(self._run_source(converter))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process with running threads can deadlock, so workers are spawned
+            mp_context = get_context('spawn')
+            self._start_queue = mp_context.SimpleQueue()
+            Thread(target=self._forward_start_events, args=(self._start_queue,), daemon=True).start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.parallel,
+                mp_context=mp_context,
+                initializer=_init_worker_process,
+                initargs=(self._start_queue,),
+            )
+        return self._executor
+
+    def _forward_start_events(self, start_queue: SimpleQueue) -> None:
+        while (job_id := start_queue.get()) is not None:
+            # Jobs which are done already or belong to a closed pool are not known anymore
+            job = self._jobs_by_id.pop(job_id, None)
+            if job is not None:
+                source_uid, result_queue = job
+                result_queue.put(source_uid)
+
+    def _submit_converter(self, converter: PullConverter, result_queue: Queue) -> Future:
+        job_id = next(self._job_ids)
+        self._jobs_by_id[job_id] = (converter.source_info.uid, result_queue)
+        submit_args = (
+            _run_converter_in_process,
+            job_id,
+            type(converter),
+            converter.config_helper,
+            self.include_parking_spots,
+        )
+        try:
+            future = self._get_executor().submit(*submit_args)
+        except BrokenProcessPool:
+            # A crashed worker process breaks the whole pool, so it's replaced by a new one
+            self.close()
+            future = self._get_executor().submit(*submit_args)
+        future.add_done_callback(
+            lambda done_future: self._handle_process_result(converter, job_id, done_future, result_queue),
+        )
+        return future
+
+    def _handle_process_result(
+        self, converter: PullConverter, job_id: int, future: Future, result_queue: Queue
+    ) -> None:
+        self._jobs_by_id.pop(job_id, None)
+        try:
+            result, complete, import_exception_states, exception_state = future.result()
+            result.import_exceptions = [restore_exception(state) for state in import_exception_states]
+            result.exception = None if exception_state is None else restore_exception(exception_state)
+        except Exception as e:
+            # Pickling errors or crashed worker processes just affect this source
+            result = SourceResult(source_info=converter.source_info, exception=e)
+            complete = False
+
+        # The converter in the worker process has no metrics hook, so metrics are reported here
+        self._add_metrics(converter, result)
+        result_queue.put((result, complete))
+
+    def _run_source(self, converter: PullConverter) -> tuple[SourceResult, bool]:
+        result = SourceResult(source_info=converter.source_info)
+        start = monotonic()
+        complete = False
+        try:
+            self._fetch(converter, result)
+            complete = True
+        except ImportException as e:
+            result.import_exceptions.append(e)
+            result.aborted = True
+        except Exception as e:
+            result.exception = e
+        result.duration = monotonic() - start
+        self._add_metrics(converter, result)
+
+        return result, complete
+
+    @staticmethod
+    def _add_metrics(converter: PullConverter, result: SourceResult) -> None:
+        metrics_hook = converter.metrics_hook
+        if metrics_hook is None:
+            return
+
+        source_uid = converter.source_info.uid
+        metrics_hook.observe_duration(source_uid, 'run', result.duration)
+        metrics_hook.increment(
+            source_uid,
+            'records',
+            len(result.static_parking_site_inputs)
+            + len(result.realtime_parking_site_inputs)
+            + len(result.static_parking_spot_inputs)
+            + len(result.realtime_parking_spot_inputs),
+        )
+        metrics_hook.increment(
+            source_uid,
+            'errors',
+            len(result.import_exceptions) + (0 if result.exception is None else 1),
+        )
+
+    def _add_realtime_changes(self, result: SourceResult) -> None:
+        if self.realtime_delta_tracker is None:
+            return
+
+        # Datasets which failed validation keep their previous state, and exceptions without uid keep all of them
+        failed_parking_site_uids: list[Optional[str]] = [
+            import_exception.parking_site_uid
+            for import_exception in result.import_exceptions
+            if isinstance(import_exception, ImportParkingSiteException)
+        ]
+        result.realtime_parking_site_changes = self.realtime_delta_tracker.get_parking_site_changes(
+            result.source_info.uid,
+            result.realtime_parking_site_inputs,
+            failed_uids={str(uid) for uid in failed_parking_site_uids if uid is not None},
+            keep_missing=None in failed_parking_site_uids,
+        )
+        if self.include_parking_spots:
+            failed_parking_spot_uids: list[Optional[str]] = [
+                import_exception.parking_spot_uid
+                for import_exception in result.import_exceptions
+                if isinstance(import_exception, ImportParkingSpotException)
+            ]
+            result.realtime_parking_spot_changes = self.realtime_delta_tracker.get_parking_spot_changes(
+                result.source_info.uid,
+                result.realtime_parking_spot_inputs,
+                failed_uids={str(uid) for uid in failed_parking_spot_uids if uid is not None},
+                keep_missing=None in failed_parking_spot_uids,
+            )
+
+    def _fetch(self, converter: PullConverter, result: SourceResult) -> None:
+        static_data_unchanged: list[bool] = []
+
+        # The combined methods fetch upstream data just once for converters which get static and realtime data from
+        # the same endpoint
+        if isinstance(converter, ParkingSitePullConverter):
+            converter.static_data_unchanged = False
+            (
+                result.static_parking_site_inputs,
+                result.realtime_parking_site_inputs,
+                import_exceptions,
+            ) = converter.get_parking_sites()
+            static_data_unchanged.append(converter.static_data_unchanged)
+            result.import_exceptions += import_exceptions
+
+        if self.include_parking_spots and isinstance(converter, ParkingSpotPullConverter):
+            converter.static_data_unchanged = False
+            (
+                result.static_parking_spot_inputs,
+                result.realtime_parking_spot_inputs,
+                import_exceptions,
+            ) = converter.get_parking_spots()
+            static_data_unchanged.append(converter.static_data_unchanged)
+            result.import_exceptions += import_exceptions
+
+        result.static_data_unchanged = len(static_data_unchanged) > 0 and all(static_data_unchanged)
+        result.import_exceptions += converter.pop_static_patch_exceptions()
+
+
+# Set in worker processes of the batch runner by _init_worker_process()
+_worker_start_queue: Optional[SimpleQueue] = None
+
+
+def _init_worker_process(start_queue: SimpleQueue) -> None:
+    # Queues cannot be pickled as job arguments, so they are passed to the worker processes when they are started
+    global _worker_start_queue
+    _worker_start_queue = start_queue
+
+
+def _run_converter_in_process(
+    job_id: int,
+    converter_class: type[PullConverter],
+    config_helper: ConfigHelper,
+    include_parking_spots: bool,
+) -> tuple[SourceResult, bool, list[ExceptionState], Optional[ExceptionState]]:
+    """
+    Runs a source in a worker process of the batch runner. Exceptions are returned as state, because ImportExceptions
+    cannot be pickled directly.
+    """
+    if _worker_start_queue is not None:
+        _worker_start_queue.put(job_id)
+
+    converter = converter_class(config_helper=config_helper, request_helper=RequestHelper(config_helper=config_helper))
+    result, complete = BatchRunner(include_parking_spots=include_parking_spots)._run_source(converter)
+
+    return (
+        replace(result, import_exceptions=[], exception=None),
+        complete,
+        [get_exception_state(import_exception) for import_exception in result.import_exceptions],
+        None if result.exception is None else get_exception_state(result.exception),
+    )
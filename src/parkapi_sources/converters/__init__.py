@@ -3,77 +3,103 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from .aachen import AachenPullConverter
-from .aalen import AalenPullConverter
-from .apcoa import ApcoaPullConverter
-from .bahn_v2 import BahnV2PullConverter
+from typing import TYPE_CHECKING
+
 from .base_converter import BaseConverter
-from .basel import BaselPullConverter
-from .bb_parkhaus import BBParkhausPushConverter
-from .bfrk_bw import BfrkBwBikePushConverter, BfrkBwCarPullConverter
-from .bielefeld import BielefeldPullConverter
-from .bietigheim_bissingen import BietigheimBissingenPullConverter
-from .ellwangen import EllwangenPushConverter
-from .ellwangen_sensit import EllwangenSensitPullConverter
-from .esslingen import EsslingenPushConverter
-from .freiburg import (
-    FreiburgParkAndRideRealtimePullConverter,
-    FreiburgParkAndRideStaticPullConverter,
-    FreiburgPullConverter,
-)
-from .freiburg_disabled_sensors import FreiburgDisabledSensorsPullConverter
-from .freiburg_disabled_static import FreiburgDisabledStaticPullConverter
-from .freiburg_scanner import FreiburgScannerPullConverter
-from .freiburg_vag_bike import FreiburgVAGBikePullConverter
-from .friedrichshafen_easypark import FriedrichshafenEasyParkPushConverter
-from .friedrichshafen_sensors import FriedrichshafenSensorsPullConverter
-from .goldbeck import GoldbeckPushConverter
-from .heidelberg import HeidelbergPullConverter
-from .heidelberg_disabled import HeidelbergDisabledPullConverter
-from .heidelberg_easypark import HeidelbergEasyParkPullConverter
-from .heilbronn_goldbeck import HeilbronnGoldbeckPullConverter
-from .herrenberg import HerrenbergPullConverter
-from .herrenberg_bike import HerrenbergBikePullConverter
-from .huefner import HuefnerPushConverter
-from .jena import JenaPullConverter
-from .karlsruhe import KarlsruheBikePullConverter, KarlsruhePullConverter
-from .karlsruhe_disabled import KarlsruheDisabledPullConverter
-from .keltern import KelternPushConverter
-from .kienzler import (
-    KienzlerBikeAndRidePullConverter,
-    KienzlerKarlsruhePullConverter,
-    KienzlerNeckarsulmPullConverter,
-    KienzlerOffenburgPullConverter,
-    KienzlerRadSafePullConverter,
-    KienzlerStuttgartPullConverter,
-    KienzlerUlmPullConverter,
-    KienzlerVrnPullConverter,
-    KienzlerVVSPullConverter,
-)
-from .konstanz import KonstanzPullConverter
-from .konstanz_bike import KonstanzBikePullConverter
-from .konstanz_disabled import KonstanzDisabledPullConverter
-from .ladenburg_parkraumcheck import LadenburgParkraumcheckPushConverter
-from .mannheim_buchen import BuchenPushConverter, MannheimPushConverter
-from .neckarsulm import NeckarsulmPushConverter
-from .neckarsulm_bike import NeckarsulmBikePushConverter
-from .opendata_swiss import OpenDataSwissPullConverter
-from .p_m_bw import PMBWPullConverter
-from .p_m_sensade import PMSensadePullConverter
-from .park_raum_check import ParkRaumCheckKehlPushConverter, ParkRaumCheckSachsenheimPushConverter
-from .pbw import PbwPullConverter
-from .pforzheim import PforzheimPushConverter
-from .pum_bw import PumBwPushConverter
-from .radolfzell import RadolfzellPushConverter
-from .radvis_bw import RadvisBwPullConverter
-from .reutlingen import ReutlingenPushConverter
-from .reutlingen_bike import ReutlingenBikePushConverter
-from .reutlingen_disabled import ReutlingenDisabledPushConverter
-from .stuttgart import StuttgartPushConverter
-from .toll_collect import TollCollectPullConverter
-from .ulm import UlmPullConverter
-from .ulm_sensors import UlmSensorsPullConverter
-from .velobrix import VelobrixPullConverter
-from .vrn_p_r import VrnParkAndRidePullConverter
-from .vrs import VrsBondorfPullConverter, VrsKirchheimPullConverter, VrsNeustadtPullConverter, VrsVaihingenPullConverter
-from .vrs_p_r import VrsParkAndRidePushConverter
+from .converter_registry import CONVERTER_PATHS, ConverterRegistry
+
+if TYPE_CHECKING:
+    from .aachen import AachenPullConverter
+    from .aalen import AalenPullConverter
+    from .apcoa import ApcoaPullConverter
+    from .bahn_v2 import BahnV2PullConverter
+    from .basel import BaselPullConverter
+    from .bb_parkhaus import BBParkhausPushConverter
+    from .bfrk_bw import BfrkBwBikePushConverter, BfrkBwCarPullConverter
+    from .bielefeld import BielefeldPullConverter
+    from .bietigheim_bissingen import BietigheimBissingenPullConverter
+    from .ellwangen import EllwangenPushConverter
+    from .ellwangen_sensit import EllwangenSensitPullConverter
+    from .esslingen import EsslingenPushConverter
+    from .freiburg import (
+        FreiburgParkAndRideRealtimePullConverter,
+        FreiburgParkAndRideStaticPullConverter,
+        FreiburgPullConverter,
+    )
+    from .freiburg_disabled_sensors import FreiburgDisabledSensorsPullConverter
+    from .freiburg_disabled_static import FreiburgDisabledStaticPullConverter
+    from .freiburg_scanner import FreiburgScannerPullConverter
+    from .freiburg_vag_bike import FreiburgVAGBikePullConverter
+    from .friedrichshafen_easypark import FriedrichshafenEasyParkPushConverter
+    from .friedrichshafen_sensors import FriedrichshafenSensorsPullConverter
+    from .goldbeck import GoldbeckPushConverter
+    from .heidelberg import HeidelbergPullConverter
+    from .heidelberg_disabled import HeidelbergDisabledPullConverter
+    from .heidelberg_easypark import HeidelbergEasyParkPullConverter
+    from .heilbronn_goldbeck import HeilbronnGoldbeckPullConverter
+    from .herrenberg import HerrenbergPullConverter
+    from .herrenberg_bike import HerrenbergBikePullConverter
+    from .huefner import HuefnerPushConverter
+    from .jena import JenaPullConverter
+    from .karlsruhe import KarlsruheBikePullConverter, KarlsruhePullConverter
+    from .karlsruhe_disabled import KarlsruheDisabledPullConverter
+    from .keltern import KelternPushConverter
+    from .kienzler import (
+        KienzlerBikeAndRidePullConverter,
+        KienzlerKarlsruhePullConverter,
+        KienzlerNeckarsulmPullConverter,
+        KienzlerOffenburgPullConverter,
+        KienzlerRadSafePullConverter,
+        KienzlerStuttgartPullConverter,
+        KienzlerUlmPullConverter,
+        KienzlerVrnPullConverter,
+        KienzlerVVSPullConverter,
+    )
+    from .konstanz import KonstanzPullConverter
+    from .konstanz_bike import KonstanzBikePullConverter
+    from .konstanz_disabled import KonstanzDisabledPullConverter
+    from .ladenburg_parkraumcheck import LadenburgParkraumcheckPushConverter
+    from .mannheim_buchen import BuchenPushConverter, MannheimPushConverter
+    from .neckarsulm import NeckarsulmPushConverter
+    from .neckarsulm_bike import NeckarsulmBikePushConverter
+    from .opendata_swiss import OpenDataSwissPullConverter
+    from .p_m_bw import PMBWPullConverter
+    from .p_m_sensade import PMSensadePullConverter
+    from .park_raum_check import ParkRaumCheckKehlPushConverter, ParkRaumCheckSachsenheimPushConverter
+    from .pbw import PbwPullConverter
+    from .pforzheim import PforzheimPushConverter
+    from .pum_bw import PumBwPushConverter
+    from .radolfzell import RadolfzellPushConverter
+    from .radvis_bw import RadvisBwPullConverter
+    from .reutlingen import ReutlingenPushConverter
+    from .reutlingen_bike import ReutlingenBikePushConverter
+    from .reutlingen_disabled import ReutlingenDisabledPushConverter
+    from .stuttgart import StuttgartPushConverter
+    from .toll_collect import TollCollectPullConverter
+    from .ulm import UlmPullConverter
+    from .ulm_sensors import UlmSensorsPullConverter
+    from .velobrix import VelobrixPullConverter
+    from .vrn_p_r import VrnParkAndRidePullConverter
+    from .vrs import (
+        VrsBondorfPullConverter,
+        VrsKirchheimPullConverter,
+        VrsNeustadtPullConverter,
+        VrsVaihingenPullConverter,
+    )
+    from .vrs_p_r import VrsParkAndRidePushConverter
+
+# Converter classes are imported on first access, so importing one converter does not import all the others
+_converter_paths_by_class_name: dict[str, str] = {
+    converter_path.rsplit('.', 1)[1]: converter_path for converter_path in CONVERTER_PATHS.values()
+}
+
+
+def __getattr__(name: str):
+    converter_path = _converter_paths_by_class_name.get(name)
+    if converter_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    converter_class = ConverterRegistry.import_converter_class(converter_path)
+    globals()[name] = converter_class
+
+    return converter_class
@@ -3,6 +3,7 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -34,11 +35,22 @@ class ApcoaPullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        response = self.get_response()
+
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self._transform_static_parking_sites(self.apcoa_parking_sites_validator.validate(response.json())),
+            key_data=self.config_helper.get('PARK_API_APCOA_IGNORE_MISSING_COORDINATES', False),
+        )
+
+    def _transform_static_parking_sites(
+        self,
+        parking_sites_input: ApcoaParkingSitesInput,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
-        parking_sites_input = self.get_data()
-
         for parking_site_dict in parking_sites_input.Results:
             # Ignore Park & Control Objects/Entries - Not allowed to be published
             if (
@@ -73,7 +85,7 @@ class ApcoaPullConverter(ParkingSitePullConverter):
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []  # ATM only static data can be called from the API
 
-    def get_data(self) -> ApcoaParkingSitesInput:
+    def get_response(self) -> Response:
         headers: dict[str, str] = {
             'Cache-Control': 'no-cache',
             'Ocp-Apim-Subscription-Key': self.config_helper.get('PARK_API_APCOA_API_SUBSCRIPTION_KEY'),
@@ -83,5 +95,6 @@ class ApcoaPullConverter(ParkingSitePullConverter):
             url=self.source_info.source_url,
             headers=headers,
             timeout=60,
+            http_cache=True,
         )
-        return self.apcoa_parking_sites_validator.validate(response.json())
+        return response
@@ -3,6 +3,9 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Iterator, Sequence
+
+from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -29,16 +32,45 @@ class BahnV2PullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list = []
-        static_parking_site_errors: list[ImportParkingSiteException] = []
+        response = self.get_response()
 
-        parking_site_dicts = self.get_data()
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self.split_inputs_and_exceptions(self._iter_static_parking_sites(response.json())),
+        )
 
-        for parking_site_dict in parking_site_dicts.get('_embedded', []):
+    def iter_static_parking_sites(self) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        # Cached results are stored as lists anyway
+        if self._get_static_result_cache() is not None:
+            yield from super().iter_static_parking_sites()
+            return
+
+        yield from self._iter_static_parking_sites(self.get_response().json())
+
+    def _iter_static_parking_sites(
+        self,
+        parking_site_dicts: dict,
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        return self.iter_apply_static_patches(self._iter_unpatched_static_parking_sites(parking_site_dicts))
+
+    def _iter_unpatched_static_parking_sites(
+        self,
+        parking_site_dicts: dict,
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        return self.iter_validate_records(parking_site_dicts.get('_embedded', []), self._validate_parking_site_dicts)
+
+    def _validate_parking_site_dicts(
+        self,
+        parking_site_dicts: Sequence[dict],
+    ) -> list[StaticParkingSiteInput | ImportParkingSiteException]:
+        results: list[StaticParkingSiteInput | ImportParkingSiteException] = []
+
+        for parking_site_dict in parking_site_dicts:
             try:
                 parking_site_input: BahnParkingSiteInput = self.bahn_parking_site_validator.validate(parking_site_dict)
             except ValidationError as e:
-                static_parking_site_errors.append(
+                results.append(
                     ImportParkingSiteException(
                         source_uid=self.source_info.uid,
                         parking_site_uid=parking_site_dict.get('id'),
@@ -51,7 +83,7 @@ class BahnV2PullConverter(ParkingSitePullConverter):
             if static_parking_site_car is None:
                 continue
 
-            static_parking_site_inputs.append(static_parking_site_car)
+            results.append(static_parking_site_car)
 
             for item in parking_site_input.capacity:
                 if item.type == BahnParkingSiteCapacityType.BIKE_PARKING_LOCKED:
@@ -60,20 +92,20 @@ class BahnV2PullConverter(ParkingSitePullConverter):
                     )
                     if static_parking_site_bike_locked is None:
                         continue
-                    static_parking_site_inputs.append(static_parking_site_bike_locked)
+                    results.append(static_parking_site_bike_locked)
 
                 if item.type == BahnParkingSiteCapacityType.BIKE_PARKING_OPEN:
                     static_parking_site_bike_open = self.mapper.map_static_parking_site_bike_open(parking_site_input)
                     if static_parking_site_bike_open is None:
                         continue
-                    static_parking_site_inputs.append(static_parking_site_bike_open)
+                    results.append(static_parking_site_bike_open)
 
-        return self.apply_static_patches(static_parking_site_inputs), static_parking_site_errors
+        return results
 
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []  # ATM it's impossible to get realtime data due rate limit restrictions
 
-    def get_data(self) -> dict:
+    def get_response(self) -> Response:
         headers: dict[str, str] = {
             'DB-Client-Id': self.config_helper.get('PARK_API_BAHN_API_CLIENT_ID'),
             'DB-Api-Key': self.config_helper.get('PARK_API_BAHN_API_CLIENT_SECRET'),
@@ -84,5 +116,6 @@ class BahnV2PullConverter(ParkingSitePullConverter):
             url=f'{self.config_helper.get("PARK_API_BAHN_URL", self._base_url)}/parking-facilities',
             headers=headers,
             timeout=60,
+            http_cache=True,
         )
-        return response.json()
+        return response
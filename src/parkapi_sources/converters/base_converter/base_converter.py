@@ -3,16 +3,15 @@ Copyright 2023 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import json
 from abc import ABC, abstractmethod
-from json import JSONDecodeError
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Unpack
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TypeVar, Unpack
 
 from requests import Response
-from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
+from parkapi_sources.exceptions import ImportException, ImportSourceException
 from parkapi_sources.models import (
     RealtimeParkingSiteInput,
     RealtimeParkingSpotInput,
@@ -24,9 +23,22 @@ from parkapi_sources.models import (
     StaticParkingSpotPatchInput,
     StaticPatchInput,
 )
-from parkapi_sources.util import ConfigHelper, RequestHelper
+from parkapi_sources.util import (
+    ConcurrentFetcher,
+    ConfigHelper,
+    MetricsHook,
+    PhaseTimer,
+    RequestHelper,
+    StaticPatchStore,
+    StaticResultCache,
+)
 from parkapi_sources.util.request_helper import RequestKwargs
 
+from .chunked_record_processor import ChunkedRecordProcessor
+
+T = TypeVar('T')
+E = TypeVar('E', bound=ImportException)
+
 
 class BaseConverter(ABC):
     config_helper: ConfigHelper
@@ -37,10 +49,22 @@ class BaseConverter(ABC):
     realtime_parking_spot_validator = DataclassValidator(RealtimeParkingSpotInput)
     static_patch_input_validator = DataclassValidator(StaticPatchInput)
     required_config_keys: list[str] = []
+    # Limits for request_get_all(), can be overwritten by child classes if an upstream needs gentler treatment
+    max_concurrent_requests: int = 8
+    max_requests_per_second: Optional[float] = None
+    # Records per chunk for iter_validate_records(), can be overwritten by child classes
+    validation_chunk_size: int = 1000
+    # Set by get_cached_static_result(): True if the last static result came from the static result cache, because
+    # neither the upstream data nor the patch file changed
+    static_data_unchanged: bool = False
+    # Per converter instance, so patch files are parsed and validated once per converter and each error is reported
+    # once by this converter
+    static_patch_store: StaticPatchStore
 
     def __init__(self, config_helper: ConfigHelper, request_helper: RequestHelper):
         self.config_helper = config_helper
         self.request_helper = request_helper
+        self.static_patch_store = StaticPatchStore()
 
     @property
     @abstractmethod
@@ -57,8 +81,30 @@ class BaseConverter(ABC):
     def config_value_for_patch_dir(self) -> str:
         pass
 
-    def request_get(self, **kwargs: Unpack[RequestKwargs]) -> Response:
-        return self.request_helper.get(source_info=self.source_info, **kwargs)
+    @property
+    def metrics_hook(self) -> Optional[MetricsHook]:
+        # The metrics hook is set at the request helper, so converters don't need another constructor argument
+        return getattr(self.request_helper, 'metrics_hook', None)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """
+        Reports the duration of the wrapped block as `phase` of this source to the metrics hook, if there is one.
+        """
+        phase_timer = self.create_phase_timer(phase)
+        try:
+            yield
+        finally:
+            phase_timer.stop()
+
+    def create_phase_timer(self, phase: Optional[str] = None) -> PhaseTimer:
+        """
+        Returns a timer for interleaved phases of this source, like validating and mapping each item of a list.
+        """
+        return PhaseTimer(self.metrics_hook, self.source_info.uid, phase)
+
+    def request_get(self, *, http_cache: bool = False, **kwargs: Unpack[RequestKwargs]) -> Response:
+        return self.request_helper.get(source_info=self.source_info, http_cache=http_cache, **kwargs)
 
     def request_post(self, **kwargs: Unpack[RequestKwargs]) -> Response:
         return self.request_helper.post(source_info=self.source_info, **kwargs)
@@ -72,57 +118,177 @@ class BaseConverter(ABC):
     def request_delete(self, **kwargs: Unpack[RequestKwargs]) -> Response:
         return self.request_helper.delete(source_info=self.source_info, **kwargs)
 
-    def apply_static_patches(self, parking_inputs: list[StaticBaseParkingInput]) -> list[StaticBaseParkingInput]:
+    def request_get_all(
+        self,
+        request_kwargs_list: list[RequestKwargs],
+        request_method: Optional[Callable[..., Response]] = None,
+    ) -> list[Response]:
+        """
+        Runs multiple requests concurrently, limited by max_concurrent_requests and max_requests_per_second per host.
+        Responses are returned in the order of the given request kwargs. request_method defaults to request_get.
+        """
+        concurrent_fetcher = ConcurrentFetcher(
+            max_in_flight=self.max_concurrent_requests,
+            requests_per_second=self.max_requests_per_second,
+        )
+        return concurrent_fetcher.fetch_all(request_method or self.request_get, request_kwargs_list)  # type: ignore
+
+    def iter_validate_records(
+        self,
+        records: Sequence,
+        validate_chunk: Callable[..., list[T | E]],
+        chunk_kwargs: Optional[dict[str, Any]] = None,
+    ) -> Iterator[T | E]:
+        """
+        Validates and maps records in chunks of `validation_chunk_size` with `validate_chunk`, which has to be a method
+        of this converter and returns inputs and exceptions in the order of the records. `chunk_kwargs` are passed to
+        each `validate_chunk` call, and have to be picklable. If config value VALIDATION_PROCESSES is set to more than
+        1, sources with more than one chunk are validated in worker processes. Results always keep the order of the
+        records.
+        """
+        validation_processes = self.config_helper.get('VALIDATION_PROCESSES')
+
+        return ChunkedRecordProcessor.iter_process(
+            converter=self,
+            records=records,
+            process_chunk=validate_chunk,
+            chunk_size=self.validation_chunk_size,
+            # Config values from env vars are strings, so we have to cast them
+            processes=1 if validation_processes is None or validation_processes == '' else int(validation_processes),
+            chunk_kwargs=chunk_kwargs,
+        )
+
+    def get_cached_static_result(
+        self,
+        result_type: str,
+        raw_data: bytes,
+        transform: Callable[[], tuple[list[T], list[E]]],
+        key_data: Any = None,
+    ) -> tuple[list[T], list[E]]:
+        """
+        Returns the result of `transform`, which should parse, validate and patch `raw_data`. If the static result
+        cache is enabled for this source by config values STATIC_RESULT_CACHE_DIR and STATIC_RESULT_CACHE_SOURCES, and
+        neither `raw_data`, `key_data` nor the patch file changed since the last run, the cached result is returned
+        instead and `static_data_unchanged` is set. `result_type` separates different results of the same source, and
+        `key_data` should contain everything else `transform` depends on, e.g. config values.
+        """
+        self.static_data_unchanged = False
+
+        static_result_cache = self._get_static_result_cache()
+        if static_result_cache is None:
+            return transform()
+
+        patch_file_path = self._get_static_patch_file_path()
+        key = static_result_cache.build_key(
+            raw_data,
+            patch_file_path.read_bytes() if patch_file_path is not None and patch_file_path.exists() else None,
+            key_data,
+        )
+
+        cached_result = static_result_cache.get(self.source_info.uid, result_type, key)
+        if cached_result is not None:
+            self.static_data_unchanged = True
+            return cached_result  # type: ignore
+
+        inputs, import_exceptions = transform()
+        static_result_cache.set(self.source_info.uid, result_type, key, inputs, import_exceptions)
+
+        return inputs, import_exceptions
+
+    def _get_static_result_cache(self) -> Optional[StaticResultCache]:
+        static_result_cache_dir: Optional[str] = self.config_helper.get('STATIC_RESULT_CACHE_DIR')
+        if not static_result_cache_dir or self.source_info.uid not in (
+            self.config_helper.get('STATIC_RESULT_CACHE_SOURCES') or []
+        ):
+            return None
+
+        return StaticResultCache(static_result_cache_dir)
+
+    @staticmethod
+    def split_inputs_and_exceptions(results: Iterable[T | E]) -> tuple[list[T], list[E]]:
+        """
+        Collects the results of a streaming method like `iter_static_parking_sites()` into the input and exception
+        lists of the list based methods.
+        """
+        inputs: list[T] = []
+        import_exceptions: list[E] = []
+        for result in results:
+            if isinstance(result, ImportException):
+                import_exceptions.append(result)
+            else:
+                inputs.append(result)
+        return inputs, import_exceptions
+
+    def _get_static_patch_file_path(self) -> Optional[Path]:
         if not self.config_helper.get(self.config_value_for_patch_dir):
-            return parking_inputs
+            return None
 
         if not self.static_parking_patch_validator:
-            return parking_inputs
+            return None
 
         try:
-            json_file_path = Path(
-                self.config_helper.get(self.config_value_for_patch_dir), f'{self.source_info.uid}.json'
-            )
+            return Path(self.config_helper.get(self.config_value_for_patch_dir), f'{self.source_info.uid}.json')
         except TypeError:
-            return parking_inputs
+            return None
 
-        if not json_file_path.exists():
-            return parking_inputs
-
-        with json_file_path.open() as json_file:
-            try:
-                item_dicts = json.loads(json_file.read())
-            except JSONDecodeError:
+    def apply_static_patches(self, parking_inputs: list[StaticBaseParkingInput]) -> list[StaticBaseParkingInput]:
+        with self.measure('patch'):
+            field_updates_by_uid = self._get_static_patch_field_updates_by_uid()
+            if not field_updates_by_uid:
                 return parking_inputs
 
-        parking_inputs_by_uid: dict[str, StaticBaseParkingInput] = {
-            parking_input.uid: parking_input for parking_input in parking_inputs
-        }
+            for parking_input in parking_inputs:
+                field_updates = field_updates_by_uid.get(parking_input.uid)
+                if field_updates is not None:
+                    self.static_patch_store.apply_field_updates(parking_input, field_updates)
 
+        return parking_inputs
+
+    def iter_apply_static_patches(self, results: Iterable[T | E]) -> Iterator[T | E]:
+        """
+        Streaming variant of `apply_static_patches()`: patches static inputs while they pass through, and passes
+        exceptions through unchanged. Like at `apply_static_patches()`, errors in the patch file are just returned by
+        `pop_static_patch_exceptions()`, so they neither end up between parking site exceptions nor in cached results.
+        """
+        with self.measure('patch'):
+            field_updates_by_uid = self._get_static_patch_field_updates_by_uid()
+
+        # Time between results belongs to the producer and the consumer, so just patching itself is measured
+        phase_timer = self.create_phase_timer()
         try:
-            items = self.static_patch_input_validator.validate(item_dicts)
-        except ValidationError:
-            return parking_inputs
-
-        for item_dict in items.items:
-            try:
-                parking_patch = self.static_parking_patch_validator.validate(item_dict)
-            except ValidationError:
-                continue
-
-            if parking_patch.uid not in parking_inputs_by_uid:
-                continue
-
-            for key, value in parking_patch.to_dict().items():
-                if key in ['external_identifiers', 'restrictions']:
-                    continue
-                setattr(parking_inputs_by_uid[parking_patch.uid], key, value)
-            if parking_patch.external_identifiers:
-                parking_inputs_by_uid[parking_patch.uid].external_identifiers = parking_patch.external_identifiers
-            if parking_patch.restrictions:
-                parking_inputs_by_uid[parking_patch.uid].restrictions = parking_patch.restrictions
+            for result in results:
+                if field_updates_by_uid and not isinstance(result, ImportException):
+                    field_updates = field_updates_by_uid.get(result.uid)  # type: ignore
+                    if field_updates is not None:
+                        phase_timer.switch('patch')
+                        self.static_patch_store.apply_field_updates(result, field_updates)
+                        phase_timer.pause()
+                yield result
+        finally:
+            phase_timer.stop()
 
-        return parking_inputs
+    def pop_static_patch_exceptions(self) -> list[ImportSourceException]:
+        """
+        Returns errors of the patch file of this source since it was loaded the last time. Each error is returned just
+        once, so invalid patch files don't add the same errors to every import.
+        """
+        json_file_path = self._get_static_patch_file_path()
+        if json_file_path is None:
+            return []
+
+        return self.static_patch_store.pop_import_exceptions(json_file_path)
+
+    def _get_static_patch_field_updates_by_uid(self) -> dict[str, dict[str, Any]]:
+        json_file_path = self._get_static_patch_file_path()
+        if json_file_path is None:
+            return {}
+
+        return self.static_patch_store.get_field_updates_by_uid(
+            json_file_path,
+            self.source_info.uid,
+            self.static_patch_input_validator,
+            self.static_parking_patch_validator,
+        )
 
 
 class ParkingSiteBaseConverter(BaseConverter, ABC):
@@ -0,0 +1,124 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import atexit
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence
+
+from parkapi_sources.util import ConfigHelper, ExceptionState, RequestHelper, get_exception_state, restore_exception
+
+if TYPE_CHECKING:
+    from .base_converter import BaseConverter
+
+
+class ChunkedRecordProcessor:
+    """
+    Splits the records of a converter into chunks and processes them with a method of this converter, which turns a
+    chunk of raw records into inputs and exceptions. With more than one process, the chunks are processed in a
+    process-wide pool of worker processes. Either way, results are yielded chunk by chunk in the order of the records,
+    so output order and exception attribution don't depend on the amount of processes.
+
+    Workers build their own converter from the converter class and its config, so the chunk method must not depend on
+    state which was set at the converter instance before, like data of previous requests. Values which have to be the
+    same for all chunks, like import timestamps, are passed as `chunk_kwargs` instead.
+
+    The worker pools live as long as the process, so they are re-used by all imports. They are shut down at interpreter
+    exit, or explicitly with `shutdown()`.
+    """
+
+    _executors: dict[int, ProcessPoolExecutor] = {}
+    _executors_lock: Lock = Lock()
+
+    @classmethod
+    def iter_process(
+        cls,
+        converter: 'BaseConverter',
+        records: Sequence,
+        process_chunk: Callable[[Sequence], list],
+        chunk_size: int,
+        processes: int,
+        chunk_kwargs: Optional[dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        chunk_kwargs = chunk_kwargs or {}
+        chunks = (records[index : index + chunk_size] for index in range(0, len(records), chunk_size))
+
+        # Worker processes are just worth it if there is more than one chunk
+        if processes <= 1 or len(records) <= chunk_size:
+            for chunk in chunks:
+                yield from process_chunk(chunk, **chunk_kwargs)
+            return
+
+        executor = cls._get_executor(processes)
+        # Keeps all workers busy, but limits the chunk results waiting for the consumer
+        pending_futures: deque[Future] = deque()
+        for chunk in chunks:
+            pending_futures.append(
+                executor.submit(
+                    _process_chunk_in_worker,
+                    type(converter),
+                    converter.config_helper,
+                    process_chunk.__name__,
+                    chunk,
+                    chunk_kwargs,
+                ),
+            )
+            if len(pending_futures) >= processes * 2:
+                yield from cls._get_chunk_results(pending_futures.popleft())
+
+        while pending_futures:
+            yield from cls._get_chunk_results(pending_futures.popleft())
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Shuts down all worker pools. Later imports start new ones on demand.
+        """
+        with cls._executors_lock:
+            executors = list(cls._executors.values())
+            cls._executors.clear()
+
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def _get_executor(cls, processes: int) -> ProcessPoolExecutor:
+        with cls._executors_lock:
+            executor = cls._executors.get(processes)
+            if executor is None:
+                # Forking a process with running threads can deadlock, so workers are spawned
+                executor = ProcessPoolExecutor(max_workers=processes, mp_context=get_context('spawn'))
+                cls._executors[processes] = executor
+            return executor
+
+    @staticmethod
+    def _get_chunk_results(future: Future) -> list[Any]:
+        return [
+            restore_exception(exception_state) if exception_state is not None else result
+            for result, exception_state in future.result()
+        ]
+
+
+def _process_chunk_in_worker(
+    converter_class: type['BaseConverter'],
+    config_helper: ConfigHelper,
+    method_name: str,
+    chunk: Sequence,
+    chunk_kwargs: dict[str, Any],
+) -> list[tuple[Any, Optional[ExceptionState]]]:
+    """
+    Runs in a worker process. ImportExceptions cannot be pickled directly, so they are returned as state.
+    """
+    converter = converter_class(config_helper=config_helper, request_helper=RequestHelper(config_helper=config_helper))
+
+    return [
+        (None, get_exception_state(result)) if isinstance(result, BaseException) else (result, None)
+        for result in getattr(converter, method_name)(chunk, **chunk_kwargs)
+    ]
+
+
+atexit.register(ChunkedRecordProcessor.shutdown)
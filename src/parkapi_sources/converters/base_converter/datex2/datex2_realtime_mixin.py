@@ -4,6 +4,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import IO, Callable, Iterable, Iterator, Optional
 
 from lxml import etree
 from validataclass.exceptions import ValidationError
@@ -11,10 +13,23 @@ from validataclass.validators import DataclassValidator
 
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo
+from parkapi_sources.util import XMLHelper, XMLToDictConverter
 
 
 class Datex2RealtimeMixin(ABC):
     source_info: SourceInfo
+    xml_helper: XMLHelper
+    create_phase_timer: Callable
+    measure: Callable
+    # Record tag, its parent tag and xml_to_dict arguments, used for the whole document as well as for streaming
+    realtime_xml_record_tag: str
+    realtime_xml_record_parent_tag: str
+    realtime_xml_to_dict_kwargs: dict = {}
+
+    @cached_property
+    def realtime_xml_to_dict_converter(self) -> XMLToDictConverter:
+        # Built once per converter, so the option lists are not prepared again for every document
+        return XMLToDictConverter(**self.realtime_xml_to_dict_kwargs)
 
     @abstractmethod
     def _transform_realtime_xml_to_realtime_input_dicts(self, xml_data: etree.Element) -> list[dict]:
@@ -29,18 +44,52 @@ class Datex2RealtimeMixin(ABC):
     def get_uid_from_realtime_input_dict(self, input_dict: dict) -> str:
         pass
 
+    def _iter_realtime_xml_stream_input_dicts(
+        self,
+        realtime_xml_source: IO[bytes],
+        encoding: Optional[str] = None,
+    ) -> Iterator[dict]:
+        return self.realtime_xml_to_dict_converter.iter_records(
+            realtime_xml_source,
+            record_tag=self.realtime_xml_record_tag,
+            parent_tag=self.realtime_xml_record_parent_tag,
+            encoding=encoding,
+        )
+
     def _handle_realtime_xml_data(
         self,
         realtime_xml_data: etree.Element,
+    ) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        with self.measure('parse'):
+            realtime_input_dicts = self._transform_realtime_xml_to_realtime_input_dicts(realtime_xml_data)
+        return self._handle_realtime_input_dicts(realtime_input_dicts)
+
+    def _handle_realtime_xml_stream(
+        self,
+        realtime_xml_source: IO[bytes],
+        encoding: Optional[str] = None,
+    ) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Streaming alternative to _handle_realtime_xml_data, which never holds the whole document as tree or dict.
+        """
+        return self._handle_realtime_input_dicts(
+            self._iter_realtime_xml_stream_input_dicts(realtime_xml_source, encoding),
+        )
+
+    def _handle_realtime_input_dicts(
+        self,
+        realtime_input_dicts: Iterable[dict],
     ) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
         realtime_parking_site_errors: list[ImportParkingSiteException] = []
 
-        realtime_input_dicts: list[dict] = self._transform_realtime_xml_to_realtime_input_dicts(realtime_xml_data)
-
+        # Streamed input dicts are parsed while iterating, so the time between items is parsing time
+        phase_timer = self.create_phase_timer('parse')
         for realtime_input_dict in realtime_input_dicts:
             try:
+                phase_timer.switch('validate')
                 realtime_item = self.realtime_validator.validate(realtime_input_dict)
+                phase_timer.switch('map')
                 realtime_parking_site_inputs.append(realtime_item.to_realtime_parking_site_input())
 
             except ValidationError as e:
@@ -51,5 +100,8 @@ class Datex2RealtimeMixin(ABC):
                         message=str(e.to_dict()),
                     ),
                 )
+            phase_timer.switch('parse')
+
+        phase_timer.stop()
 
         return realtime_parking_site_inputs, realtime_parking_site_errors
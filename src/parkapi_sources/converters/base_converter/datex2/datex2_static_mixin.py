@@ -4,6 +4,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
 
 from lxml import etree
 from validataclass.exceptions import ValidationError
@@ -11,12 +13,25 @@ from validataclass.validators import DataclassValidator
 
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import XMLHelper, XMLToDictConverter
 
 
 class Datex2StaticMixin(ABC):
     source_info: SourceInfo
+    xml_helper: XMLHelper
+    create_phase_timer: Callable
+    measure: Callable
     # Can be overwritten by child classes
     has_realtime_data: bool = True
+    # Record tag, its parent tag and xml_to_dict arguments, used for the whole document as well as for streaming
+    static_xml_record_tag: str
+    static_xml_record_parent_tag: str
+    static_xml_to_dict_kwargs: dict = {}
+
+    @cached_property
+    def static_xml_to_dict_converter(self) -> XMLToDictConverter:
+        # Built once per converter, so the option lists are not prepared again for every document
+        return XMLToDictConverter(**self.static_xml_to_dict_kwargs)
 
     @abstractmethod
     def _transform_static_xml_to_static_input_dicts(self, xml_data: etree.Element) -> list[dict]:
@@ -31,32 +46,74 @@ class Datex2StaticMixin(ABC):
     def get_uid_from_static_input_dict(self, input_dict: dict) -> str:
         pass
 
+    def handle_static_item(self, static_item: Any):
+        """
+        Can be overwritten by subclass, e.g. to collect values of all validated items, including ignored ones.
+        """
+
     def modify_static_parking_site_input(self, static_parking_site_input: StaticParkingSiteInput):
         """
         Can be overwritten by subclass.
         """
 
+    def modify_static_parking_site_inputs(self, static_parking_site_inputs: list[StaticParkingSiteInput]):
+        """
+        Can be overwritten by subclass for modifications which are cheaper for the whole batch, e.g. reprojections.
+        """
+
+    def _iter_static_xml_stream_input_dicts(
+        self,
+        static_xml_source: IO[bytes],
+        encoding: Optional[str] = None,
+    ) -> Iterator[dict]:
+        return self.static_xml_to_dict_converter.iter_records(
+            static_xml_source,
+            record_tag=self.static_xml_record_tag,
+            parent_tag=self.static_xml_record_parent_tag,
+            encoding=encoding,
+        )
+
     def _handle_static_xml_data(
         self,
         static_xml_data: etree.Element,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        with self.measure('parse'):
+            static_input_dicts = self._transform_static_xml_to_static_input_dicts(static_xml_data)
+        return self._handle_static_input_dicts(static_input_dicts)
+
+    def _handle_static_xml_stream(
+        self,
+        static_xml_source: IO[bytes],
+        encoding: Optional[str] = None,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Streaming alternative to _handle_static_xml_data, which never holds the whole document as tree or dict.
+        """
+        return self._handle_static_input_dicts(self._iter_static_xml_stream_input_dicts(static_xml_source, encoding))
+
+    def _handle_static_input_dicts(
+        self,
+        static_input_dicts: Iterable[dict],
     ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
-        static_input_dicts: list[dict] = self._transform_static_xml_to_static_input_dicts(static_xml_data)
-
+        # Streamed input dicts are parsed while iterating, so the time between items is parsing time
+        phase_timer = self.create_phase_timer('parse')
         for static_input_dict in static_input_dicts:
             try:
+                phase_timer.switch('validate')
                 static_item = self.static_validator.validate(static_input_dict)
+                self.handle_static_item(static_item)
+                phase_timer.switch('map')
                 static_parking_site_input = static_item.to_static_parking_site_input(
                     has_realtime_data=self.has_realtime_data,
                 )
                 # A validataclass can return None to signal that the parking site should be ignored
-                if static_parking_site_input is None:
-                    continue
-                self.modify_static_parking_site_input(static_parking_site_input)
+                if static_parking_site_input is not None:
+                    self.modify_static_parking_site_input(static_parking_site_input)
 
-                static_parking_site_inputs.append(static_parking_site_input)
+                    static_parking_site_inputs.append(static_parking_site_input)
 
             except ValidationError as e:
                 static_parking_site_errors.append(
@@ -66,6 +123,11 @@ class Datex2StaticMixin(ABC):
                         message=str(e.to_dict()),
                     ),
                 )
+            phase_timer.switch('parse')
+
+        phase_timer.switch('map')
+        self.modify_static_parking_site_inputs(static_parking_site_inputs)
+        phase_timer.stop()
 
         # apply_static_patches just exists at pull converters, so we have to check
         if hasattr(self, 'apply_static_patches'):
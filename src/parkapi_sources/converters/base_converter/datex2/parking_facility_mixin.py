@@ -17,21 +17,23 @@ from .parking_facility_validator import ParkingFacility
 class ParkingFacilityMixin(Datex2StaticMixin, ABC):
     xml_helper: XMLHelper
     static_validator = DataclassValidator(ParkingFacility)
+    static_xml_record_tag = 'parkingFacility'
+    static_xml_record_parent_tag = 'parkingFacilityTable'
+    static_xml_to_dict_kwargs = {
+        'conditional_remote_type_tags': [
+            ('values', 'value'),
+            ('parkingFacilityName', 'values'),
+            ('periodName', 'values'),
+            ('openingTimes', 'period'),
+        ],
+        'ensure_array_keys': [
+            ('parkingFacilityTable', 'parkingFacility'),
+            ('parkingFacility', 'assignedParkingSpaces'),
+        ],
+    }
 
     def _transform_static_xml_to_static_input_dicts(self, xml_data: etree.Element) -> list[dict]:
-        data = self.xml_helper.xml_to_dict(
-            xml_data,
-            conditional_remote_type_tags=[
-                ('values', 'value'),
-                ('parkingFacilityName', 'values'),
-                ('periodName', 'values'),
-                ('openingTimes', 'period'),
-            ],
-            ensure_array_keys=[
-                ('parkingFacilityTable', 'parkingFacility'),
-                ('parkingFacility', 'assignedParkingSpaces'),
-            ],
-        )
+        data = self.static_xml_to_dict_converter.convert(xml_data)
         return (
             data
             .get('d2LogicalModel', {})
@@ -17,14 +17,16 @@ from .parking_record_status_validator import ParkingRecordStatus
 class ParkingRecordStatusMixin(Datex2RealtimeMixin, ABC):
     xml_helper: XMLHelper
     realtime_validator = DataclassValidator(ParkingRecordStatus)
+    realtime_xml_record_tag = 'parkingRecordStatus'
+    realtime_xml_record_parent_tag = 'parkingStatusPublication'
+    realtime_xml_to_dict_kwargs = {
+        'ensure_array_keys': [
+            ('parkingStatusPublication', 'parkingRecordStatus'),
+        ],
+    }
 
     def _transform_realtime_xml_to_realtime_input_dicts(self, xml_data: etree.Element) -> list[dict]:
-        data = self.xml_helper.xml_to_dict(
-            xml_data,
-            ensure_array_keys=[
-                ('parkingStatusPublication', 'parkingRecordStatus'),
-            ],
-        )
+        data = self.realtime_xml_to_dict_converter.convert(xml_data)
         return (
             data
             .get('d2LogicalModel', {})
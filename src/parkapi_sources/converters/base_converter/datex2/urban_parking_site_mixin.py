@@ -17,20 +17,22 @@ from .urban_parking_site_validator import UrbanParkingSite
 class UrbanParkingSiteMixin(Datex2StaticMixin, ABC):
     xml_helper: XMLHelper
     static_validator = DataclassValidator(UrbanParkingSite)
+    static_xml_record_tag = 'parkingRecord'
+    static_xml_record_parent_tag = 'parkingTable'
+    static_xml_to_dict_kwargs = {
+        'conditional_remote_type_tags': [
+            ('parkingName', 'values'),
+            ('values', 'value'),
+        ],
+        'ensure_array_keys': [
+            ('parkingTable', 'parkingRecord'),
+            ('parkingName', 'values'),
+            ('assignedParkingAmongOthers', 'applicableForUser'),
+        ],
+    }
 
     def _transform_static_xml_to_static_input_dicts(self, xml_data: etree.Element) -> list[dict]:
-        data = self.xml_helper.xml_to_dict(
-            xml_data,
-            conditional_remote_type_tags=[
-                ('parkingName', 'values'),
-                ('values', 'value'),
-            ],
-            ensure_array_keys=[
-                ('parkingTable', 'parkingRecord'),
-                ('parkingName', 'values'),
-                ('assignedParkingAmongOthers', 'applicableForUser'),
-            ],
-        )
+        data = self.static_xml_to_dict_converter.convert(xml_data)
         return (
             data
             .get('d2LogicalModel', {})
@@ -3,6 +3,7 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from .bearer_token_mixin import BearerTokenMixin
 from .mobilithek_parking_site_pull_converter import MobilithekParkingSitePullConverter
 from .mobilithek_pull_converter import MobilithekPullConverterMixin
 from .pull_converter import ParkingSitePullConverter, ParkingSpotPullConverter, PullConverter
@@ -0,0 +1,103 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import base64
+import binascii
+import json
+from abc import ABC, abstractmethod
+from time import time
+from typing import Callable, Optional
+
+from requests import Response
+
+from parkapi_sources.models import SourceInfo
+from parkapi_sources.util import RequestHelper
+
+
+class BearerTokenMixin(ABC):
+    """
+    Mixin for converters which authenticate with a bearer token. Tokens are cached at the request helper by source and
+    credentials, so a converter fetches one token per token lifetime instead of one per request.
+    """
+
+    source_info: SourceInfo
+    request_helper: RequestHelper
+    request_get: Callable
+    request_post: Callable
+    # Lifetime in seconds if neither the token response nor the token itself contains an expiry
+    default_token_lifetime: int = 300
+    # Tokens get refreshed this amount of seconds before they expire
+    token_refresh_margin: int = 30
+
+    @abstractmethod
+    def _fetch_token(self) -> tuple[str, Optional[int]]:
+        """
+        Requests a new token and returns it with its lifetime in seconds, or None if the lifetime is unknown.
+        """
+
+    @abstractmethod
+    def _get_token_credentials(self) -> tuple[Optional[str], ...]:
+        """
+        Returns all config values which identify the token, usually the client id, the user and the password.
+        """
+
+    def _request_token(self) -> str:
+        return self.request_helper.token_cache.get(
+            key=self._get_token_cache_key(),
+            fetch_token=self._fetch_token_with_lifetime,
+            default_lifetime=self.default_token_lifetime,
+            refresh_margin=self.token_refresh_margin,
+        )
+
+    def _get_token_cache_key(self) -> str:
+        return self.request_helper.token_cache.build_key(self.source_info.uid, *self._get_token_credentials())
+
+    def _fetch_token_with_lifetime(self) -> tuple[str, Optional[int]]:
+        token, lifetime = self._fetch_token()
+        if lifetime is None:
+            lifetime = self._get_jwt_lifetime(token)
+        return token, lifetime
+
+    @staticmethod
+    def _get_jwt_lifetime(token: str) -> Optional[int]:
+        """
+        Reads the lifetime from the exp claim if the token is a JWT. The signature is not checked, because the token is
+        just passed on to the issuer.
+        """
+        token_parts = token.split('.')
+        if len(token_parts) != 3:
+            return None
+        try:
+            # JWTs use unpadded base64url encoding
+            payload = json.loads(base64.urlsafe_b64decode(token_parts[1] + '=' * (-len(token_parts[1]) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get('exp'), (int, float)):
+            return None
+        return int(payload['exp'] - time())
+
+    def request_get_with_token(self, **kwargs) -> Response:
+        return self._request_with_token(self.request_get, **kwargs)
+
+    def request_post_with_token(self, **kwargs) -> Response:
+        return self._request_with_token(self.request_post, **kwargs)
+
+    def _request_with_token(self, request_method: Callable[..., Response], **kwargs) -> Response:
+        token = self._request_token()
+        response = request_method(**self._add_authorization_header(kwargs, token))
+
+        # If the token was revoked or expired early, we invalidate it and retry once with a fresh one
+        if response.status_code == 401:
+            self.request_helper.token_cache.invalidate(self._get_token_cache_key(), token=token)
+            response = request_method(**self._add_authorization_header(kwargs, self._request_token()))
+
+        return response
+
+    @staticmethod
+    def _add_authorization_header(kwargs: dict, token: str) -> dict:
+        return {
+            **kwargs,
+            'headers': {**(kwargs.get('headers') or {}), 'Authorization': f'Bearer {token}'},
+        }
@@ -17,6 +17,10 @@ from .pull_converter import ParkingSitePullConverter
 
 class MobilithekParkingSitePullConverter(MobilithekPullConverterMixin, ParkingSitePullConverter, ABC):
     xml_helper = XMLHelper()
+    # If enabled, the XML data is parsed record by record instead of as a whole document, which keeps the memory usage
+    # flat for large publications. Requires DATEX II mixins, which implement _handle_static_xml_stream and
+    # _handle_realtime_xml_stream.
+    stream_xml_data: bool = False
 
     @abstractmethod
     def _handle_static_xml_data(
@@ -33,15 +37,21 @@ class MobilithekParkingSitePullConverter(MobilithekPullConverterMixin, ParkingSi
         pass
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_xml_data = self._get_xml_data(
-            subscription_id=self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_STATIC_SUBSCRIPTION_ID'),
-        )
+        subscription_id = self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_STATIC_SUBSCRIPTION_ID')
+
+        if self.stream_xml_data:
+            return self._handle_static_xml_stream(self._get_xml_stream(subscription_id), encoding='utf-8')
+
+        static_xml_data = self._get_xml_data(subscription_id=subscription_id)
 
         return self._handle_static_xml_data(static_xml_data)
 
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
-        realtime_xml_data = self._get_xml_data(
-            subscription_id=self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_REALTIME_SUBSCRIPTION_ID'),
-        )
+        subscription_id = self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_REALTIME_SUBSCRIPTION_ID')
+
+        if self.stream_xml_data:
+            return self._handle_realtime_xml_stream(self._get_xml_stream(subscription_id), encoding='utf-8')
+
+        realtime_xml_data = self._get_xml_data(subscription_id=subscription_id)
 
         return self._handle_realtime_xml_data(realtime_xml_data)
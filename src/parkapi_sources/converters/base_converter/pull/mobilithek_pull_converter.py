@@ -4,9 +4,11 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from io import BytesIO
+from typing import IO, Callable
 
 from lxml import etree
+from requests import Response
 
 from parkapi_sources.util import ConfigHelper, XMLHelper
 
@@ -31,6 +33,30 @@ class MobilithekPullConverterMixin(ABC):
         ]
 
     def _get_xml_data(self, subscription_id: int) -> etree.Element:
+        response = self._get_xml_response(subscription_id)
+        # Force UTF-8 encoding, because python requests sets ISO-8859-1 because of RFC 2616
+        response.encoding = 'utf-8'
+
+        root = etree.fromstring(response.text, parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+
+        return root
+
+    def _get_xml_stream(self, subscription_id: int) -> IO[bytes]:
+        """
+        Returns the response body as a stream, which is read from the connection while a streaming parser consumes it,
+        so the whole document is never held in memory. It has to be parsed as UTF-8, just like _get_xml_data does.
+        """
+        response = self._get_xml_response(subscription_id, stream=True)
+
+        # Debug dumps load the whole body, so it can't be streamed from the connection anymore
+        if response._content_consumed:
+            return BytesIO(response.content)
+
+        # The raw stream is not decompressed by default, but the parser needs the decoded body
+        response.raw.decode_content = True
+        return response.raw
+
+    def _get_xml_response(self, subscription_id: int, stream: bool = False) -> Response:
         url = (
             f'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/{subscription_id}'
             f'/clientPullService?subscriptionID={subscription_id}'
@@ -42,10 +68,7 @@ class MobilithekPullConverterMixin(ABC):
                 self.config_helper.get('PARK_API_MOBILITHEK_CERT'),
                 self.config_helper.get('PARK_API_MOBILITHEK_KEY'),
             ),
+            stream=stream,
         )
-        # Force UTF-8 encoding, because python requests sets ISO-8859-1 because of RFC 2616
-        response.encoding = 'utf-8'
 
-        root = etree.fromstring(response.text, parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
-
-        return root
+        return response
@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from validataclass.validators import DataclassValidator
 
@@ -11,7 +12,9 @@ from parkapi_sources.converters.base_converter import BaseConverter
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportParkingSpotException
 from parkapi_sources.models import (
     RealtimeParkingSiteInput,
+    RealtimeParkingSiteRecord,
     RealtimeParkingSpotInput,
+    RealtimeParkingSpotRecord,
     StaticParkingSiteInput,
     StaticParkingSitePatchInput,
     StaticParkingSpotInput,
@@ -20,7 +23,17 @@ from parkapi_sources.models import (
 
 
 class PullConverter(BaseConverter, ABC):
-    pass
+    """
+    Besides the list based methods, pull converters offer streaming methods like `iter_static_parking_sites()`, which
+    yield inputs and exceptions one at a time. By default, they just wrap the list based methods. Converters for large
+    sources overwrite the streaming methods and build the list based methods on top of them using
+    `split_inputs_and_exceptions()`, so consumers can handle these sources with bounded memory.
+
+    Realtime data is also available as lightweight records via `get_realtime_parking_site_records()` and
+    `get_realtime_parking_spot_records()`, e.g. for consumers keeping realtime data in memory. By default, they convert
+    the inputs. High-frequency realtime converters overwrite them to build records directly, and derive their inputs
+    from the records using `to_input()`.
+    """
 
 
 class ParkingSitePullConverter(PullConverter):
@@ -33,6 +46,41 @@ class ParkingSitePullConverter(PullConverter):
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []
 
+    def get_realtime_parking_site_records(
+        self,
+    ) -> tuple[list[RealtimeParkingSiteRecord], list[ImportParkingSiteException]]:
+        realtime_parking_site_inputs, import_parking_site_exceptions = self.get_realtime_parking_sites()
+        return (
+            [RealtimeParkingSiteRecord.from_input(item) for item in realtime_parking_site_inputs],
+            import_parking_site_exceptions,
+        )
+
+    def iter_static_parking_sites(self) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        static_parking_site_inputs, import_parking_site_exceptions = self.get_static_parking_sites()
+        yield from static_parking_site_inputs
+        yield from import_parking_site_exceptions
+
+    def iter_realtime_parking_sites(self) -> Iterator[RealtimeParkingSiteInput | ImportParkingSiteException]:
+        realtime_parking_site_inputs, import_parking_site_exceptions = self.get_realtime_parking_sites()
+        yield from realtime_parking_site_inputs
+        yield from import_parking_site_exceptions
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Returns static and realtime data at once. Converters which get both from the same upstream data overwrite this,
+        so the upstream data is fetched just once.
+        """
+        static_parking_site_inputs, static_import_parking_site_exceptions = self.get_static_parking_sites()
+        realtime_parking_site_inputs, realtime_import_parking_site_exceptions = self.get_realtime_parking_sites()
+
+        return (
+            static_parking_site_inputs,
+            realtime_parking_site_inputs,
+            static_import_parking_site_exceptions + realtime_import_parking_site_exceptions,
+        )
+
     def apply_static_patches(self, parking_inputs: list[StaticParkingSiteInput]) -> list[StaticParkingSiteInput]:
         return super().apply_static_patches(parking_inputs)  # type: ignore
 
@@ -47,5 +95,40 @@ class ParkingSpotPullConverter(PullConverter):
     def get_realtime_parking_spots(self) -> tuple[list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
         return [], []
 
+    def get_realtime_parking_spot_records(
+        self,
+    ) -> tuple[list[RealtimeParkingSpotRecord], list[ImportParkingSpotException]]:
+        realtime_parking_spot_inputs, import_parking_spot_exceptions = self.get_realtime_parking_spots()
+        return (
+            [RealtimeParkingSpotRecord.from_input(item) for item in realtime_parking_spot_inputs],
+            import_parking_spot_exceptions,
+        )
+
+    def iter_static_parking_spots(self) -> Iterator[StaticParkingSpotInput | ImportParkingSpotException]:
+        static_parking_spot_inputs, import_parking_spot_exceptions = self.get_static_parking_spots()
+        yield from static_parking_spot_inputs
+        yield from import_parking_spot_exceptions
+
+    def iter_realtime_parking_spots(self) -> Iterator[RealtimeParkingSpotInput | ImportParkingSpotException]:
+        realtime_parking_spot_inputs, import_parking_spot_exceptions = self.get_realtime_parking_spots()
+        yield from realtime_parking_spot_inputs
+        yield from import_parking_spot_exceptions
+
+    def get_parking_spots(
+        self,
+    ) -> tuple[list[StaticParkingSpotInput], list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
+        """
+        Returns static and realtime data at once. Converters which get both from the same upstream data overwrite this,
+        so the upstream data is fetched just once.
+        """
+        static_parking_spot_inputs, static_import_parking_spot_exceptions = self.get_static_parking_spots()
+        realtime_parking_spot_inputs, realtime_import_parking_spot_exceptions = self.get_realtime_parking_spots()
+
+        return (
+            static_parking_spot_inputs,
+            realtime_parking_spot_inputs,
+            static_import_parking_spot_exceptions + realtime_import_parking_spot_exceptions,
+        )
+
     def apply_static_patches(self, parking_inputs: list[StaticParkingSpotInput]) -> list[StaticParkingSpotInput]:
         return super().apply_static_patches(parking_inputs)  # type: ignore
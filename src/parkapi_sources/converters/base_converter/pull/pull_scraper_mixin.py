@@ -4,10 +4,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
@@ -15,23 +13,30 @@ from validataclass.validators import DataclassValidator
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag
+
 
 class PullScraperMixin(ABC):
     source_info: SourceInfo
     realtime_parking_site_validator: DataclassValidator
 
     @abstractmethod
-    def get_realtime_tags_and_params(self) -> tuple[list[Tag], dict]:
+    def get_realtime_tags_and_params(self) -> tuple[list['Tag'], dict]:
         pass
 
     @abstractmethod
-    def realtime_tag_to_dict(self, tag: Tag, **kwargs) -> Optional[dict]:
+    def realtime_tag_to_dict(self, tag: 'Tag', **kwargs) -> Optional[dict]:
         pass
 
     @abstractmethod
     def request_get(self, **kwargs) -> Response: ...
 
-    def load_url_in_soup(self, url: Optional[str] = None):
+    def load_url_in_soup(self, url: Optional[str] = None) -> 'BeautifulSoup':
+        # Imported here, so just scraping converters import bs4
+        from bs4 import BeautifulSoup
+
         if url is None:
             url = self.source_info.public_url
 
@@ -6,15 +6,21 @@ Use of this source code is governed by an MIT-style license that can be found in
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from hashlib import sha256
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional, TypeVar
 
-from requests import ConnectionError, JSONDecodeError, Response
+from requests import ConnectionError, Response
 from urllib3.exceptions import NewConnectionError
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
-from parkapi_sources.exceptions import ImportParkingSiteException, ImportParkingSpotException, ImportSourceException
+from parkapi_sources.exceptions import (
+    ImportException,
+    ImportParkingSiteException,
+    ImportParkingSpotException,
+    ImportSourceException,
+)
 from parkapi_sources.models import (
     GeojsonFeatureInput,
     GeojsonFeatureParkingSpotInput,
@@ -24,66 +30,126 @@ from parkapi_sources.models import (
     StaticParkingSiteInput,
     StaticParkingSpotInput,
 )
-from parkapi_sources.util import ConfigHelper
+from parkapi_sources.util import ConfigHelper, TemplateCache
+
+F = TypeVar('F')
+E = TypeVar('E', bound=ImportException)
 
 
 class StaticGeojsonDataMixin(ABC):
     config_helper: ConfigHelper
     source_info: SourceInfo
     apply_static_patches: Callable
+    measure: Callable
     geojson_validator = DataclassValidator(GeojsonInput)
     geojson_feature_parking_sites_validator = DataclassValidator(GeojsonFeatureInput)
     geojson_feature_parking_spots_validator = DataclassValidator(GeojsonFeatureParkingSpotInput)
     _base_url = 'https://raw.githubusercontent.com/ParkenDD/parkapi-static-data/main/sources'
+    # Shared by all converters, so validated templates survive between import runs in long-living processes
+    static_geojson_template_cache: TemplateCache = TemplateCache()
 
     @abstractmethod
-    def request_get(self, **kwargs) -> Response: ...
+    def request_get(self, *, http_cache: bool = False, **kwargs) -> Response: ...
 
-    def _get_static_parking_sites_geojson(self, source_uid: str) -> GeojsonInput:
-        base_path: str | None = self.config_helper.get('STATIC_GEOJSON_BASE_PATH')
-        if base_path:
-            with Path(base_path, f'{source_uid}.geojson').open() as geojson_file:
-                return json.loads(geojson_file.read())
-        else:
-            try:
-                response = self.request_get(
-                    url=f'{self.config_helper.get("STATIC_GEOJSON_BASE_URL")}/{source_uid}.geojson',
-                )
-            except (ConnectionError, NewConnectionError) as e:
-                raise ImportParkingSiteException(
-                    source_uid=self.source_info.uid,
-                    message='Connection issue for GeoJSON data',
-                ) from e
-            try:
-                return response.json()
-            except JSONDecodeError as e:
-                raise ImportParkingSiteException(
-                    source_uid=self.source_info.uid,
-                    message='Invalid JSON response for GeoJSON data',
-                ) from e
-
-    def _get_static_parking_spots_geojson(self, source_uid: str) -> GeojsonInput:
+    def _get_static_geojson_cache_ttl(self) -> Optional[float]:
+        cache_ttl = self.config_helper.get('STATIC_GEOJSON_CACHE_TTL')
+        # Config values from env vars are strings, so we have to cast them
+        return None if cache_ttl is None or cache_ttl == '' else float(cache_ttl)
+
+    def _fetch_static_geojson(
+        self,
+        file_path: str,
+        exception_class: type[ImportException],
+        known_version: Optional[str] = None,
+    ) -> tuple[str, Optional[bytes]]:
+        """
+        Returns the version and the raw data of a GeoJSON file. Local files are versioned by their modification time
+        and size, and are not read if they still have `known_version`. Remote files are versioned by their ETag, or by
+        a hash of their body if there is no ETag. A known ETag is sent as `If-None-Match`, so unchanged remote files
+        are not downloaded again.
+        """
         base_path: str | None = self.config_helper.get('STATIC_GEOJSON_BASE_PATH')
         if base_path:
-            with Path(base_path, 'parking-spots', f'{source_uid}.geojson').open() as geojson_file:
-                return json.loads(geojson_file.read())
-        else:
-            try:
-                response = self.request_get(
-                    url=f'{self.config_helper.get("STATIC_GEOJSON_BASE_URL")}/parking-spots/{source_uid}.geojson',
-                )
-            except (ConnectionError, NewConnectionError) as e:
-                raise ImportParkingSpotException(
-                    source_uid=self.source_info.uid,
-                    message='Connection issue for GeoJSON data',
-                ) from e
-            try:
-                return response.json()
-            except JSONDecodeError as e:
-                raise ImportParkingSpotException(
-                    source_uid=self.source_info.uid,
-                    message='Invalid JSON response for GeoJSON data',
-                ) from e
+            geojson_path = Path(base_path, file_path)
+            geojson_stat = geojson_path.stat()
+            version = f'mtime:{geojson_stat.st_mtime_ns}:{geojson_stat.st_size}'
+            if version == known_version:
+                return version, None
+            return version, geojson_path.read_bytes()
+
+        headers: dict[str, str] = {}
+        if known_version is not None and known_version.startswith('etag:'):
+            headers['If-None-Match'] = known_version[len('etag:') :]
+
+        try:
+            response = self.request_get(
+                url=f'{self.config_helper.get("STATIC_GEOJSON_BASE_URL")}/{file_path}',
+                headers=headers,
+                http_cache=True,
+            )
+        except (ConnectionError, NewConnectionError) as e:
+            raise exception_class(
+                source_uid=self.source_info.uid,
+                message='Connection issue for GeoJSON data',
+            ) from e
+
+        if response.status_code == 304 and known_version is not None:
+            return known_version, None
+
+        etag: str | None = response.headers.get('ETag')
+        if etag:
+            return f'etag:{etag}', response.content
+        return f'sha256:{sha256(response.content).hexdigest()}', response.content
+
+    def _load_static_geojson(self, data: bytes, exception_class: type[ImportException]) -> dict:
+        try:
+            with self.measure('parse'):
+                return json.loads(data)
+        except ValueError as e:
+            raise exception_class(
+                source_uid=self.source_info.uid,
+                message='Invalid JSON response for GeoJSON data',
+            ) from e
+
+    def _get_geojson_features_and_exceptions(
+        self,
+        file_path: str,
+        exception_class: type[ImportException],
+        validate_features: Callable[[dict], tuple[list[F], list[E]]],
+    ) -> tuple[list[F], list[E]]:
+        """
+        Loads and validates a GeoJSON file. If config value STATIC_GEOJSON_CACHE_TTL is set, validated features are
+        kept in the process-wide template cache and re-used as long as the file does not change.
+        """
+        cache_ttl = self._get_static_geojson_cache_ttl()
+        if cache_ttl is None:
+            _, data = self._fetch_static_geojson(file_path, exception_class)
+            return self._parse_static_geojson(data, exception_class, validate_features)
+
+        # The base path or URL is part of the key, so changed config values never re-use outdated templates
+        cache_key = '\x00'.join([
+            self.source_info.uid,
+            str(
+                self.config_helper.get('STATIC_GEOJSON_BASE_PATH') or self.config_helper.get('STATIC_GEOJSON_BASE_URL')
+            ),
+            file_path,
+        ])
+        return self.static_geojson_template_cache.get(
+            key=cache_key,
+            ttl=cache_ttl,
+            fetch=lambda known_version: self._fetch_static_geojson(file_path, exception_class, known_version),
+            parse=lambda data: self._parse_static_geojson(data, exception_class, validate_features),
+        )
+
+    def _parse_static_geojson(
+        self,
+        data: bytes,
+        exception_class: type[ImportException],
+        validate_features: Callable[[dict], tuple[list[F], list[E]]],
+    ) -> tuple[list[F], list[E]]:
+        geojson_dict = self._load_static_geojson(data, exception_class)
+        with self.measure('validate'):
+            return validate_features(geojson_dict)
 
     def _get_static_parking_site_inputs_and_exceptions(
         self,
@@ -96,15 +162,16 @@ class StaticGeojsonDataMixin(ABC):
             source_uid,
         )
 
-        for feature_input in feature_inputs:
-            static_parking_site_inputs.append(
-                feature_input.to_static_parking_site_input(
-                    purpose=purpose,
-                    # TODO: Use the Last-Updated HTTP header instead, but as Github does not set such an header, we
-                    #  need to move all GeoJSON data in order to use this.
-                    static_data_updated_at=datetime.now(tz=timezone.utc),
-                ),
-            )
+        with self.measure('map'):
+            for feature_input in feature_inputs:
+                static_parking_site_inputs.append(
+                    feature_input.to_static_parking_site_input(
+                        purpose=purpose,
+                        # TODO: Use the Last-Updated HTTP header instead, but as Github does not set such an header, we
+                        #  need to move all GeoJSON data in order to use this.
+                        static_data_updated_at=datetime.now(tz=timezone.utc),
+                    ),
+                )
 
         return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
 
@@ -119,15 +186,16 @@ class StaticGeojsonDataMixin(ABC):
             source_uid
         )
 
-        for feature_input in feature_inputs:
-            static_parking_spot_inputs.append(
-                feature_input.to_static_parking_spot_input(
-                    purpose=purpose,
-                    # TODO: Use the Last-Updated HTTP header instead, but as Github does not set such an header, we
-                    #  need to move all GeoJSON data in order to use this.
-                    static_data_updated_at=datetime.now(tz=timezone.utc),
-                ),
-            )
+        with self.measure('map'):
+            for feature_input in feature_inputs:
+                static_parking_spot_inputs.append(
+                    feature_input.to_static_parking_spot_input(
+                        purpose=purpose,
+                        # TODO: Use the Last-Updated HTTP header instead, but as Github does not set such an header, we
+                        #  need to move all GeoJSON data in order to use this.
+                        static_data_updated_at=datetime.now(tz=timezone.utc),
+                    ),
+                )
 
         return self.apply_static_patches(static_parking_spot_inputs), import_parking_spot_exceptions
 
@@ -135,7 +203,27 @@ class StaticGeojsonDataMixin(ABC):
         self,
         source_uid: str,
     ) -> tuple[list[GeojsonFeatureInput], list[ImportParkingSiteException]]:
-        geojson_dict = self._get_static_parking_sites_geojson(source_uid)
+        return self._get_geojson_features_and_exceptions(
+            f'{source_uid}.geojson',
+            ImportParkingSiteException,
+            lambda geojson_dict: self._validate_geojson_parking_sites_features(source_uid, geojson_dict),
+        )
+
+    def _get_geojson_parking_spots_features_and_exceptions(
+        self,
+        source_uid: str,
+    ) -> tuple[list[GeojsonFeatureParkingSpotInput], list[ImportParkingSpotException]]:
+        return self._get_geojson_features_and_exceptions(
+            f'parking-spots/{source_uid}.geojson',
+            ImportParkingSpotException,
+            lambda geojson_dict: self._validate_geojson_parking_spots_features(source_uid, geojson_dict),
+        )
+
+    def _validate_geojson_parking_sites_features(
+        self,
+        source_uid: str,
+        geojson_dict: dict,
+    ) -> tuple[list[GeojsonFeatureInput], list[ImportParkingSiteException]]:
         try:
             geojson_input = self.geojson_validator.validate(geojson_dict)
         except ValidationError as e:
@@ -161,11 +249,11 @@ class StaticGeojsonDataMixin(ABC):
 
         return feature_inputs, import_parking_site_exceptions
 
-    def _get_geojson_parking_spots_features_and_exceptions(
+    def _validate_geojson_parking_spots_features(
         self,
         source_uid: str,
+        geojson_dict: dict,
     ) -> tuple[list[GeojsonFeatureParkingSpotInput], list[ImportParkingSpotException]]:
-        geojson_dict = self._get_static_parking_spots_geojson(source_uid)
         try:
             geojson_input = self.geojson_validator.validate(geojson_dict)
         except ValidationError as e:
@@ -6,7 +6,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 import csv
 from abc import ABC, abstractmethod
 from io import StringIO
-from typing import Any
+from typing import Any, Iterator
 
 from parkapi_sources.converters.base_converter.push import PushConverter
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
@@ -30,6 +30,26 @@ class CsvConverter(PushConverter, ABC):
     ]:
         return self.handle_csv(list(csv.reader(data, delimiter=self.csv_delimiter)))
 
+    def iter_csv_string(
+        self,
+        data: StringIO,
+    ) -> Iterator[
+        StaticParkingSiteInput
+        | RealtimeParkingSiteInput
+        | StaticParkingSpotInput
+        | RealtimeParkingSpotInput
+        | ImportParkingSiteException
+    ]:
+        return self.iter_csv(list(csv.reader(data, delimiter=self.csv_delimiter)))
+
+    def iter_csv(
+        self,
+        data: list[list],
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        parking_site_inputs, import_parking_site_exceptions = self.handle_csv(data)
+        yield from parking_site_inputs
+        yield from import_parking_site_exceptions
+
     def get_mapping_by_header(self, header_row: dict[str, str], row: list[Any]) -> dict[str, int]:
         # Remove possible BOM:
         if row and row[0] and row[0][0] == '\ufeff':
@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from parkapi_sources.converters.base_converter.push import PushConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
@@ -17,3 +18,11 @@ class JsonConverter(PushConverter, ABC):
         data: dict | list,
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
+
+    def iter_json(
+        self,
+        data: dict | list,
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        parking_site_inputs, import_parking_site_exceptions = self.handle_json(data)
+        yield from parking_site_inputs
+        yield from import_parking_site_exceptions
@@ -5,10 +5,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from abc import ABC
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openpyxl.cell import Cell
-from openpyxl.workbook.workbook import Workbook
 from validataclass.exceptions import ValidationError
 
 from parkapi_sources.exceptions import ImportParkingSiteException
@@ -16,6 +14,10 @@ from parkapi_sources.models import ParkingAudience, PurposeType, StaticParkingSi
 
 from .xlsx_converter import XlsxConverter
 
+if TYPE_CHECKING:
+    from openpyxl.cell import Cell
+    from openpyxl.workbook.workbook import Workbook
+
 
 class NormalizedXlsxConverter(XlsxConverter, ABC):
     """
@@ -64,23 +66,31 @@ class NormalizedXlsxConverter(XlsxConverter, ABC):
         'P+R-Parkplätze entlang der Straße': 'ON_STREET',
     }
 
-    def handle_xlsx(self, workbook: Workbook) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+    def handle_xlsx(
+        self, workbook: 'Workbook'
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         worksheet = workbook.active
         mapping: dict[str, int] = self.get_mapping_by_header(next(worksheet.rows))
 
         static_parking_site_errors: list[ImportParkingSiteException] = []
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
 
+        parking_site_dicts: list[dict[str, Any]] = []
         for row in worksheet.iter_rows(min_row=2):
             # ignore empty lines as LibreOffice sometimes adds empty rows at the end of a file
             if row[0].value is None:
                 continue
-            parking_site_dict = self.map_row_to_parking_site_dict(
-                mapping=mapping,
-                row=row,
-                column_names=[cell.value for cell in next(worksheet.rows)],
+            parking_site_dicts.append(
+                self.map_row_to_parking_site_dict(
+                    mapping=mapping,
+                    row=row,
+                    column_names=[cell.value for cell in next(worksheet.rows)],
+                ),
             )
 
+        self.modify_parking_site_dicts(parking_site_dicts)
+
+        for parking_site_dict in parking_site_dicts:
             try:
                 static_parking_site_inputs.append(self.static_parking_site_validator.validate(parking_site_dict))
             except ValidationError as e:
@@ -95,10 +105,15 @@ class NormalizedXlsxConverter(XlsxConverter, ABC):
 
         return self.apply_static_patches(static_parking_site_inputs), static_parking_site_errors
 
+    def modify_parking_site_dicts(self, parking_site_dicts: list[dict[str, Any]]) -> None:
+        """
+        Can be overwritten by subclass for modifications which are cheaper for all rows at once, e.g. reprojections.
+        """
+
     def map_row_to_parking_site_dict(
         self,
         mapping: dict[str, int],
-        row: tuple[Cell, ...],
+        row: tuple['Cell', ...],
         column_names: list[str],
     ) -> dict[str, Any]:
         parking_site_raw_dict: dict[str, str] = {}
@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC
+from typing import Iterator
 
 from validataclass.dataclasses import validataclass
 from validataclass.exceptions import ValidationError
@@ -29,9 +30,12 @@ class ParkApiConverter(JsonConverter, ParkingSiteBaseConverter, ABC):
         self,
         data: dict | list,
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
-        parking_site_inputs: list[StaticParkingSiteInput | RealtimeParkingSiteInput] = []
-        parking_site_errors: list[ImportParkingSiteException] = []
+        return self.split_inputs_and_exceptions(self.iter_json(data))
 
+    def iter_json(
+        self,
+        data: dict | list,
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
         try:
             parking_site_item_inputs = self.parking_site_items_validator.validate(data)
         except ValidationError as e:
@@ -40,31 +44,29 @@ class ParkApiConverter(JsonConverter, ParkingSiteBaseConverter, ABC):
         for parking_site_dict in parking_site_item_inputs.items:
             try:
                 static_parking_site_input = self.static_parking_site_validator.validate(parking_site_dict)
-                parking_site_inputs.append(static_parking_site_input)
             except ValidationError as e:
-                parking_site_errors.append(
-                    ImportParkingSiteException(
-                        source_uid=self.source_info.uid,
-                        parking_site_uid=parking_site_dict.get('uid'),
-                        message=f'validation error for {parking_site_dict}: {e.to_dict()}',
-                    ),
+                yield ImportParkingSiteException(
+                    source_uid=self.source_info.uid,
+                    parking_site_uid=parking_site_dict.get('uid'),
+                    message=f'validation error for {parking_site_dict}: {e.to_dict()}',
                 )
                 # If there was an error, we don't proceed with realtime data
                 continue
 
+            yield static_parking_site_input
+
             # No realtime data means no realtime data handling
             if not static_parking_site_input.has_realtime_data:
                 continue
 
             try:
-                parking_site_inputs.append(self.realtime_parking_site_validator.validate(parking_site_dict))
+                realtime_parking_site_input = self.realtime_parking_site_validator.validate(parking_site_dict)
             except ValidationError as e:
-                parking_site_errors.append(
-                    ImportParkingSiteException(
-                        source_uid=self.source_info.uid,
-                        parking_site_uid=parking_site_dict.get('uid'),
-                        message=f'validation error for {parking_site_dict}: {e.to_dict()}',
-                    ),
+                yield ImportParkingSiteException(
+                    source_uid=self.source_info.uid,
+                    parking_site_uid=parking_site_dict.get('uid'),
+                    message=f'validation error for {parking_site_dict}: {e.to_dict()}',
                 )
+                continue
 
-        return parking_site_inputs, parking_site_errors
+            yield realtime_parking_site_input
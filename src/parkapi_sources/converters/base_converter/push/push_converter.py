@@ -9,4 +9,7 @@ from parkapi_sources.converters import BaseConverter
 
 
 class PushConverter(BaseConverter, ABC):
-    pass
+    """
+    Besides the list based `handle_*` methods, push converters offer streaming `iter_*` methods, which yield inputs
+    and exceptions one at a time. By default, they just wrap the list based methods.
+    """
@@ -4,9 +4,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator
 
-from openpyxl.cell import Cell
-from openpyxl.workbook import Workbook
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.push import PushConverter
@@ -19,6 +18,10 @@ from parkapi_sources.models import (
     StaticParkingSiteInput,
 )
 
+if TYPE_CHECKING:
+    from openpyxl.cell import Cell
+    from openpyxl.workbook import Workbook
+
 
 class XlsxConverter(PushConverter, ABC):
     static_parking_site_validator = DataclassValidator(ExcelStaticParkingSiteInput)
@@ -30,11 +33,19 @@ class XlsxConverter(PushConverter, ABC):
     @abstractmethod
     def handle_xlsx(
         self,
-        workbook: Workbook,
+        workbook: 'Workbook',
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
 
-    def get_mapping_by_header(self, row: tuple[Cell, ...]) -> dict[str, int]:
+    def iter_xlsx(
+        self,
+        workbook: 'Workbook',
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        parking_site_inputs, import_parking_site_exceptions = self.handle_xlsx(workbook)
+        yield from parking_site_inputs
+        yield from import_parking_site_exceptions
+
+    def get_mapping_by_header(self, row: tuple['Cell', ...]) -> dict[str, int]:
         row_values = [cell.value.replace('\n', '') if cell.value else cell.value for cell in row]
 
         mapping: dict[str, int] = {}
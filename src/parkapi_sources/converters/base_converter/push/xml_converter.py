@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from lxml.etree import Element
 
@@ -22,3 +23,11 @@ class XmlConverter(PushConverter, ABC):
         root: Element,
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
+
+    def iter_xml(
+        self,
+        root: Element,
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        parking_site_inputs, import_parking_site_exceptions = self.handle_xml(root)
+        yield from parking_site_inputs
+        yield from import_parking_site_exceptions
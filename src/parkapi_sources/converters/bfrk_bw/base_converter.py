@@ -4,7 +4,9 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
 
+from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -26,23 +28,60 @@ class BfrkBasePushConverter(ParkingSitePullConverter, ABC):
     def source_url_config_key(self) -> str:
         pass
 
+    @property
+    @abstractmethod
+    def filter_unconfirmed_config_key(self) -> str:
+        pass
+
     def check_ignore_item(self, input_data: BfrkBaseInput) -> bool:
         return False
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
-        static_parking_site_errors: list[ImportParkingSiteException] = []
+        response = self._get_response()
 
-        source_url = self.config_helper.get(self.source_url_config_key, self.source_info.source_url)
-        response = self.request_get(url=source_url, timeout=300)
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self.split_inputs_and_exceptions(self._iter_static_parking_sites(response.json())),
+            # check_ignore_item depends on this config value
+            key_data=self.config_helper.get(self.filter_unconfirmed_config_key, True),
+        )
+
+    def iter_static_parking_sites(self) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        # Cached results are stored as lists anyway
+        if self._get_static_result_cache() is not None:
+            yield from super().iter_static_parking_sites()
+            return
 
-        input_dicts = response.json()
+        yield from self._iter_static_parking_sites(self._get_response().json())
+
+    def _get_response(self) -> Response:
+        source_url = self.config_helper.get(self.source_url_config_key, self.source_info.source_url)
+        return self.request_get(url=source_url, timeout=300, http_cache=True)
+
+    def _iter_static_parking_sites(
+        self,
+        input_dicts: list[dict],
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        return self.iter_apply_static_patches(self._iter_unpatched_static_parking_sites(input_dicts))
+
+    def _iter_unpatched_static_parking_sites(
+        self,
+        input_dicts: list[dict],
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        return self.iter_validate_records(input_dicts, self._validate_input_dicts)
+
+    def _validate_input_dicts(
+        self,
+        input_dicts: Sequence[dict],
+    ) -> list[StaticParkingSiteInput | ImportParkingSiteException]:
+        results: list[StaticParkingSiteInput | ImportParkingSiteException] = []
 
         for input_dict in input_dicts:
             try:
                 input_data: BfrkBaseInput = self.bfrk_validator.validate(input_dict)
             except ValidationError as e:
-                static_parking_site_errors.append(
+                results.append(
                     ImportParkingSiteException(
                         source_uid=self.source_info.uid,
                         parking_site_uid=input_dict.get('infraid'),
@@ -55,9 +94,9 @@ class BfrkBasePushConverter(ParkingSitePullConverter, ABC):
             if self.check_ignore_item(input_data):
                 continue
 
-            static_parking_site_inputs.append(input_data.to_static_parking_site_input())
+            results.append(input_data.to_static_parking_site_input())
 
-        return self.apply_static_patches(static_parking_site_inputs), static_parking_site_errors
+        return results
 
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []
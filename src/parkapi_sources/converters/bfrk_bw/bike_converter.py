@@ -14,6 +14,7 @@ from .bike_models import BfrkBikeInput
 class BfrkBwBikePushConverter(BfrkBasePushConverter):
     bfrk_validator = DataclassValidator(BfrkBikeInput)
     source_url_config_key = 'PARK_API_BFRK_BW_BIKE_OVERRIDE_SOURCE_URL'
+    filter_unconfirmed_config_key = 'PARK_API_BFRK_BW_BIKE_FILTER_UNCONFIRMED'
 
     source_info = SourceInfo(
         uid='bfrk_bw_bike',
@@ -27,7 +28,7 @@ class BfrkBwBikePushConverter(BfrkBasePushConverter):
         if input_data.stellplatzanzahl == 0:
             return True
 
-        if self.config_helper.get('PARK_API_BFRK_BW_BIKE_FILTER_UNCONFIRMED', True) is False:
+        if self.config_helper.get(self.filter_unconfirmed_config_key, True) is False:
             return False
 
         return input_data.koordinatenqualitaet != 'validierte-Position'
@@ -3,6 +3,8 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Iterator, Sequence
+
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -17,6 +19,7 @@ from .car_models import BfrkCarInput
 class BfrkBwCarPullConverter(BfrkBasePushConverter, ParkingSpotPullConverter):
     bfrk_validator = DataclassValidator(BfrkCarInput)
     source_url_config_key = 'PARK_API_BFRK_BW_CAR_OVERRIDE_SOURCE_URL'
+    filter_unconfirmed_config_key = 'PARK_API_BFRK_BW_CAR_FILTER_UNCONFIRMED'
 
     source_info = SourceInfo(
         uid='bfrk_bw_car',
@@ -33,25 +36,45 @@ class BfrkBwCarPullConverter(BfrkBasePushConverter, ParkingSpotPullConverter):
         if input_data.stellplaetzegesamt == 0:
             return True
 
-        if self.config_helper.get('PARK_API_BFRK_BW_CAR_FILTER_UNCONFIRMED', True) is False:
+        if self.config_helper.get(self.filter_unconfirmed_config_key, True) is False:
             return False
 
         return input_data.koordinatenqualitaet != 'validierte-Position'
 
     def get_static_parking_spots(self) -> tuple[list[StaticParkingSpotInput], list[ImportParkingSpotException]]:
-        static_parking_spot_inputs: list[StaticParkingSpotInput] = []
-        static_parking_spot_errors: list[ImportParkingSpotException] = []
-
-        source_url = self.config_helper.get(self.source_url_config_key, self.source_info.source_url)
-        response = self.request_get(url=source_url, timeout=300)
-
-        input_dicts = response.json()
+        response = self._get_response()
+
+        return self.get_cached_static_result(
+            'parking_spots',
+            response.content,
+            lambda: self.split_inputs_and_exceptions(self._iter_static_parking_spots(response.json())),
+        )
+
+    def iter_static_parking_spots(self) -> Iterator[StaticParkingSpotInput | ImportParkingSpotException]:
+        # Cached results are stored as lists anyway
+        if self._get_static_result_cache() is not None:
+            yield from super().iter_static_parking_spots()
+            return
+
+        yield from self._iter_static_parking_spots(self._get_response().json())
+
+    def _iter_static_parking_spots(
+        self,
+        input_dicts: list[dict],
+    ) -> Iterator[StaticParkingSpotInput | ImportParkingSpotException]:
+        return self.iter_validate_records(input_dicts, self._validate_parking_spot_input_dicts)
+
+    def _validate_parking_spot_input_dicts(
+        self,
+        input_dicts: Sequence[dict],
+    ) -> list[StaticParkingSpotInput | ImportParkingSpotException]:
+        results: list[StaticParkingSpotInput | ImportParkingSpotException] = []
 
         for input_dict in input_dicts:
             try:
                 input_data: BfrkCarInput = self.bfrk_validator.validate(input_dict)
             except ValidationError as e:
-                static_parking_spot_errors.append(
+                results.append(
                     ImportParkingSpotException(
                         source_uid=self.source_info.uid,
                         parking_spot_uid=input_dict.get('infraid'),
@@ -67,6 +90,6 @@ class BfrkBwCarPullConverter(BfrkBasePushConverter, ParkingSpotPullConverter):
             if new_static_parking_spot_inputs is None:
                 continue
 
-            static_parking_spot_inputs += new_static_parking_spot_inputs
+            results += new_static_parking_spot_inputs
 
-        return static_parking_spot_inputs, static_parking_spot_errors
+        return results
@@ -0,0 +1,154 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from parkapi_sources.exceptions import MissingConverterException
+
+if TYPE_CHECKING:
+    from .base_converter import BaseConverter
+
+# Source uid to dotted import path of its converter class, relative to this package if it starts with a dot
+CONVERTER_PATHS: dict[str, str] = {
+    'aachen': '.aachen.AachenPullConverter',
+    'aalen': '.aalen.AalenPullConverter',
+    'apcoa': '.apcoa.ApcoaPullConverter',
+    'bahn_v2': '.bahn_v2.BahnV2PullConverter',
+    'basel': '.basel.BaselPullConverter',
+    'bb_parkhaus': '.bb_parkhaus.BBParkhausPushConverter',
+    'bfrk_bw_bike': '.bfrk_bw.BfrkBwBikePushConverter',
+    'bfrk_bw_car': '.bfrk_bw.BfrkBwCarPullConverter',
+    'bielefeld': '.bielefeld.BielefeldPullConverter',
+    'bietigheim_bissingen': '.bietigheim_bissingen.BietigheimBissingenPullConverter',
+    'buchen': '.mannheim_buchen.BuchenPushConverter',
+    'ellwangen': '.ellwangen.EllwangenPushConverter',
+    'ellwangen_sensit': '.ellwangen_sensit.EllwangenSensitPullConverter',
+    'esslingen': '.esslingen.EsslingenPushConverter',
+    'freiburg_disabled_sensors': '.freiburg_disabled_sensors.FreiburgDisabledSensorsPullConverter',
+    'freiburg_disabled_static': '.freiburg_disabled_static.FreiburgDisabledStaticPullConverter',
+    'freiburg_p_r_sensors': '.freiburg.FreiburgParkAndRideRealtimePullConverter',
+    'freiburg_p_r_static': '.freiburg.FreiburgParkAndRideStaticPullConverter',
+    'freiburg': '.freiburg.FreiburgPullConverter',
+    'freiburg_scanner': '.freiburg_scanner.FreiburgScannerPullConverter',
+    'freiburg_vag_bike': '.freiburg_vag_bike.FreiburgVAGBikePullConverter',
+    'friedrichshafen_easypark': '.friedrichshafen_easypark.FriedrichshafenEasyParkPushConverter',
+    'friedrichshafen_sensors': '.friedrichshafen_sensors.FriedrichshafenSensorsPullConverter',
+    'goldbeck': '.goldbeck.GoldbeckPushConverter',
+    'heidelberg_easypark': '.heidelberg_easypark.HeidelbergEasyParkPullConverter',
+    'heidelberg_disabled': '.heidelberg_disabled.HeidelbergDisabledPullConverter',
+    'heidelberg': '.heidelberg.HeidelbergPullConverter',
+    'heilbronn_goldbeck': '.heilbronn_goldbeck.HeilbronnGoldbeckPullConverter',
+    'herrenberg_bike': '.herrenberg_bike.HerrenbergBikePullConverter',
+    'herrenberg': '.herrenberg.HerrenbergPullConverter',
+    'huefner': '.huefner.HuefnerPushConverter',
+    'jena': '.jena.JenaPullConverter',
+    'karlsruhe_bike': '.karlsruhe.KarlsruheBikePullConverter',
+    'karlsruhe': '.karlsruhe.KarlsruhePullConverter',
+    'karlsruhe_disabled': '.karlsruhe_disabled.KarlsruheDisabledPullConverter',
+    'keltern': '.keltern.KelternPushConverter',
+    'kienzler_bike_and_ride': '.kienzler.KienzlerBikeAndRidePullConverter',
+    'kienzler_vvs': '.kienzler.KienzlerVVSPullConverter',
+    'kienzler_karlruhe': '.kienzler.KienzlerKarlsruhePullConverter',
+    'kienzler_neckarsulm': '.kienzler.KienzlerNeckarsulmPullConverter',
+    'kienzler_offenburg': '.kienzler.KienzlerOffenburgPullConverter',
+    'kienzler_rad_safe': '.kienzler.KienzlerRadSafePullConverter',
+    'kienzler_stuttgart': '.kienzler.KienzlerStuttgartPullConverter',
+    'kienzler_ulm': '.kienzler.KienzlerUlmPullConverter',
+    'kienzler_vrn': '.kienzler.KienzlerVrnPullConverter',
+    'konstanz_bike': '.konstanz_bike.KonstanzBikePullConverter',
+    'konstanz_disabled': '.konstanz_disabled.KonstanzDisabledPullConverter',
+    'konstanz': '.konstanz.KonstanzPullConverter',
+    'ladenburg_parkraumcheck': '.ladenburg_parkraumcheck.LadenburgParkraumcheckPushConverter',
+    'mannheim': '.mannheim_buchen.MannheimPushConverter',
+    'neckarsulm_bike': '.neckarsulm_bike.NeckarsulmBikePushConverter',
+    'neckarsulm': '.neckarsulm.NeckarsulmPushConverter',
+    'opendata_swiss': '.opendata_swiss.OpenDataSwissPullConverter',
+    'pbw': '.pbw.PbwPullConverter',
+    'pforzheim': '.pforzheim.PforzheimPushConverter',
+    'park_raum_check_kehl': '.park_raum_check.ParkRaumCheckKehlPushConverter',
+    'park_raum_check_sachsenheim': '.park_raum_check.ParkRaumCheckSachsenheimPushConverter',
+    'p_m_bw': '.p_m_bw.PMBWPullConverter',
+    'p_m_sensade': '.p_m_sensade.PMSensadePullConverter',
+    'pum_bw': '.pum_bw.PumBwPushConverter',
+    'radolfzell': '.radolfzell.RadolfzellPushConverter',
+    'radvis_bw': '.radvis_bw.RadvisBwPullConverter',
+    'reutlingen': '.reutlingen.ReutlingenPushConverter',
+    'reutlingen_bike': '.reutlingen_bike.ReutlingenBikePushConverter',
+    'reutlingen_disabled': '.reutlingen_disabled.ReutlingenDisabledPushConverter',
+    'stuttgart': '.stuttgart.StuttgartPushConverter',
+    'toll_collect': '.toll_collect.TollCollectPullConverter',
+    'ulm': '.ulm.UlmPullConverter',
+    'ulm_sensors': '.ulm_sensors.UlmSensorsPullConverter',
+    'vrn_p_r': '.vrn_p_r.VrnParkAndRidePullConverter',
+    'velobrix': '.velobrix.VelobrixPullConverter',
+    'vrs_bondorf': '.vrs.VrsBondorfPullConverter',
+    'vrs_kirchheim': '.vrs.VrsKirchheimPullConverter',
+    'vrs_neustadt': '.vrs.VrsNeustadtPullConverter',
+    'vrs-p-r': '.vrs_p_r.VrsParkAndRidePushConverter',
+    'vrs_vaihingen': '.vrs.VrsVaihingenPullConverter',
+}
+
+
+class ConverterRegistry:
+    """
+    Maps source uids to converter classes. Converter modules are imported when their class is requested for the first
+    time, so processes which need just some sources don't import all converters and their dependencies.
+    """
+
+    converter_paths: dict[str, str]
+    _converter_classes: dict[str, type['BaseConverter']]
+
+    def __init__(self, converter_paths: Optional[dict[str, str]] = None):
+        self.converter_paths = dict(CONVERTER_PATHS if converter_paths is None else converter_paths)
+        self._converter_classes = {}
+
+    @classmethod
+    def from_converter_classes(cls, converter_classes: Iterable[type['BaseConverter']]) -> 'ConverterRegistry':
+        """
+        Builds a registry of already imported converter classes, e.g. of a custom converter class list.
+        """
+        converter_registry = cls(converter_paths={})
+        for converter_class in converter_classes:
+            uid = converter_class.source_info.uid
+            converter_registry.converter_paths[uid] = f'{converter_class.__module__}.{converter_class.__qualname__}'
+            converter_registry._converter_classes[uid] = converter_class
+        return converter_registry
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self.converter_paths
+
+    @property
+    def uids(self) -> list[str]:
+        return list(self.converter_paths.keys())
+
+    def register(self, uid: str, converter_path: str) -> None:
+        self.converter_paths[uid] = converter_path
+        self._converter_classes.pop(uid, None)
+
+    def get_converter_class(self, uid: str) -> type['BaseConverter']:
+        converter_class = self._converter_classes.get(uid)
+        if converter_class is not None:
+            return converter_class
+
+        if uid not in self.converter_paths:
+            raise MissingConverterException(f'Converter {uid} does not exist.')
+
+        converter_class = self.import_converter_class(self.converter_paths[uid])
+        self._converter_classes[uid] = converter_class
+
+        return converter_class
+
+    def get_converter_classes(self) -> list[type['BaseConverter']]:
+        """
+        Imports all converters, so just use it if you really need all of them.
+        """
+        return [self.get_converter_class(uid) for uid in self.converter_paths]
+
+    @staticmethod
+    def import_converter_class(converter_path: str) -> type['BaseConverter']:
+        module_path, class_name = converter_path.rsplit('.', 1)
+        module = import_module(module_path, package=__package__ if module_path.startswith('.') else None)
+        return getattr(module, class_name)
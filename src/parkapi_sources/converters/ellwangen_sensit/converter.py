@@ -32,30 +32,53 @@ class EllwangenSensitPullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+        raw_parking_lot_inputs, import_parking_site_exceptions = self._get_raw_parking_lots()
+
+        return self._to_static_parking_site_inputs(raw_parking_lot_inputs), import_parking_site_exceptions
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        raw_parking_lot_inputs, import_parking_site_exceptions = self._get_raw_parking_lots()
 
+        return self._to_realtime_parking_site_inputs(raw_parking_lot_inputs), import_parking_site_exceptions
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         raw_parking_lot_inputs, import_parking_site_exceptions = self._get_raw_parking_lots()
 
+        return (
+            self._to_static_parking_site_inputs(raw_parking_lot_inputs),
+            self._to_realtime_parking_site_inputs(raw_parking_lot_inputs),
+            import_parking_site_exceptions,
+        )
+
+    def _to_static_parking_site_inputs(
+        self,
+        raw_parking_lot_inputs: list[EllwangenSensitParkingLotInput],
+    ) -> list[StaticParkingSiteInput]:
+        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+
         static_data_updated_at = datetime.now(tz=timezone.utc)
         for raw_parking_lot_input in raw_parking_lot_inputs:
             static_parking_site_inputs.append(
                 raw_parking_lot_input.to_static_parking_site_input(static_data_updated_at),
             )
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs)
 
-    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+    @staticmethod
+    def _to_realtime_parking_site_inputs(
+        raw_parking_lot_inputs: list[EllwangenSensitParkingLotInput],
+    ) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
 
-        raw_parking_lot_inputs, import_parking_site_exceptions = self._get_raw_parking_lots()
-
         realtime_data_updated_at = datetime.now(tz=timezone.utc)
         for raw_parking_lot_input in raw_parking_lot_inputs:
             realtime_parking_site_inputs.append(
                 raw_parking_lot_input.to_realtime_parking_site_input(realtime_data_updated_at),
             )
 
-        return realtime_parking_site_inputs, import_parking_site_exceptions
+        return realtime_parking_site_inputs
 
     def _get_raw_parking_lots(
         self,
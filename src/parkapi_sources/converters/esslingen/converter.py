@@ -3,7 +3,6 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import pyproj
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -11,6 +10,7 @@ from parkapi_sources.converters.base_converter import ParkingSiteBaseConverter
 from parkapi_sources.converters.base_converter.push import JsonConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import GeojsonInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import transform_utm32_geometries
 
 from .validator import EsslingenParkingSiteFeatureInput
 
@@ -23,7 +23,6 @@ class EsslingenPushConverter(JsonConverter, ParkingSiteBaseConverter):
     )
     geojson_validator = DataclassValidator(GeojsonInput)
     esslingen_parking_site_validator = DataclassValidator(EsslingenParkingSiteFeatureInput)
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
 
     def handle_json(self, data: dict | list) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         static_parking_sites: list[StaticParkingSiteInput] = []
@@ -31,14 +30,10 @@ class EsslingenPushConverter(JsonConverter, ParkingSiteBaseConverter):
 
         parking_sites_input: GeojsonInput = self.geojson_validator.validate(data)
 
+        esslingen_parking_site_inputs: list[EsslingenParkingSiteFeatureInput] = []
         for parking_site_dict in parking_sites_input.features:
             try:
-                esslingen_parking_site_input = self.esslingen_parking_site_validator.validate(parking_site_dict)
-                static_parking_site = esslingen_parking_site_input.to_static_parking_site()
-                if static_parking_site is None:
-                    continue
-                static_parking_sites.append(static_parking_site)
-
+                esslingen_parking_site_inputs.append(self.esslingen_parking_site_validator.validate(parking_site_dict))
             except ValidationError as e:
                 uid: str | None = parking_site_dict.get('properties', {}).get('fid')
                 parking_site_errors.append(
@@ -49,4 +44,15 @@ class EsslingenPushConverter(JsonConverter, ParkingSiteBaseConverter):
                     ),
                 )
 
+        # Geometries are delivered as UTM32, so they get reprojected for all features at once
+        geometries = transform_utm32_geometries(
+            [esslingen_parking_site_input.geometry for esslingen_parking_site_input in esslingen_parking_site_inputs],
+        )
+        for esslingen_parking_site_input, geometry in zip(esslingen_parking_site_inputs, geometries, strict=True):
+            esslingen_parking_site_input.geometry = geometry
+            static_parking_site = esslingen_parking_site_input.to_static_parking_site()
+            if static_parking_site is None:
+                continue
+            static_parking_sites.append(static_parking_site)
+
         return static_parking_sites, parking_site_errors
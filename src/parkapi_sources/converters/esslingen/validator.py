@@ -7,7 +7,6 @@ from datetime import date, datetime, time, timezone
 from enum import Enum
 from typing import Any
 
-import pyproj
 import shapely
 from shapely import GeometryType, LineString
 from validataclass.dataclasses import Default, validataclass
@@ -87,9 +86,9 @@ class EsslingenParkingSiteInput:
 class EsslingenParkingSiteFeatureInput:
     type: str = AnyOfValidator(allowed_values=['Feature'])
     properties: EsslingenParkingSiteInput = DataclassValidator(EsslingenParkingSiteInput)
+    # UTM32, the converter reprojects the geometries of all features at once
     geometry: LineString = GeoJSONGeometryValidator(
         allowed_geometry_types=[GeometryType.POLYGON],
-        projection=pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True),
     )
 
     def to_static_parking_site(self) -> StaticParkingSiteInput | None:
@@ -62,26 +62,57 @@ class FreiburgBasePullConverter(ParkingSitePullConverter, StaticGeojsonDataMixin
         return freiburg_inputs, import_parking_site_exceptions
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
         feature_inputs, import_parking_site_exceptions = self._get_raw_features()
 
+        static_parking_site_inputs, static_import_parking_site_exceptions = self._to_static_parking_site_inputs(
+            feature_inputs,
+        )
+
+        return static_parking_site_inputs, static_import_parking_site_exceptions + import_parking_site_exceptions
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        feature_inputs, import_parking_site_exceptions = self._get_raw_features()
+
+        return self._to_realtime_parking_site_inputs(feature_inputs), import_parking_site_exceptions
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        feature_inputs, import_parking_site_exceptions = self._get_raw_features()
+
+        static_parking_site_inputs, static_import_parking_site_exceptions = self._to_static_parking_site_inputs(
+            feature_inputs,
+        )
+
+        return (
+            static_parking_site_inputs,
+            self._to_realtime_parking_site_inputs(feature_inputs),
+            static_import_parking_site_exceptions + import_parking_site_exceptions,
+        )
+
+    def _to_static_parking_site_inputs(
+        self,
+        feature_inputs: list[FreiburgBaseFeatureInput],
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        static_parking_site_inputs: list[StaticParkingSiteInput] = []
         for feature_input in feature_inputs:
             static_parking_site_inputs.append(
                 feature_input.to_static_parking_site_input(),
             )
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs), []
 
-    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+    @staticmethod
+    def _to_realtime_parking_site_inputs(
+        feature_inputs: list[FreiburgBaseFeatureInput],
+    ) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
-        feature_inputs, import_parking_site_exceptions = self._get_raw_features()
-
         for feature_input in feature_inputs:
             realtime_parking_site_input = feature_input.to_realtime_parking_site_input()
             if realtime_parking_site_input is not None:
                 realtime_parking_site_inputs.append(realtime_parking_site_input)
 
-        return realtime_parking_site_inputs, import_parking_site_exceptions
+        return realtime_parking_site_inputs
 
 
 class FreiburgPullConverter(FreiburgBasePullConverter):
@@ -98,7 +129,11 @@ class FreiburgPullConverter(FreiburgBasePullConverter):
         has_realtime_data=True,
     )
 
-    def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+    def _to_static_parking_site_inputs(
+        self,
+        realtime_freiburg_inputs: list[FreiburgFeatureInput],
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        # The static data is based on the GeoJSON template, extended by the data of the WFS features
         static_parking_site_inputs, import_parking_site_exceptions = (
             self._get_static_parking_site_inputs_and_exceptions(
                 source_uid=self.source_info.uid,
@@ -106,10 +141,6 @@ class FreiburgPullConverter(FreiburgBasePullConverter):
             )
         )
 
-        realtime_freiburg_inputs: list[FreiburgFeatureInput]
-        realtime_freiburg_inputs, import_realtime_parking_site_exceptions = self._get_raw_features()
-        import_parking_site_exceptions += import_realtime_parking_site_exceptions
-
         static_parking_site_inputs_by_uid: dict[str, StaticParkingSiteInput] = {}
         for static_parking_site_input in static_parking_site_inputs:
             static_parking_site_inputs_by_uid[static_parking_site_input.uid] = static_parking_site_input
@@ -141,12 +172,12 @@ class FreiburgParkAndRideStaticPullConverter(FreiburgBasePullConverter):
         has_realtime_data=True,
     )
 
-    def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+    def _to_static_parking_site_inputs(
+        self,
+        freiburg_feature_inputs: list[FreiburgParkAndRideStaticFeatureInput],
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
 
-        freiburg_feature_inputs: list[FreiburgParkAndRideStaticFeatureInput]
-        freiburg_feature_inputs, import_parking_site_exceptions = self._get_raw_features()
-
         for feature_input in freiburg_feature_inputs:
             if feature_input.properties.kategorie.value != 'Park&Ride':
                 continue
@@ -155,7 +186,7 @@ class FreiburgParkAndRideStaticPullConverter(FreiburgBasePullConverter):
                 feature_input.to_static_parking_site_input(),
             )
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs), []
 
 
 class FreiburgParkAndRideRealtimePullConverter(FreiburgBasePullConverter):
@@ -26,24 +26,45 @@ class FreiburgDisabledSensorsPullConverter(ParkingSpotPullConverter):
     )
 
     def get_static_parking_spots(self) -> tuple[list[StaticParkingSpotInput], list[ImportParkingSpotException]]:
-        static_parking_spot_inputs: list[StaticParkingSpotInput] = []
+        freiburg_inputs, import_parking_spot_exceptions = self._get_raw_parking_spots()
+
+        return self._to_static_parking_spot_inputs(freiburg_inputs), import_parking_spot_exceptions
+
+    def get_realtime_parking_spots(self) -> tuple[list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
+        freiburg_inputs, import_parking_spot_exceptions = self._get_raw_parking_spots()
 
+        return self._to_realtime_parking_spot_inputs(freiburg_inputs), import_parking_spot_exceptions
+
+    def get_parking_spots(
+        self,
+    ) -> tuple[list[StaticParkingSpotInput], list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
         freiburg_inputs, import_parking_spot_exceptions = self._get_raw_parking_spots()
 
+        return (
+            self._to_static_parking_spot_inputs(freiburg_inputs),
+            self._to_realtime_parking_spot_inputs(freiburg_inputs),
+            import_parking_spot_exceptions,
+        )
+
+    def _to_static_parking_spot_inputs(
+        self,
+        freiburg_inputs: list[FreiburgDisabledSensorFeatureInput],
+    ) -> list[StaticParkingSpotInput]:
+        static_parking_spot_inputs: list[StaticParkingSpotInput] = []
         for freiburg_input in freiburg_inputs:
             static_parking_spot_inputs.append(freiburg_input.to_static_parking_spot_input())
 
-        return self.apply_static_patches(static_parking_spot_inputs), import_parking_spot_exceptions
+        return self.apply_static_patches(static_parking_spot_inputs)
 
-    def get_realtime_parking_spots(self) -> tuple[list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
+    @staticmethod
+    def _to_realtime_parking_spot_inputs(
+        freiburg_inputs: list[FreiburgDisabledSensorFeatureInput],
+    ) -> list[RealtimeParkingSpotInput]:
         realtime_parking_spot_inputs: list[RealtimeParkingSpotInput] = []
-
-        freiburg_inputs, import_parking_spot_exceptions = self._get_raw_parking_spots()
-
         for freiburg_input in freiburg_inputs:
             realtime_parking_spot_inputs.append(freiburg_input.to_realtime_parking_spot_input())
 
-        return realtime_parking_spot_inputs, import_parking_spot_exceptions
+        return realtime_parking_spot_inputs
 
     def _get_raw_parking_spots(
         self,
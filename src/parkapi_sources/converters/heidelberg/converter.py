@@ -29,26 +29,42 @@ class HeidelbergPullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+        heidelberg_inputs, import_parking_site_exceptions = self._get_data()
+
+        return self._to_static_parking_site_inputs(heidelberg_inputs), import_parking_site_exceptions
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        heidelberg_inputs, import_parking_site_exceptions = self._get_data()
+
+        return self._to_realtime_parking_site_inputs(heidelberg_inputs), import_parking_site_exceptions
 
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         heidelberg_inputs, import_parking_site_exceptions = self._get_data()
 
+        return (
+            self._to_static_parking_site_inputs(heidelberg_inputs),
+            self._to_realtime_parking_site_inputs(heidelberg_inputs),
+            import_parking_site_exceptions,
+        )
+
+    def _to_static_parking_site_inputs(self, heidelberg_inputs: list[HeidelbergInput]) -> list[StaticParkingSiteInput]:
+        static_parking_site_inputs: list[StaticParkingSiteInput] = []
         for heidelberg_input in heidelberg_inputs:
             static_parking_site_inputs.append(heidelberg_input.to_static_parking_site())
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs)
 
-    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+    @staticmethod
+    def _to_realtime_parking_site_inputs(heidelberg_inputs: list[HeidelbergInput]) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
-
-        heidelberg_inputs, import_parking_site_exceptions = self._get_data()
-
         for heidelberg_input in heidelberg_inputs:
             if heidelberg_input.availableSpotNumber is None:
                 continue
             realtime_parking_site_inputs.append(heidelberg_input.to_realtime_parking_site_input())
 
-        return realtime_parking_site_inputs, import_parking_site_exceptions
+        return realtime_parking_site_inputs
 
     def _get_data(self) -> tuple[list[HeidelbergInput], list[ImportParkingSiteException]]:
         heidelberg_inputs: list[HeidelbergInput] = []
@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from datetime import datetime, timezone
+from typing import Sequence
 
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
@@ -11,6 +12,7 @@ from validataclass.validators import DataclassValidator
 from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import GeojsonInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import transform_utm32_geometries
 
 from .validator import HeidelbergEasyParkParkingSiteInput
 
@@ -27,29 +29,50 @@ class HeidelbergEasyParkPullConverter(ParkingSitePullConverter):
     heidelberg_parking_site_validator = DataclassValidator(HeidelbergEasyParkParkingSiteInput)
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_sites: list[StaticParkingSiteInput] = []
-        parking_site_errors: list[ImportParkingSiteException] = []
-
-        static_data_updated_at = datetime.now(timezone.utc)
         response = self.request_get(
             url=self.source_info.source_url,
+            http_cache=True,
+        )
+
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self._transform_static_parking_sites(response.json()),
+        )
+
+    def _transform_static_parking_sites(
+        self,
+        response_data: dict,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        parking_sites_input: GeojsonInput = self.geojson_validator.validate(response_data)
+
+        static_parking_sites, parking_site_errors = self.split_inputs_and_exceptions(
+            self.iter_validate_records(
+                parking_sites_input.features,
+                self._validate_parking_site_dicts,
+                # All chunks get the same timestamp, even if they are validated in different processes
+                chunk_kwargs={'static_data_updated_at': datetime.now(timezone.utc)},
+            ),
         )
 
-        parking_sites_input: GeojsonInput = self.geojson_validator.validate(response.json())
+        return self.apply_static_patches(static_parking_sites), parking_site_errors
+
+    def _validate_parking_site_dicts(
+        self,
+        parking_site_dicts: Sequence[dict],
+        static_data_updated_at: datetime,
+    ) -> list[StaticParkingSiteInput | ImportParkingSiteException]:
+        results: list[StaticParkingSiteInput | ImportParkingSiteException] = []
 
-        for parking_site_dict in parking_sites_input.features:
+        heidelberg_parking_site_inputs: list[HeidelbergEasyParkParkingSiteInput] = []
+        for parking_site_dict in parking_site_dicts:
             try:
-                heidelberg_parking_site_input = self.heidelberg_parking_site_validator.validate(parking_site_dict)
-                static_parking_site = heidelberg_parking_site_input.to_static_parking_site(
-                    static_data_updated_at=static_data_updated_at,
+                heidelberg_parking_site_inputs.append(
+                    self.heidelberg_parking_site_validator.validate(parking_site_dict)
                 )
-                if static_parking_site is None:
-                    continue
-                static_parking_sites.append(static_parking_site)
-
             except ValidationError as e:
                 uid: str | None = parking_site_dict.get('properties', {}).get('Segment')
-                parking_site_errors.append(
+                results.append(
                     ImportParkingSiteException(
                         source_uid=self.source_info.uid,
                         parking_site_uid=str(uid) if uid else None,
@@ -57,4 +80,20 @@ class HeidelbergEasyParkPullConverter(ParkingSitePullConverter):
                     ),
                 )
 
-        return self.apply_static_patches(static_parking_sites), parking_site_errors
+        # Geometries are delivered as UTM32, so they get reprojected for all features of the chunk at once
+        geometries = transform_utm32_geometries(
+            [
+                heidelberg_parking_site_input.geometry
+                for heidelberg_parking_site_input in heidelberg_parking_site_inputs
+            ],
+        )
+        for heidelberg_parking_site_input, geometry in zip(heidelberg_parking_site_inputs, geometries, strict=True):
+            heidelberg_parking_site_input.geometry = geometry
+            static_parking_site = heidelberg_parking_site_input.to_static_parking_site(
+                static_data_updated_at=static_data_updated_at,
+            )
+            if static_parking_site is None:
+                continue
+            results.append(static_parking_site)
+
+        return results
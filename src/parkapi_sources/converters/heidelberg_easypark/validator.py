@@ -7,7 +7,6 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-import pyproj
 import shapely
 from shapely import GeometryType, LineString
 from validataclass.dataclasses import validataclass
@@ -94,9 +93,9 @@ class HeidelbergEasyParkPropertiesInput:
 class HeidelbergEasyParkParkingSiteInput:
     type: str = AnyOfValidator(allowed_values=['Feature'])
     properties: HeidelbergEasyParkPropertiesInput = DataclassValidator(HeidelbergEasyParkPropertiesInput)
+    # UTM32, the converter reprojects the geometries of all features at once
     geometry: LineString = GeoJSONGeometryValidator(
         allowed_geometry_types=[GeometryType.LINESTRING],
-        projection=pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True),
     )
 
     def to_static_parking_site(self, static_data_updated_at: datetime) -> StaticParkingSiteInput | None:
@@ -63,11 +63,16 @@ class KarlsruheBasePullConverter(ParkingSitePullConverter, ABC):
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         feature_inputs, import_parking_site_exceptions = self._get_feature_inputs()
 
+        return self._to_static_parking_site_inputs(feature_inputs), import_parking_site_exceptions
+
+    def _to_static_parking_site_inputs(
+        self, feature_inputs: list[KarlsruheFeatureInput]
+    ) -> list[StaticParkingSiteInput]:
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         for feature_input in feature_inputs:
             static_parking_site_inputs.append(feature_input.to_static_parking_site_input())
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs)
 
 
 class KarlsruhePullConverter(KarlsruheBasePullConverter):
@@ -95,13 +100,28 @@ class KarlsruhePullConverter(KarlsruheBasePullConverter):
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         feature_inputs, import_parking_site_exceptions = self._get_feature_inputs()
 
+        return self._to_realtime_parking_site_inputs(feature_inputs), import_parking_site_exceptions
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        feature_inputs, import_parking_site_exceptions = self._get_feature_inputs()
+
+        return (
+            self._to_static_parking_site_inputs(feature_inputs),
+            self._to_realtime_parking_site_inputs(feature_inputs),
+            import_parking_site_exceptions,
+        )
+
+    @staticmethod
+    def _to_realtime_parking_site_inputs(feature_inputs: list[KarlsruheFeatureInput]) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
         for feature_input in feature_inputs:
             realtime_parking_site_input = feature_input.to_realtime_parking_site_input()
             if realtime_parking_site_input is not None:
                 realtime_parking_site_inputs.append(realtime_parking_site_input)
 
-        return realtime_parking_site_inputs, import_parking_site_exceptions
+        return realtime_parking_site_inputs
 
 
 class KarlsruheBikePullConverter(KarlsruheBasePullConverter):
@@ -3,12 +3,20 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Iterator, Optional
+
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.pull import ParkingSpotPullConverter
 from parkapi_sources.exceptions import ImportParkingSpotException, ImportSourceException
-from parkapi_sources.models import GeojsonInput, RealtimeParkingSpotInput, SourceInfo, StaticParkingSpotInput
+from parkapi_sources.models import (
+    GeojsonInput,
+    RealtimeParkingSpotInput,
+    RealtimeParkingSpotRecord,
+    SourceInfo,
+    StaticParkingSpotInput,
+)
 
 from .models import KarlsruheDisabledFeatureInput, KarlsruheDisabledRealtimeInput, KarlsruheDisabledRealtimeItemInput
 
@@ -31,89 +39,139 @@ class KarlsruheDisabledPullConverter(ParkingSpotPullConverter):
         'https://mobil.trk.de/swkiot/tags/c9ac643f-aedd-4794-83fb-7b7337744480/devices?limit=99&last_readings=1'
         '&auth={auth}'
     )
+    # Has to match the limit in realtime_source_url, a page with less devices is the last one
+    realtime_page_size: int = 99
 
     def get_static_parking_spots(self) -> tuple[list[StaticParkingSpotInput], list[ImportParkingSpotException]]:
-        static_parking_spot_inputs: list[StaticParkingSpotInput] = []
-        import_parking_spot_exceptions: list[ImportParkingSpotException] = []
-
-        features_data = self._get_static_data()
+        karlsruhe_inputs, import_parking_spot_exceptions = self._get_feature_inputs()
 
-        realtime_parking_spot_uids: list[str] = []
+        realtime_parking_spot_uids: set[str] = set()
         try:
-            realtime_parking_spot_inputs, _ = self.get_realtime_parking_spots()
-            realtime_parking_spot_uids: list[str] = [item.uid for item in realtime_parking_spot_inputs]
+            realtime_parking_spot_records, _ = self._get_realtime_parking_spot_records(
+                self._get_parking_spot_uids_by_sensor_uid(karlsruhe_inputs),
+            )
+            realtime_parking_spot_uids = {item.uid for item in realtime_parking_spot_records}
         except ImportSourceException:
             ...
 
-        for update_dict in features_data.features:
-            try:
-                karlsruhe_input: KarlsruheDisabledFeatureInput = self.geojson_feature_validator.validate(update_dict)
-                static_parking_spot_inputs += karlsruhe_input.to_static_parking_spot_inputs(
-                    realtime_parking_spot_uids=realtime_parking_spot_uids,
-                )
-            except ValidationError as e:
-                import_parking_spot_exceptions.append(
-                    ImportParkingSpotException(
-                        source_uid=self.source_info.uid,
-                        parking_spot_uid=update_dict.get('properties', {}).get('id'),
-                        message=f'Invalid data at uid {update_dict.get("properties", {}).get("id")}: '
-                        f'{e.to_dict()}, data: {update_dict}',
-                    ),
-                )
-                continue
+        return (
+            self._to_static_parking_spot_inputs(karlsruhe_inputs, realtime_parking_spot_uids),
+            import_parking_spot_exceptions,
+        )
+
+    def get_realtime_parking_spots(self) -> tuple[list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
+        realtime_parking_spot_records, import_parking_spot_exceptions = self.get_realtime_parking_spot_records()
+
+        return [item.to_input() for item in realtime_parking_spot_records], import_parking_spot_exceptions
+
+    def get_realtime_parking_spot_records(
+        self,
+    ) -> tuple[list[RealtimeParkingSpotRecord], list[ImportParkingSpotException]]:
+        """
+        Sensor data is polled often, so records are built directly from the validated sensor data, and inputs just on
+        demand.
+        """
+        if self.config_helper.get('PARK_API_KARLSRUHE_DISABLED_AUTH') is None:
+            return [], []
 
-        return self.apply_static_patches(static_parking_spot_inputs), import_parking_spot_exceptions
+        karlsruhe_inputs, _ = self._get_feature_inputs()
+
+        return self._get_realtime_parking_spot_records(self._get_parking_spot_uids_by_sensor_uid(karlsruhe_inputs))
+
+    def get_parking_spots(
+        self,
+    ) -> tuple[list[StaticParkingSpotInput], list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
+        """
+        Fetches the features and the sensor data just once for static and realtime data. Like at
+        `get_static_parking_spots()`, static data is returned even if the sensor data cannot be fetched. Then, the spots
+        have no realtime data, and the error is reported as exception without parking spot uid.
+        """
+        karlsruhe_inputs, static_import_parking_spot_exceptions = self._get_feature_inputs()
+
+        try:
+            realtime_parking_spot_records, realtime_import_parking_spot_exceptions = (
+                self._get_realtime_parking_spot_records(self._get_parking_spot_uids_by_sensor_uid(karlsruhe_inputs))
+            )
+        except ImportSourceException as e:
+            realtime_parking_spot_records = []
+            realtime_import_parking_spot_exceptions = [
+                ImportParkingSpotException(source_uid=self.source_info.uid, message=e.message, data=e.data),
+            ]
+        realtime_parking_spot_uids: set[str] = {item.uid for item in realtime_parking_spot_records}
+
+        return (
+            self._to_static_parking_spot_inputs(karlsruhe_inputs, realtime_parking_spot_uids),
+            [item.to_input() for item in realtime_parking_spot_records],
+            static_import_parking_spot_exceptions + realtime_import_parking_spot_exceptions,
+        )
+
+    def _get_feature_inputs(self) -> tuple[list[KarlsruheDisabledFeatureInput], list[ImportParkingSpotException]]:
+        karlsruhe_inputs: list[KarlsruheDisabledFeatureInput] = []
+        import_parking_spot_exceptions: list[ImportParkingSpotException] = []
 
-    def _get_static_data(self) -> GeojsonInput:
         response = self.request_get(url=self.source_info.source_url)
         response_data = response.json()
 
         try:
-            return self.geojson_validator.validate(response_data)
+            features_data: GeojsonInput = self.geojson_validator.validate(response_data)
         except ValidationError as e:
             raise ImportSourceException(
                 source_uid=self.source_info.uid,
                 message=f'Invalid input at source {self.source_info.uid}: {e.to_dict()}, data: {response_data}',
             ) from e
 
-    def get_realtime_parking_spots(self) -> tuple[list[RealtimeParkingSpotInput], list[ImportParkingSpotException]]:
-        if (auth := self.config_helper.get('PARK_API_KARLSRUHE_DISABLED_AUTH')) is None:
-            return [], []
-        features_data = self._get_static_data()
-
-        sensors_by_uid: dict[str, str] = {}
         for update_dict in features_data.features:
             try:
-                karlsruhe_input: KarlsruheDisabledFeatureInput = self.geojson_feature_validator.validate(update_dict)
-            except ValidationError:
-                # No error handling here, as we just need it for mapping purposes
-                continue
+                karlsruhe_inputs.append(self.geojson_feature_validator.validate(update_dict))
+            except ValidationError as e:
+                import_parking_spot_exceptions.append(
+                    ImportParkingSpotException(
+                        source_uid=self.source_info.uid,
+                        parking_spot_uid=update_dict.get('properties', {}).get('id'),
+                        message=f'Invalid data at uid {update_dict.get("properties", {}).get("id")}: '
+                        f'{e.to_dict()}, data: {update_dict}',
+                    ),
+                )
+
+        return karlsruhe_inputs, import_parking_spot_exceptions
+
+    @staticmethod
+    def _get_parking_spot_uids_by_sensor_uid(karlsruhe_inputs: list[KarlsruheDisabledFeatureInput]) -> dict[str, str]:
+        parking_spot_uids_by_sensor_uid: dict[str, str] = {}
+        for karlsruhe_input in karlsruhe_inputs:
             if karlsruhe_input.properties.sensorenliste is None:
                 continue
             for i, sensor_uid in enumerate(karlsruhe_input.properties.sensorenliste):
-                sensors_by_uid[sensor_uid] = f'{karlsruhe_input.properties.id}_{i}'
+                parking_spot_uids_by_sensor_uid[sensor_uid] = f'{karlsruhe_input.properties.id}_{i}'
 
-        response = self.request_get(url=self.realtime_source_url.format(auth=auth))
-        try:
-            realtime_body: KarlsruheDisabledRealtimeInput = self.realtime_validator.validate(response.json())
-        except ValidationError as e:
-            raise ImportSourceException(
-                source_uid=self.source_info.uid,
-                message=f'Invalid input at source {self.source_info.uid}: {e.to_dict()}, data: {response.content.decode()}',
-            ) from e
+        return parking_spot_uids_by_sensor_uid
 
-        realtime_parking_spot_inputs: list[RealtimeParkingSpotInput] = []
+    def _to_static_parking_spot_inputs(
+        self,
+        karlsruhe_inputs: list[KarlsruheDisabledFeatureInput],
+        realtime_parking_spot_uids: set[str],
+    ) -> list[StaticParkingSpotInput]:
+        static_parking_spot_inputs: list[StaticParkingSpotInput] = []
+        for karlsruhe_input in karlsruhe_inputs:
+            static_parking_spot_inputs += karlsruhe_input.to_static_parking_spot_inputs(
+                realtime_parking_spot_uids=realtime_parking_spot_uids,
+            )
+
+        return self.apply_static_patches(static_parking_spot_inputs)
+
+    def _get_realtime_parking_spot_records(
+        self,
+        parking_spot_uids_by_sensor_uid: dict[str, str],
+    ) -> tuple[list[RealtimeParkingSpotRecord], list[ImportParkingSpotException]]:
+        realtime_parking_spot_records: list[RealtimeParkingSpotRecord] = []
         import_parking_spot_exceptions: list[ImportParkingSpotException] = []
-        for realtime_dict in realtime_body.body:
+
+        if (auth := self.config_helper.get('PARK_API_KARLSRUHE_DISABLED_AUTH')) is None:
+            return realtime_parking_spot_records, import_parking_spot_exceptions
+
+        for realtime_dict in self._iter_realtime_dicts(auth):
             try:
                 realtime_item: KarlsruheDisabledRealtimeItemInput = self.realtime_item_validator.validate(realtime_dict)
-                if realtime_item.id not in sensors_by_uid:
-                    continue
-                realtime_parking_spot_inputs.append(
-                    realtime_item.to_realtime_parking_spot_input(
-                        sensors_by_uid[realtime_item.id],
-                    ),
-                )
             except ValidationError as e:
                 import_parking_spot_exceptions.append(
                     ImportParkingSpotException(
@@ -124,4 +182,43 @@ class KarlsruheDisabledPullConverter(ParkingSpotPullConverter):
                 )
                 continue
 
-        return realtime_parking_spot_inputs, import_parking_spot_exceptions
+            if realtime_item.id not in parking_spot_uids_by_sensor_uid:
+                continue
+
+            realtime_parking_spot_records.append(
+                realtime_item.to_realtime_parking_spot_record(parking_spot_uids_by_sensor_uid[realtime_item.id]),
+            )
+
+        return realtime_parking_spot_records, import_parking_spot_exceptions
+
+    def _iter_realtime_dicts(self, auth: str) -> Iterator[dict]:
+        """
+        Walks through all pages of the device endpoint, which returns up to realtime_page_size devices per request.
+        """
+        retrieve_after_id: Optional[str] = None
+        while True:
+            url = self.realtime_source_url.format(auth=auth)
+            if retrieve_after_id is not None:
+                url = f'{url}&retrieve_after={retrieve_after_id}'
+
+            response = self.request_get(url=url)
+            try:
+                realtime_body: KarlsruheDisabledRealtimeInput = self.realtime_validator.validate(response.json())
+            except ValidationError as e:
+                raise ImportSourceException(
+                    source_uid=self.source_info.uid,
+                    message=f'Invalid input at source {self.source_info.uid}: {e.to_dict()}, '
+                    f'data: {response.content.decode()}',
+                ) from e
+
+            if retrieve_after_id is None and len(realtime_body.body) == 0:
+                raise ImportSourceException(
+                    source_uid=self.source_info.uid,
+                    message=f'Invalid input at source {self.source_info.uid}: no devices in realtime data.',
+                )
+
+            yield from realtime_body.body
+
+            if len(realtime_body.body) < self.realtime_page_size or realtime_body.retrieve_after_id is None:
+                return
+            retrieve_after_id = realtime_body.retrieve_after_id
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from enum import Enum
 
 from shapely import GeometryType, Point
-from validataclass.dataclasses import validataclass
+from validataclass.dataclasses import Default, validataclass
 from validataclass.validators import (
     AnythingValidator,
     DataclassValidator,
@@ -25,7 +25,7 @@ from parkapi_sources.models import (
     ParkingSpotRestrictionInput,
     ParkingSpotStatus,
     PurposeType,
-    RealtimeParkingSpotInput,
+    RealtimeParkingSpotRecord,
     StaticParkingSpotInput,
 )
 from parkapi_sources.util import generate_point, round_7d
@@ -62,7 +62,7 @@ class KarlsruheDisabledFeatureInput(GeojsonBaseFeatureInput):
     properties: KarlsruheDisabledPropertiesInput = DataclassValidator(KarlsruheDisabledPropertiesInput)
     geometry: Point = GeoJSONGeometryValidator(allowed_geometry_types=[GeometryType.POINT])
 
-    def to_static_parking_spot_inputs(self, realtime_parking_spot_uids: list[str]) -> list[StaticParkingSpotInput]:
+    def to_static_parking_spot_inputs(self, realtime_parking_spot_uids: set[str]) -> list[StaticParkingSpotInput]:
         static_parking_spot_inputs = []
 
         descriptions: list[str] = [
@@ -128,8 +128,8 @@ class KarlsruheDisabledRealtimeItemInput:
         DataclassValidator(KarlsruheDisabledRealtimeReadingInput), min_length=1
     )
 
-    def to_realtime_parking_spot_input(self, parking_spot_uid: str) -> RealtimeParkingSpotInput:
-        return RealtimeParkingSpotInput(
+    def to_realtime_parking_spot_record(self, parking_spot_uid: str) -> RealtimeParkingSpotRecord:
+        return RealtimeParkingSpotRecord(
             uid=parking_spot_uid,
             realtime_status=self.last_readings[0].data.parking_status.to_realtime_status(),
             realtime_data_updated_at=self.last_readings[0].measured_at,
@@ -138,4 +138,6 @@ class KarlsruheDisabledRealtimeItemInput:
 
 @validataclass
 class KarlsruheDisabledRealtimeInput:
-    body: list[dict] = ListValidator(AnythingValidator(allowed_types=dict), min_length=1)
+    # Pages after the first one can be empty if the amount of devices is a multiple of the page size
+    body: list[dict] = ListValidator(AnythingValidator(allowed_types=dict))
+    retrieve_after_id: str | None = Noneable(StringValidator()), Default(None)
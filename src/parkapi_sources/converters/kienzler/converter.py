@@ -35,22 +35,42 @@ class KienzlerBasePullConverter(ParkingSitePullConverter):
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         kienzler_parking_sites, static_parking_site_errors = self._get_kienzler_parking_sites()
 
+        return self._to_static_parking_site_inputs(kienzler_parking_sites), static_parking_site_errors
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        kienzler_parking_sites, static_parking_site_errors = self._get_kienzler_parking_sites()
+
+        return self._to_realtime_parking_site_inputs(kienzler_parking_sites), static_parking_site_errors
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        kienzler_parking_sites, static_parking_site_errors = self._get_kienzler_parking_sites()
+
+        return (
+            self._to_static_parking_site_inputs(kienzler_parking_sites),
+            self._to_realtime_parking_site_inputs(kienzler_parking_sites),
+            static_parking_site_errors,
+        )
+
+    def _to_static_parking_site_inputs(
+        self, kienzler_parking_sites: list[KienzlerInput]
+    ) -> list[StaticParkingSiteInput]:
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         for kienzler_parking_site in kienzler_parking_sites:
             static_parking_site_inputs.append(
                 kienzler_parking_site.to_static_parking_site(self.source_info.public_url),
             )
 
-        return self.apply_static_patches(static_parking_site_inputs), static_parking_site_errors
+        return self.apply_static_patches(static_parking_site_inputs)
 
-    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+    @staticmethod
+    def _to_realtime_parking_site_inputs(kienzler_parking_sites: list[KienzlerInput]) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
-
-        kienzler_parking_sites, static_parking_site_errors = self._get_kienzler_parking_sites()
         for kienzler_parking_site in kienzler_parking_sites:
             realtime_parking_site_inputs.append(kienzler_parking_site.to_realtime_parking_site())
 
-        return realtime_parking_site_inputs, static_parking_site_errors
+        return realtime_parking_site_inputs
 
     def _get_kienzler_parking_sites(self) -> tuple[list[KienzlerInput], list[ImportParkingSiteException]]:
         kienzler_item_inputs: list[KienzlerInput] = []
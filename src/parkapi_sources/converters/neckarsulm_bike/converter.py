@@ -7,18 +7,16 @@ import csv
 from datetime import datetime, timezone
 from io import StringIO
 
-import pyproj
 from validataclass.exceptions import ValidationError
 
 from parkapi_sources.converters.base_converter import ParkingSiteBaseConverter
 from parkapi_sources.converters.base_converter.push import CsvConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import transform_utm32_coordinates
 
 
 class NeckarsulmBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
-
     source_info = SourceInfo(
         uid='neckarsulm_bike',
         name='Stadt Neckarsulm: Fahrrad-Abstellanlagen',
@@ -47,6 +45,7 @@ class NeckarsulmBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
         mapping: dict[str, int] = self.get_mapping_by_header(self.header_mapping, data[0])
+        input_dicts: list[dict[str, str]] = []
 
         # We start at row 2, as the first one is our header
         for row in data[1:]:
@@ -64,12 +63,21 @@ class NeckarsulmBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
             elif input_dict['additional_name']:
                 input_dict['name'] = input_dict['additional_name']
 
-            # Convert geo-coordinates
-            if input_dict['lat'] and input_dict['lon']:
-                coordinates = self.proj(float(input_dict['lon']), float(input_dict['lat']), inverse=True)
-                input_dict['lat'] = coordinates[1]
-                input_dict['lon'] = coordinates[0]
+            input_dicts.append(input_dict)
+
+        # Convert geo-coordinates for all rows at once
+        input_dicts_with_coordinates = [
+            input_dict for input_dict in input_dicts if input_dict['lat'] and input_dict['lon']
+        ]
+        longitudes, latitudes = transform_utm32_coordinates(
+            [float(input_dict['lon']) for input_dict in input_dicts_with_coordinates],
+            [float(input_dict['lat']) for input_dict in input_dicts_with_coordinates],
+        )
+        for input_dict, lon, lat in zip(input_dicts_with_coordinates, longitudes, latitudes, strict=True):
+            input_dict['lat'] = lat
+            input_dict['lon'] = lon
 
+        for input_dict in input_dicts:
             try:
                 static_parking_site_inputs.append(self.static_parking_site_validator.validate(input_dict))
             except ValidationError as e:
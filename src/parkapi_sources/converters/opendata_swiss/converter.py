@@ -3,6 +3,8 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Sequence
+
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -27,26 +29,17 @@ class OpenDataSwissPullConverter(ParkingSitePullConverter):
         has_realtime_data=False,
     )
 
-    def _get_feature_inputs(self) -> tuple[list[OpenDataSwissFeatureInput], list[ImportParkingSiteException]]:
-        feature_inputs: list[OpenDataSwissFeatureInput] = []
-        import_parking_site_exceptions: list[ImportParkingSiteException] = []
-
-        response = self.request_get(url=self.source_info.source_url)
-        response_data = response.json()
+    def _validate_feature_dicts(
+        self,
+        feature_dicts: Sequence[dict],
+    ) -> list[StaticParkingSiteInput | ImportParkingSiteException]:
+        results: list[StaticParkingSiteInput | ImportParkingSiteException] = []
 
-        try:
-            geojson_input = self.geojson_validator.validate(response_data)
-        except ValidationError as e:
-            raise ImportSourceException(
-                source_uid=self.source_info.uid,
-                message=f'Invalid Input at source {self.source_info.uid}: {e.to_dict()}, data: {response_data}',
-            ) from e
-
-        for feature_dict in geojson_input.features:
+        for feature_dict in feature_dicts:
             try:
-                feature_input = self.opendata_swiss_feature_validator.validate(feature_dict)
+                feature_input: OpenDataSwissFeatureInput = self.opendata_swiss_feature_validator.validate(feature_dict)
             except ValidationError as e:
-                import_parking_site_exceptions.append(
+                results.append(
                     ImportParkingSiteException(
                         source_uid=self.source_info.uid,
                         parking_site_uid=feature_dict.get('id'),
@@ -55,16 +48,34 @@ class OpenDataSwissPullConverter(ParkingSitePullConverter):
                 )
                 continue
 
-            feature_inputs.append(feature_input)
+            results.append(feature_input.to_static_parking_site_input())
 
-        return feature_inputs, import_parking_site_exceptions
+        return results
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        feature_inputs, import_parking_site_exceptions = self._get_feature_inputs()
+        response = self.request_get(url=self.source_info.source_url, http_cache=True)
+
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self._transform_static_parking_sites(response.json()),
+        )
+
+    def _transform_static_parking_sites(
+        self,
+        response_data: dict,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        try:
+            geojson_input = self.geojson_validator.validate(response_data)
+        except ValidationError as e:
+            raise ImportSourceException(
+                source_uid=self.source_info.uid,
+                message=f'Invalid Input at source {self.source_info.uid}: {e.to_dict()}, data: {response_data}',
+            ) from e
 
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
-        for feature_input in feature_inputs:
-            static_parking_site_inputs.append(feature_input.to_static_parking_site_input())
+        static_parking_site_inputs, import_parking_site_exceptions = self.split_inputs_and_exceptions(
+            self.iter_validate_records(geojson_input.features, self._validate_feature_dicts),
+        )
 
         return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
 
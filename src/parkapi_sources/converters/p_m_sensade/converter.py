@@ -6,7 +6,11 @@ Use of this source code is governed by an MIT-style license that can be found in
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
-from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter, ParkingSpotPullConverter
+from parkapi_sources.converters.base_converter.pull import (
+    BearerTokenMixin,
+    ParkingSitePullConverter,
+    ParkingSpotPullConverter,
+)
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportParkingSpotException
 from parkapi_sources.models import (
     RealtimeParkingSiteInput,
@@ -25,7 +29,7 @@ from .validators import (
 )
 
 
-class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter):
+class PMSensadePullConverter(BearerTokenMixin, ParkingSitePullConverter, ParkingSpotPullConverter):
     required_config_keys = [
         'PARK_API_P_M_SENSADE_EMAIL',
         'PARK_API_P_M_SENSADE_PASSWORD',
@@ -111,15 +115,14 @@ class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter)
 
         sensade_parking_lots, import_sensade_parking_site_exceptions = self._get_sensade_parking_lots()
         import_parking_site_exceptions += import_sensade_parking_site_exceptions
-        parking_site_dicts: list[dict] = []
-
-        for sensade_parking_lot in sensade_parking_lots:
-            response = self.request_get(
-                url=f'{self.source_info.source_url}/parkinglot/parkinglot/{sensade_parking_lot.id}',
-                headers={'Authorization': f'Bearer {self._request_token()}'},
-                timeout=60,
-            )
-            parking_site_dicts.append(response.json()[0])
+        responses = self.request_get_all(
+            [
+                {'url': f'{self.source_info.source_url}/parkinglot/parkinglot/{sensade_parking_lot.id}', 'timeout': 60}
+                for sensade_parking_lot in sensade_parking_lots
+            ],
+            request_method=self.request_get_with_token,
+        )
+        parking_site_dicts: list[dict] = [response.json()[0] for response in responses]
 
         for parking_site_dict in parking_site_dicts:
             try:
@@ -143,15 +146,17 @@ class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter)
 
         sensade_parking_lots, import_sensade_parking_site_exceptions = self._get_sensade_parking_lots()
         import_parking_site_exceptions += import_sensade_parking_site_exceptions
-        parking_site_dicts: list[dict] = []
-
-        for sensade_parking_lot in sensade_parking_lots:
-            response = self.request_get(
-                url=f'{self.source_info.source_url}/parkinglot/parkinglot/getcurrentparkinglotstatus/{sensade_parking_lot.id}',
-                headers={'Authorization': f'Bearer {self._request_token()}'},
-                timeout=60,
-            )
-            parking_site_dicts.append(response.json())
+        responses = self.request_get_all(
+            [
+                {
+                    'url': f'{self.source_info.source_url}/parkinglot/parkinglot/getcurrentparkinglotstatus/{sensade_parking_lot.id}',
+                    'timeout': 60,
+                }
+                for sensade_parking_lot in sensade_parking_lots
+            ],
+            request_method=self.request_get_with_token,
+        )
+        parking_site_dicts: list[dict] = [response.json() for response in responses]
 
         for parking_site_dict in parking_site_dicts:
             try:
@@ -175,9 +180,8 @@ class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter)
         sensade_parking_lots: list[PMSensadeParkingLotInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
-        response = self.request_get(
+        response = self.request_get_with_token(
             url=f'{self.source_info.source_url}/parkinglot/parkinglot',
-            headers={'Authorization': f'Bearer {self._request_token()}'},
             timeout=60,
         )
 
@@ -208,7 +212,13 @@ class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter)
 
         return sensade_parking_lots, import_parking_site_exceptions
 
-    def _request_token(self) -> str:
+    def _get_token_credentials(self) -> tuple[str | None, ...]:
+        return (
+            self.config_helper.get('PARK_API_P_M_SENSADE_EMAIL'),
+            self.config_helper.get('PARK_API_P_M_SENSADE_PASSWORD'),
+        )
+
+    def _fetch_token(self) -> tuple[str, int | None]:
         response = self.request_post(
             url=f'{self.source_info.source_url}/auth/login',
             headers={
@@ -220,4 +230,5 @@ class PMSensadePullConverter(ParkingSitePullConverter, ParkingSpotPullConverter)
                 'password': self.config_helper.get('PARK_API_P_M_SENSADE_PASSWORD'),
             },
         )
-        return response.text
+        # Sensade returns the plain token without a lifetime, so the lifetime is taken from the token if possible
+        return response.text, None
@@ -5,12 +5,14 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from typing import Optional
 
+from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util.request_helper import RequestKwargs
 
 from .mapper import PbwMapper
 from .validation import PbwCityInput, PbwParkingSiteDetailInput, PbwParkingSiteInput, PbwRealtimeInput
@@ -38,10 +40,11 @@ class PbwPullConverter(ParkingSitePullConverter):
         city_dicts = self._get_remote_data('catalog-city')
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         static_parking_site_errors: list[ImportParkingSiteException] = []
+        city_inputs: list[PbwCityInput] = []
 
         for city_dict in city_dicts:
             try:
-                city_input: PbwCityInput = self.city_validator.validate(city_dict)
+                city_inputs.append(self.city_validator.validate(city_dict))
             except ValidationError as e:
                 static_parking_site_errors.append(
                     ImportParkingSiteException(
@@ -50,9 +53,14 @@ class PbwPullConverter(ParkingSitePullConverter):
                         message=f'validation error: {e.to_dict()}',
                     ),
                 )
-                continue
 
-            parking_site_detail_dicts = self._get_remote_data('object-by-city', city_input.id)
+        # Details are requested concurrently, as there is one request per city
+        responses = self.request_get_all(
+            [self._get_remote_data_request_kwargs('object-by-city', city_input.id) for city_input in city_inputs],
+        )
+
+        for city_input, response in zip(city_inputs, responses, strict=True):
+            parking_site_detail_dicts = self._response_to_items(response)
 
             for parking_site_detail_dict in parking_site_detail_dicts:
                 try:
@@ -101,6 +109,11 @@ class PbwPullConverter(ParkingSitePullConverter):
         return realtime_parking_site_inputs, realtime_parking_site_errors
 
     def _get_remote_data(self, data_type: str, data_id: Optional[int] = None) -> list[dict]:
+        response = self.request_get(**self._get_remote_data_request_kwargs(data_type, data_id))
+
+        return self._response_to_items(response)
+
+    def _get_remote_data_request_kwargs(self, data_type: str, data_id: Optional[int] = None) -> RequestKwargs:
         parameters = {
             'format': 'json',
             'key': self.config_helper.get('PARK_API_PBW_API_KEY'),
@@ -109,7 +122,10 @@ class PbwPullConverter(ParkingSitePullConverter):
         if data_id is not None:
             parameters['id'] = data_id
 
-        response = self.request_get(url=self._base_url, params=parameters, timeout=60)
+        return {'url': self._base_url, 'params': parameters, 'timeout': 60}
+
+    @staticmethod
+    def _response_to_items(response: Response) -> list[dict]:
         result_dict: dict = response.json()
 
         items: list[dict] = []
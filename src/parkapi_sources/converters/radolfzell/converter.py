@@ -5,7 +5,6 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from datetime import datetime, timezone
 
-import pyproj
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -13,6 +12,7 @@ from parkapi_sources.converters.base_converter import ParkingSiteBaseConverter
 from parkapi_sources.converters.base_converter.push import JsonConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import GeojsonInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import reproject_utm32_lat_lon
 
 from .validator import RadolfzellParkingSiteInput
 
@@ -25,7 +25,6 @@ class RadolfzellPushConverter(JsonConverter, ParkingSiteBaseConverter):
     )
     geojson_validator = DataclassValidator(GeojsonInput)
     radolfzell_validator = DataclassValidator(RadolfzellParkingSiteInput)
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
 
     def handle_json(self, data: dict | list) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         static_parking_sites: list[StaticParkingSiteInput] = []
@@ -46,9 +45,8 @@ class RadolfzellPushConverter(JsonConverter, ParkingSiteBaseConverter):
                 radolfzell_parking_site_input = self.radolfzell_validator.validate(
                     parking_site_dict,
                 )
-                static_parking_site = radolfzell_parking_site_input.to_static_parking_site(
+                static_parking_site = radolfzell_parking_site_input.to_utm32_static_parking_site(
                     static_data_updated_at=static_data_updated_at,
-                    proj=self.proj,
                 )
                 if static_parking_site is None:
                     continue
@@ -65,4 +63,6 @@ class RadolfzellPushConverter(JsonConverter, ParkingSiteBaseConverter):
                     ),
                 )
 
+        reproject_utm32_lat_lon(static_parking_sites)
+
         return static_parking_sites, parking_site_errors
@@ -7,7 +7,6 @@ from datetime import datetime, time
 from enum import Enum
 from typing import Any
 
-import pyproj
 from isodate import Duration
 from shapely import GeometryType, LineString
 from validataclass.dataclasses import validataclass
@@ -36,7 +35,6 @@ from parkapi_sources.models.enums import (
     ParkingType,
     PurposeType,
 )
-from parkapi_sources.util import round_7d
 from parkapi_sources.validators import (
     GeoJSONGeometryValidator,
     IsoDurationValidator,
@@ -154,20 +152,14 @@ class RadolfzellParkingSiteInput:
         allowed_geometry_types=[GeometryType.MULTILINESTRING, GeometryType.LINESTRING],
     )
 
-    def to_static_parking_site(
-        self,
-        static_data_updated_at: datetime,
-        proj: pyproj.Proj,
-    ) -> StaticParkingSiteInput | None:
+    def to_utm32_static_parking_site(self, static_data_updated_at: datetime) -> StaticParkingSiteInput | None:
+        """
+        Returns a static parking site input which still has the UTM32 coordinates at lat and lon, so it can be
+        reprojected as a batch.
+        """
         if self.properties.Regelung in [RadolfzellProperty.FORBIDDEN, RadolfzellProperty.FORBIDDEN_TOO_NARROW]:
             return None
 
-        coordinates = proj(
-            float(self.properties.lon),
-            float(self.properties.lat),
-            inverse=True,
-        )
-
         descriptions: list[str] = [
             self.properties.Regel_Txt,
             self.properties.more_info,
@@ -180,8 +172,8 @@ class RadolfzellParkingSiteInput:
             address=self.properties.StrPLZOrt2,
             static_data_updated_at=static_data_updated_at,
             type=ParkingSiteType.ON_STREET,
-            lat=round_7d(coordinates[1]),
-            lon=round_7d(coordinates[0]),
+            lat=self.properties.lat,
+            lon=self.properties.lon,
             capacity=self.properties.Stellpl,
             geojson=self.geometry,
             has_realtime_data=False,
@@ -3,19 +3,21 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import pyproj
+from typing import Iterator, Sequence
+
+from requests import Response
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import GeojsonInput, RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import reproject_utm32_lat_lon
 
 from .models import RadvisFeatureInput, StatusType
 
 
 class RadvisBwPullConverter(ParkingSitePullConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
     _base_url = (
         'https://radvis.landbw.de/api/geoserver/basicauth/radvis/wfs?service=WFS&version=2.0.0&request='
         'GetFeature&typeNames=radvis%3Aabstellanlage&outputFormat=application/json'
@@ -33,47 +35,81 @@ class RadvisBwPullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
-        static_parking_site_errors: list[ImportParkingSiteException] = []
+        response = self.get_response()
+
+        return self.get_cached_static_result(
+            'parking_sites',
+            response.content,
+            lambda: self.split_inputs_and_exceptions(self._iter_static_parking_sites(response.json())),
+            key_data=self.config_helper.get('PARK_API_RADVIS_IGNORE_SOURCES'),
+        )
+
+    def iter_static_parking_sites(self) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        # Cached results are stored as lists anyway
+        if self._get_static_result_cache() is not None:
+            yield from super().iter_static_parking_sites()
+            return
 
-        parking_site_features = self.geojson_validator.validate(self.get_data())
+        yield from self._iter_static_parking_sites(self.get_response().json())
+
+    def _iter_static_parking_sites(self, data: dict) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        parking_site_features = self.geojson_validator.validate(data)
+        return self.iter_apply_static_patches(self._iter_unpatched_static_parking_sites(parking_site_features))
+
+    def _iter_unpatched_static_parking_sites(
+        self,
+        parking_site_features: GeojsonInput,
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        return self.iter_validate_records(parking_site_features.features, self._validate_feature_dicts)
+
+    def _validate_feature_dicts(
+        self,
+        feature_dicts: Sequence[dict],
+    ) -> list[StaticParkingSiteInput | ImportParkingSiteException]:
         sources_to_ignore: list[str] = []
         if self.config_helper.get('PARK_API_RADVIS_IGNORE_SOURCES'):
             sources_to_ignore = self.config_helper.get('PARK_API_RADVIS_IGNORE_SOURCES')
 
-        for feature_dict in parking_site_features.features:
+        results: list[StaticParkingSiteInput | ImportParkingSiteException] = []
+        # Coordinates are reprojected per chunk, which is way faster than one by one, but keeps memory bounded
+        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+
+        for feature_dict in feature_dicts:
             try:
                 radvis_parking_site_input = self.radvis_parking_site_validator.validate(feature_dict)
-
-                # Ignore sources by config, because Radvis has a lot of duplicate data if you import data from other sources, too.
-                if radvis_parking_site_input.properties.quell_system in sources_to_ignore:
-                    continue
-
-                if radvis_parking_site_input.properties.status == StatusType.GEPLANT:
-                    continue
-
-                static_parking_site_inputs += radvis_parking_site_input.to_static_parking_site_inputs_with_proj(
-                    self.proj,
-                )
-
             except ValidationError as e:
-                static_parking_site_errors.append(
+                results.append(
                     ImportParkingSiteException(
                         source_uid=self.source_info.uid,
                         parking_site_uid=feature_dict.get('properties', {}).get('id'),
                         message=f'validation error for data {feature_dict}: {e.to_dict()}',
                     ),
                 )
+                continue
+
+            # Ignore sources by config, because Radvis has a lot of duplicate data if you import data from other sources, too.
+            if radvis_parking_site_input.properties.quell_system in sources_to_ignore:
+                continue
+
+            if radvis_parking_site_input.properties.status == StatusType.GEPLANT:
+                continue
+
+            new_static_parking_site_inputs = radvis_parking_site_input.to_utm32_static_parking_site_inputs()
+            static_parking_site_inputs += new_static_parking_site_inputs
+            results += new_static_parking_site_inputs
+
+        reproject_utm32_lat_lon(static_parking_site_inputs)
 
-        return self.apply_static_patches(static_parking_site_inputs), static_parking_site_errors
+        return results
 
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []
 
-    def get_data(self) -> dict:
+    def get_response(self) -> Response:
         response = self.request_get(
             url=self._base_url,
             auth=(self.config_helper.get('PARK_API_RADVIS_USER'), self.config_helper.get('PARK_API_RADVIS_PASSWORD')),
+            http_cache=True,
         )
 
-        return response.json()
+        return response
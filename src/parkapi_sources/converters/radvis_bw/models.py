@@ -7,7 +7,6 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-import pyproj
 from validataclass.dataclasses import Default, validataclass
 from validataclass.validators import (
     BooleanValidator,
@@ -171,7 +170,11 @@ class RadvisFeaturePropertiesInput:
 class RadvisFeatureInput(GeojsonBaseFeatureInput):
     properties: RadvisFeaturePropertiesInput = DataclassValidator(RadvisFeaturePropertiesInput)
 
-    def to_static_parking_site_inputs_with_proj(self, proj: pyproj.Proj) -> list[StaticParkingSiteInput]:
+    def to_utm32_static_parking_site_inputs(self) -> list[StaticParkingSiteInput]:
+        """
+        Returns static parking site inputs which still have UTM32 coordinates at lat and lon, so they can be reprojected
+        as a batch.
+        """
         property_dicts: list[dict] = self.properties.to_dicts()
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
 
@@ -182,10 +185,6 @@ class RadvisFeatureInput(GeojsonBaseFeatureInput):
                 **property_dict,
             )
 
-            coordinates = proj(float(static_parking_site_input.lon), float(static_parking_site_input.lat), inverse=True)
-            static_parking_site_input.lon = round_7d(coordinates[0])
-            static_parking_site_input.lat = round_7d(coordinates[1])
-
             static_parking_site_inputs.append(static_parking_site_input)
 
         return static_parking_site_inputs
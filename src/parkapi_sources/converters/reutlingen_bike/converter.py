@@ -6,7 +6,6 @@ Use of this source code is governed by an MIT-style license that can be found in
 import csv
 from io import StringIO
 
-import pyproj
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -15,10 +14,10 @@ from parkapi_sources.converters.base_converter.push import CsvConverter
 from parkapi_sources.converters.reutlingen_bike.validation import ReutlingenBikeRowInput
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import transform_utm32_coordinates
 
 
 class ReutlingenBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
     reutlingen_bike_row_validator = DataclassValidator(ReutlingenBikeRowInput)
 
     source_info = SourceInfo(
@@ -46,6 +45,7 @@ class ReutlingenBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
         mapping: dict[str, int] = self.get_mapping_by_header(self.header_mapping, data[0])
+        reutlingen_bike_row_inputs: list[ReutlingenBikeRowInput] = []
 
         # We start at row 2, as the first one is our header
         for row in data[1:]:
@@ -67,6 +67,13 @@ class ReutlingenBikePushConverter(CsvConverter, ParkingSiteBaseConverter):
                 )
                 continue
 
-            static_parking_site_inputs.append(reutlingen_bike_row_input.to_parking_site_input(self.proj))
+            reutlingen_bike_row_inputs.append(reutlingen_bike_row_input)
+
+        longitudes, latitudes = transform_utm32_coordinates(
+            [float(row_input.coordinates[0]) for row_input in reutlingen_bike_row_inputs],
+            [float(row_input.coordinates[1]) for row_input in reutlingen_bike_row_inputs],
+        )
+        for reutlingen_bike_row_input, lon, lat in zip(reutlingen_bike_row_inputs, longitudes, latitudes, strict=True):
+            static_parking_site_inputs.append(reutlingen_bike_row_input.to_parking_site_input(lat=lat, lon=lon))
 
         return static_parking_site_inputs, static_parking_site_errors
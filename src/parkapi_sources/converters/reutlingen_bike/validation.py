@@ -5,7 +5,6 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from datetime import datetime, timezone
 
-import pyproj
 from validataclass.dataclasses import validataclass
 from validataclass.validators import DecimalValidator, IntegerValidator, StringValidator
 
@@ -21,11 +20,10 @@ class ReutlingenBikeRowInput:
     name: str = StringValidator(max_length=255)
     additional_name: str = StringValidator(max_length=255)
 
-    def to_parking_site_input(self, proj: pyproj.Proj) -> StaticParkingSiteInput:
-        coordinates = proj(float(self.coordinates[0]), float(self.coordinates[1]), inverse=True)
-        lat = coordinates[1]
-        lon = coordinates[0]
-
+    def to_parking_site_input(self, lat: float, lon: float) -> StaticParkingSiteInput:
+        """
+        `coordinates` are UTM32, so the converter reprojects them for all rows at once and passes them here.
+        """
         if self.name and self.additional_name:
             name = f'{self.name}, {self.additional_name}'
         elif self.additional_name:
@@ -3,7 +3,6 @@ Copyright 2023 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import pyproj
 from lxml import etree
 from lxml.etree import Element
 from validataclass.validators import DataclassValidator
@@ -13,15 +12,22 @@ from parkapi_sources.converters.base_converter.datex2 import Datex2RealtimeMixin
 from parkapi_sources.converters.base_converter.push import XmlConverter
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
-from parkapi_sources.util import round_7d
+from parkapi_sources.util import reproject_utm32_lat_lon
 
 from .validators import ParkingFacilityStatus, StuttgartParkingFacility
 
 
 class StuttgartPushConverter(ParkingFacilityMixin, Datex2RealtimeMixin, XmlConverter, ParkingSiteBaseConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
     static_validator = DataclassValidator(StuttgartParkingFacility)
     realtime_validator = DataclassValidator(ParkingFacilityStatus)
+    realtime_xml_record_tag = 'parkingFacilityStatus'
+    realtime_xml_record_parent_tag = 'parkingFacilityTableStatusPublication'
+    realtime_xml_to_dict_kwargs = {
+        'ensure_array_keys': [
+            ('parkingFacilityTableStatusPublication', 'parkingFacilityStatus'),
+            ('parkingFacilityStatus', 'parkingFacilityStatus'),
+        ],
+    }
 
     source_info = SourceInfo(
         uid='stuttgart',
@@ -31,14 +37,9 @@ class StuttgartPushConverter(ParkingFacilityMixin, Datex2RealtimeMixin, XmlConve
         has_realtime_data=True,
     )
 
-    def modify_static_parking_site_input(self, static_parking_site_input: StaticParkingSiteInput):
-        coordinates = self.proj(
-            float(static_parking_site_input.lon),
-            float(static_parking_site_input.lat),
-            inverse=True,
-        )
-        static_parking_site_input.lat = round_7d(coordinates[1])
-        static_parking_site_input.lon = round_7d(coordinates[0])
+    def modify_static_parking_site_inputs(self, static_parking_site_inputs: list[StaticParkingSiteInput]):
+        # Coordinates are delivered as UTM32
+        reproject_utm32_lat_lon(static_parking_site_inputs)
 
     def handle_xml(
         self,
@@ -60,13 +61,7 @@ class StuttgartPushConverter(ParkingFacilityMixin, Datex2RealtimeMixin, XmlConve
         )
 
     def _transform_realtime_xml_to_realtime_input_dicts(self, realtime_xml_data: etree.Element) -> list[dict]:
-        data = self.xml_helper.xml_to_dict(
-            realtime_xml_data,
-            ensure_array_keys=[
-                ('parkingFacilityTableStatusPublication', 'parkingFacilityStatus'),
-                ('parkingFacilityStatus', 'parkingFacilityStatus'),
-            ],
-        )
+        data = self.realtime_xml_to_dict_converter.convert(realtime_xml_data)
         return (
             data
             .get('d2LogicalModel', {})
@@ -3,7 +3,9 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from lxml import etree
+from time import monotonic
+from typing import Iterable, Optional
+
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -11,7 +13,12 @@ from parkapi_sources.converters.base_converter import ParkingSiteBaseConverter
 from parkapi_sources.converters.base_converter.datex2 import InterUrbanParkingSiteMixin, ParkingRecordStatusMixin
 from parkapi_sources.converters.base_converter.pull import MobilithekParkingSitePullConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
-from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo
+from parkapi_sources.models import (
+    RealtimeParkingSiteInput,
+    RealtimeParkingSiteRecord,
+    SourceInfo,
+    StaticParkingSiteInput,
+)
 
 from .models import TollCollectInterUrbanParkingSite, TollCollectParkingRecordStatus
 
@@ -23,8 +30,18 @@ class TollCollectPullConverter(
     ParkingSiteBaseConverter,
 ):
     config_key = 'TOLL_COLLECT'
+    # The Toll Collect publications cover all truck parking sites in Germany, so they are parsed record by record
+    stream_xml_data = True
     static_validator = DataclassValidator(TollCollectInterUrbanParkingSite)
     realtime_validator = DataclassValidator(TollCollectParkingRecordStatus)
+    # Seconds until cached capacities are fetched again, can be overwritten by config value
+    # PARK_API_MOBILITHEK_TOLL_COLLECT_CAPACITY_TTL
+    default_capacity_ttl: float = 3600
+    _capacity_by_uid: Optional[dict[str, int]] = None
+    _capacity_by_uid_subscription_id: Optional[str] = None
+    _capacity_by_uid_updated_at: float = 0.0
+    # Filled by handle_static_item() during a static import
+    _collected_capacity_by_uid: Optional[dict[str, int]] = None
 
     source_info = SourceInfo(
         uid='toll_collect',
@@ -33,28 +50,106 @@ class TollCollectPullConverter(
         has_realtime_data=True,
     )
 
+    def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        # The static data contains the capacities needed for the realtime data, so they are kept for realtime runs
+        self._collected_capacity_by_uid = {}
+        try:
+            static_parking_site_inputs, static_parking_site_errors = self._handle_static_xml_stream(
+                self._get_xml_stream(self._get_static_subscription_id()),
+                encoding='utf-8',
+            )
+            self._set_cached_capacity_by_uid(self._collected_capacity_by_uid)
+        finally:
+            self._collected_capacity_by_uid = None
+
+        return static_parking_site_inputs, static_parking_site_errors
+
+    def handle_static_item(self, static_item: TollCollectInterUrbanParkingSite):
+        # Capacities are taken from the validated upstream data, so parking sites without spaces, which are no static
+        # parking sites, still get a realtime capacity of 0, and static patches don't change realtime capacities
+        if self._collected_capacity_by_uid is not None:
+            self._collected_capacity_by_uid[static_item.id] = static_item.parkingNumberOfSpaces
+
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
-        # The realtime data does not contain a total capacity, so we fetch the static data as well and calculate the
-        # free capacity by subtracting the occupied spaces from the static total capacity.
-        static_xml_data = self._get_xml_data(
-            subscription_id=self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_STATIC_SUBSCRIPTION_ID'),
+        realtime_parking_site_records, realtime_parking_site_errors = self.get_realtime_parking_site_records()
+
+        return [item.to_input() for item in realtime_parking_site_records], realtime_parking_site_errors
+
+    def get_realtime_parking_site_records(
+        self,
+    ) -> tuple[list[RealtimeParkingSiteRecord], list[ImportParkingSiteException]]:
+        """
+        The realtime publication covers all truck parking sites in Germany and is polled often, so records are built
+        directly from the validated status items, and inputs just on demand.
+        """
+        return self._get_realtime_parking_site_records(self._get_cached_capacity_by_uid())
+
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        static_parking_site_inputs, static_parking_site_errors = self.get_static_parking_sites()
+
+        # get_static_parking_sites() just updated the capacities, so the static data is fetched just once
+        realtime_parking_site_records, realtime_parking_site_errors = self._get_realtime_parking_site_records(
+            self._capacity_by_uid,
+        )
+
+        return (
+            static_parking_site_inputs,
+            [item.to_input() for item in realtime_parking_site_records],
+            static_parking_site_errors + realtime_parking_site_errors,
         )
-        capacity_by_uid = self._get_capacity_by_uid(static_xml_data)
 
-        realtime_xml_data = self._get_xml_data(
+    def _get_cached_capacity_by_uid(self) -> dict[str, int]:
+        """
+        The realtime data does not contain a total capacity, so the free capacity is calculated by subtracting the
+        occupied spaces from the static total capacity. Capacities rarely change, so they are just fetched from the
+        static data if the static subscription changed or if they are older than the capacity TTL.
+        """
+        if (
+            self._capacity_by_uid is None
+            or self._capacity_by_uid_subscription_id != self._get_static_subscription_id()
+            or self._capacity_by_uid_updated_at + self._get_capacity_ttl() <= monotonic()
+        ):
+            # Updates the cached capacities
+            self.get_static_parking_sites()
+
+        return self._capacity_by_uid
+
+    def _set_cached_capacity_by_uid(self, capacity_by_uid: dict[str, int]) -> None:
+        self._capacity_by_uid = capacity_by_uid
+        self._capacity_by_uid_subscription_id = self._get_static_subscription_id()
+        self._capacity_by_uid_updated_at = monotonic()
+
+    def _get_static_subscription_id(self) -> Optional[str]:
+        return self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_STATIC_SUBSCRIPTION_ID')
+
+    def _get_capacity_ttl(self) -> float:
+        capacity_ttl = self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_CAPACITY_TTL')
+        # Config values from env vars are strings, so we have to cast them
+        return self.default_capacity_ttl if capacity_ttl is None else float(capacity_ttl)
+
+    def _get_realtime_parking_site_records(
+        self,
+        capacity_by_uid: dict[str, int],
+    ) -> tuple[list[RealtimeParkingSiteRecord], list[ImportParkingSiteException]]:
+        realtime_xml_source = self._get_xml_stream(
             subscription_id=self.config_helper.get(f'PARK_API_MOBILITHEK_{self.config_key}_REALTIME_SUBSCRIPTION_ID'),
         )
 
-        realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
+        realtime_parking_site_records: list[RealtimeParkingSiteRecord] = []
         realtime_parking_site_errors: list[ImportParkingSiteException] = []
 
-        realtime_input_dicts: list[dict] = self._transform_realtime_xml_to_realtime_input_dicts(realtime_xml_data)
+        realtime_input_dicts: Iterable[dict] = self._iter_realtime_xml_stream_input_dicts(
+            realtime_xml_source,
+            encoding='utf-8',
+        )
 
         for realtime_input_dict in realtime_input_dicts:
             try:
                 realtime_item = self.realtime_validator.validate(realtime_input_dict)
-                realtime_parking_site_inputs.append(
-                    realtime_item.to_realtime_parking_site_input(capacity=capacity_by_uid.get(realtime_item.uid)),
+                realtime_parking_site_records.append(
+                    realtime_item.to_realtime_parking_site_record(capacity=capacity_by_uid.get(realtime_item.uid)),
                 )
 
             except ValidationError as e:
@@ -66,15 +161,4 @@ class TollCollectPullConverter(
                     ),
                 )
 
-        return realtime_parking_site_inputs, realtime_parking_site_errors
-
-    def _get_capacity_by_uid(self, static_xml_data: etree.Element) -> dict[str, int]:
-        capacity_by_uid: dict[str, int] = {}
-        for static_input_dict in self._transform_static_xml_to_static_input_dicts(static_xml_data):
-            try:
-                static_item = self.static_validator.validate(static_input_dict)
-            except ValidationError:
-                continue
-            capacity_by_uid[static_item.id] = static_item.parkingNumberOfSpaces
-
-        return capacity_by_uid
+        return realtime_parking_site_records, realtime_parking_site_errors
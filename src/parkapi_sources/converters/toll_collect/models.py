@@ -18,7 +18,7 @@ from validataclass.validators import (
 )
 
 from parkapi_sources.converters.base_converter.datex2 import InterUrbanParkingSite
-from parkapi_sources.models import ParkingSiteRestrictionInput, RealtimeParkingSiteInput
+from parkapi_sources.models import ParkingSiteRestrictionInput, RealtimeParkingSiteRecord
 from parkapi_sources.models.enums import OpeningStatus, ParkingAudience
 
 
@@ -82,7 +82,7 @@ class TollCollectParkingRecordStatus:
     def uid(self) -> str:
         return self.parkingRecordReference.id.split('[')[0]
 
-    def to_realtime_parking_site_input(self, capacity: int | None) -> RealtimeParkingSiteInput:
+    def to_realtime_parking_site_record(self, capacity: int | None) -> RealtimeParkingSiteRecord:
         occupied_spaces = None
         if self.parkingOccupancy is not None:
             occupied_spaces = self.parkingOccupancy.parkingNumberOfVehicles
@@ -97,7 +97,7 @@ class TollCollectParkingRecordStatus:
         if self.parkingSiteOpeningStatus is not None:
             realtime_opening_status = self.parkingSiteOpeningStatus.to_opening_status()
 
-        return RealtimeParkingSiteInput(
+        return RealtimeParkingSiteRecord(
             uid=self.uid,
             realtime_capacity=capacity,
             realtime_free_capacity=realtime_free_capacity,
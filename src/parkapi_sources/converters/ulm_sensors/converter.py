@@ -7,6 +7,7 @@ from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.pull import (
+    BearerTokenMixin,
     ParkingSitePullConverter,
     ParkingSpotPullConverter,
     StaticGeojsonDataMixin,
@@ -24,7 +25,12 @@ from parkapi_sources.models import (
 from .validators import UlmSensorsParkingSiteInput, UlmSensorsParkingSpotInput
 
 
-class UlmSensorsPullConverter(ParkingSpotPullConverter, ParkingSitePullConverter, StaticGeojsonDataMixin):
+class UlmSensorsPullConverter(
+    BearerTokenMixin,
+    ParkingSpotPullConverter,
+    ParkingSitePullConverter,
+    StaticGeojsonDataMixin,
+):
     required_config_keys = [
         'PARK_API_ULM_SENSORS_IDS',
         'PARK_API_ULM_SENSORS_CLIENT_ID',
@@ -64,9 +70,8 @@ class UlmSensorsPullConverter(ParkingSpotPullConverter, ParkingSitePullConverter
         realtime_ulm_sensors_inputs: list[UlmSensorsParkingSiteInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
-        response = self.request_get(
+        response = self.request_get_with_token(
             url=f'{self.source_info.source_url}/consumer-api/v1/collections/sensors/pbg_all_carparks/data',
-            headers={'Authorization': f'Bearer {self._request_token()}'},
             timeout=60,
         )
 
@@ -111,12 +116,17 @@ class UlmSensorsPullConverter(ParkingSpotPullConverter, ParkingSitePullConverter
         parking_spot_dicts: list[dict] = []
         sensor_ids = self.config_helper.get('PARK_API_ULM_SENSORS_IDS').split(',')
 
-        for sensor_id in sensor_ids:
-            response = self.request_get(
-                url=f'{self.source_info.source_url}/consumer-api/v1/collections/sensors/{sensor_id}/data?count=1',
-                headers={'Authorization': f'Bearer {self._request_token()}'},
-                timeout=60,
-            )
+        responses = self.request_get_all(
+            [
+                {
+                    'url': f'{self.source_info.source_url}/consumer-api/v1/collections/sensors/{sensor_id}/data?count=1',
+                    'timeout': 60,
+                }
+                for sensor_id in sensor_ids
+            ],
+            request_method=self.request_get_with_token,
+        )
+        for response in responses:
             parking_spot_dicts += response.json()
 
         for parking_spot_dict in parking_spot_dicts:
@@ -133,7 +143,14 @@ class UlmSensorsPullConverter(ParkingSpotPullConverter, ParkingSitePullConverter
 
         return realtime_ulm_sensors_inputs, import_parking_spot_exceptions
 
-    def _request_token(self) -> str:
+    def _get_token_credentials(self) -> tuple[str | None, ...]:
+        return (
+            self.config_helper.get('PARK_API_ULM_SENSORS_CLIENT_ID'),
+            self.config_helper.get('PARK_API_ULM_SENSORS_USER'),
+            self.config_helper.get('PARK_API_ULM_SENSORS_PASSWORD'),
+        )
+
+    def _fetch_token(self) -> tuple[str, int | None]:
         response = self.request_post(
             url=f'{self.source_info.source_url}/auth/realms/ocon/protocol/openid-connect/token',
             headers={
@@ -147,4 +164,4 @@ class UlmSensorsPullConverter(ParkingSpotPullConverter, ParkingSitePullConverter
             },
         )
         token_data = response.json()
-        return token_data['access_token']
+        return token_data['access_token'], token_data.get('expires_in')
@@ -26,26 +26,43 @@ class VelobrixPullConverter(ParkingSitePullConverter):
     )
 
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+        velobrix_inputs, import_parking_site_exceptions = self._get_data(include_pricing=True)
+
+        return self._to_static_parking_site_inputs(velobrix_inputs), import_parking_site_exceptions
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        velobrix_inputs, import_parking_site_exceptions = self._get_data()
+
+        return self._to_realtime_parking_site_inputs(velobrix_inputs), import_parking_site_exceptions
 
+    def get_parking_sites(
+        self,
+    ) -> tuple[list[StaticParkingSiteInput], list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        # The response including pricing contains the realtime data as well
         velobrix_inputs, import_parking_site_exceptions = self._get_data(include_pricing=True)
 
+        return (
+            self._to_static_parking_site_inputs(velobrix_inputs),
+            self._to_realtime_parking_site_inputs(velobrix_inputs),
+            import_parking_site_exceptions,
+        )
+
+    def _to_static_parking_site_inputs(self, velobrix_inputs: list[VelobrixInput]) -> list[StaticParkingSiteInput]:
+        static_parking_site_inputs: list[StaticParkingSiteInput] = []
         for velobrix_input in velobrix_inputs:
             static_parking_site_inputs.append(velobrix_input.to_static_parking_site())
 
-        return self.apply_static_patches(static_parking_site_inputs), import_parking_site_exceptions
+        return self.apply_static_patches(static_parking_site_inputs)
 
-    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+    @staticmethod
+    def _to_realtime_parking_site_inputs(velobrix_inputs: list[VelobrixInput]) -> list[RealtimeParkingSiteInput]:
         realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
-
-        velobrix_inputs, import_parking_site_exceptions = self._get_data()
-
         for velobrix_input in velobrix_inputs:
             if velobrix_input.countFreeLogicalBoxes is None:
                 continue
             realtime_parking_site_inputs.append(velobrix_input.to_realtime_parking_site_input())
 
-        return realtime_parking_site_inputs, import_parking_site_exceptions
+        return realtime_parking_site_inputs
 
     def _get_data(self, include_pricing: bool = False) -> tuple[list[VelobrixInput], list[ImportParkingSiteException]]:
         velobrix_inputs: list[VelobrixInput] = []
@@ -6,18 +6,16 @@ Use of this source code is governed by an MIT-style license that can be found in
 from datetime import datetime, timezone
 from typing import Any
 
-import pyproj
 from openpyxl.cell import Cell
 
 from parkapi_sources.converters.base_converter import ParkingSiteBaseConverter
 from parkapi_sources.converters.base_converter.push import NormalizedXlsxConverter
 from parkapi_sources.models import SourceInfo
 from parkapi_sources.models.enums import ParkAndRideType, PurposeType
+from parkapi_sources.util import transform_utm32_coordinates
 
 
 class VrsParkAndRidePushConverter(NormalizedXlsxConverter, ParkingSiteBaseConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
-
     source_info = SourceInfo(
         uid='vrs-p-r',
         name='Verband Region Stuttgart: Park and Ride',
@@ -43,6 +41,16 @@ class VrsParkAndRidePushConverter(NormalizedXlsxConverter, ParkingSiteBaseConver
         # Other opening times are there, but not parsable
     }
 
+    def modify_parking_site_dicts(self, parking_site_dicts: list[dict[str, Any]]) -> None:
+        # Coordinates are delivered as UTM32
+        longitudes, latitudes = transform_utm32_coordinates(
+            [float(parking_site_dict.get('lon_utm')) for parking_site_dict in parking_site_dicts],
+            [float(parking_site_dict.get('lat_utm')) for parking_site_dict in parking_site_dicts],
+        )
+        for parking_site_dict, lon, lat in zip(parking_site_dicts, longitudes, latitudes, strict=True):
+            parking_site_dict['lat'] = lat
+            parking_site_dict['lon'] = lon
+
     def map_row_to_parking_site_dict(
         self,
         mapping: dict[str, int],
@@ -61,14 +69,6 @@ class VrsParkAndRidePushConverter(NormalizedXlsxConverter, ParkingSiteBaseConver
         for field in mapping.keys():
             parking_site_dict[field] = row[mapping[field]].value
 
-        coordinates = self.proj(
-            float(parking_site_dict.get('lon_utm')),
-            float(parking_site_dict.get('lat_utm')),
-            inverse=True,
-        )
-        parking_site_dict['lat'] = coordinates[1]
-        parking_site_dict['lon'] = coordinates[0]
-
         parking_site_dict['opening_hours'] = parking_site_dict['opening_hours'].replace('-00:00', '-24:00')
         parking_site_dict['purpose'] = PurposeType.CAR.name
         parking_site_dict['park_and_ride_type'] = [ParkAndRideType.TRAIN.name]
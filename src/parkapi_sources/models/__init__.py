@@ -38,6 +38,7 @@ from .parking_spot_inputs import (
     StaticParkingSpotInput,
     StaticParkingSpotPatchInput,
 )
+from .realtime_records import RealtimeParkingSiteRecord, RealtimeParkingSpotRecord
 from .shared_inputs import ExternalIdentifierInput, ParkingRestrictionInput
 from .source_info import SourceInfo
 from .xlsx_inputs import ExcelOpeningTimeInput, ExcelStaticParkingSiteInput
@@ -0,0 +1,155 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import dataclasses
+from datetime import datetime
+from typing import Any, Optional
+
+from .enums import OpeningStatus, ParkingSpotStatus
+from .parking_site_inputs import ParkingSiteRestrictionInput, RealtimeParkingSiteInput
+from .parking_spot_inputs import RealtimeParkingSpotInput
+
+
+class RealtimeParkingSiteRecord:
+    """
+    Lightweight realtime parking site data for trusted paths, where values are built by a converter from already
+    validated data. It has no validator metadata and uses `__slots__`, so it's cheaper to create, to keep in memory and
+    to pickle than `RealtimeParkingSiteInput`. `to_input()` and `from_input()` convert it losslessly.
+    """
+
+    __slots__ = (
+        'uid',
+        'realtime_data_updated_at',
+        'realtime_opening_status',
+        'realtime_capacity',
+        'realtime_free_capacity',
+        'restrictions',
+    )
+
+    uid: str
+    realtime_data_updated_at: datetime
+    realtime_opening_status: Optional[OpeningStatus]
+    realtime_capacity: Optional[int]
+    realtime_free_capacity: Optional[int]
+    # Restrictions are rare at realtime data, so records without restrictions share an empty tuple
+    restrictions: Optional[tuple[ParkingSiteRestrictionInput, ...]]
+
+    def __init__(
+        self,
+        uid: str,
+        realtime_data_updated_at: datetime,
+        realtime_opening_status: Optional[OpeningStatus] = None,
+        realtime_capacity: Optional[int] = None,
+        realtime_free_capacity: Optional[int] = None,
+        restrictions: Optional[tuple[ParkingSiteRestrictionInput, ...]] = (),
+    ):
+        self.uid = uid
+        self.realtime_data_updated_at = realtime_data_updated_at
+        self.realtime_opening_status = realtime_opening_status
+        self.realtime_capacity = realtime_capacity
+        self.realtime_free_capacity = realtime_free_capacity
+        self.restrictions = restrictions
+
+    @classmethod
+    def from_input(cls, realtime_parking_site_input: RealtimeParkingSiteInput) -> 'RealtimeParkingSiteRecord':
+        restrictions = realtime_parking_site_input.restrictions
+        return cls(
+            uid=realtime_parking_site_input.uid,
+            realtime_data_updated_at=realtime_parking_site_input.realtime_data_updated_at,
+            realtime_opening_status=realtime_parking_site_input.realtime_opening_status,
+            realtime_capacity=realtime_parking_site_input.realtime_capacity,
+            realtime_free_capacity=realtime_parking_site_input.realtime_free_capacity,
+            restrictions=None if restrictions is None else tuple(restrictions),
+        )
+
+    def to_input(self) -> RealtimeParkingSiteInput:
+        return RealtimeParkingSiteInput(
+            uid=self.uid,
+            realtime_data_updated_at=self.realtime_data_updated_at,
+            realtime_opening_status=self.realtime_opening_status,
+            realtime_capacity=self.realtime_capacity,
+            realtime_free_capacity=self.realtime_free_capacity,
+            restrictions=None if self.restrictions is None else list(self.restrictions),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the same dict as `RealtimeParkingSiteInput.to_dict()`, without building the input first.
+        """
+        return {
+            'uid': self.uid,
+            'realtime_data_updated_at': self.realtime_data_updated_at,
+            'realtime_opening_status': self.realtime_opening_status,
+            'realtime_capacity': self.realtime_capacity,
+            'realtime_free_capacity': self.realtime_free_capacity,
+            'restrictions': None
+            if self.restrictions is None
+            else [dataclasses.asdict(restriction) for restriction in self.restrictions],
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RealtimeParkingSiteRecord):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__)
+        return f'{self.__class__.__name__}({values})'
+
+
+class RealtimeParkingSpotRecord:
+    """
+    Lightweight realtime parking spot data for trusted paths, see `RealtimeParkingSiteRecord`.
+    """
+
+    __slots__ = ('uid', 'realtime_data_updated_at', 'realtime_status')
+
+    uid: str
+    realtime_data_updated_at: datetime
+    realtime_status: Optional[ParkingSpotStatus]
+
+    def __init__(
+        self,
+        uid: str,
+        realtime_data_updated_at: datetime,
+        realtime_status: Optional[ParkingSpotStatus] = None,
+    ):
+        self.uid = uid
+        self.realtime_data_updated_at = realtime_data_updated_at
+        self.realtime_status = realtime_status
+
+    @classmethod
+    def from_input(cls, realtime_parking_spot_input: RealtimeParkingSpotInput) -> 'RealtimeParkingSpotRecord':
+        return cls(
+            uid=realtime_parking_spot_input.uid,
+            realtime_data_updated_at=realtime_parking_spot_input.realtime_data_updated_at,
+            realtime_status=realtime_parking_spot_input.realtime_status,
+        )
+
+    def to_input(self) -> RealtimeParkingSpotInput:
+        return RealtimeParkingSpotInput(
+            uid=self.uid,
+            realtime_data_updated_at=self.realtime_data_updated_at,
+            realtime_status=self.realtime_status,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the same dict as `RealtimeParkingSpotInput.to_dict()`, without building the input first.
+        """
+        return {
+            'uid': self.uid,
+            'realtime_data_updated_at': self.realtime_data_updated_at,
+            'realtime_status': self.realtime_status,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RealtimeParkingSpotRecord):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__)
+        return f'{self.__class__.__name__}({values})'
@@ -3,172 +3,34 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from typing import Optional, Type
-
-from .converters import (
-    AachenPullConverter,
-    AalenPullConverter,
-    ApcoaPullConverter,
-    BahnV2PullConverter,
-    BaseConverter,
-    BaselPullConverter,
-    BBParkhausPushConverter,
-    BfrkBwBikePushConverter,
-    BfrkBwCarPullConverter,
-    BielefeldPullConverter,
-    BietigheimBissingenPullConverter,
-    BuchenPushConverter,
-    EllwangenPushConverter,
-    EllwangenSensitPullConverter,
-    EsslingenPushConverter,
-    FreiburgDisabledSensorsPullConverter,
-    FreiburgDisabledStaticPullConverter,
-    FreiburgParkAndRideRealtimePullConverter,
-    FreiburgParkAndRideStaticPullConverter,
-    FreiburgPullConverter,
-    FreiburgScannerPullConverter,
-    FreiburgVAGBikePullConverter,
-    FriedrichshafenEasyParkPushConverter,
-    FriedrichshafenSensorsPullConverter,
-    GoldbeckPushConverter,
-    HeidelbergDisabledPullConverter,
-    HeidelbergEasyParkPullConverter,
-    HeidelbergPullConverter,
-    HeilbronnGoldbeckPullConverter,
-    HerrenbergBikePullConverter,
-    HerrenbergPullConverter,
-    HuefnerPushConverter,
-    JenaPullConverter,
-    KarlsruheBikePullConverter,
-    KarlsruheDisabledPullConverter,
-    KarlsruhePullConverter,
-    KelternPushConverter,
-    KienzlerBikeAndRidePullConverter,
-    KienzlerKarlsruhePullConverter,
-    KienzlerNeckarsulmPullConverter,
-    KienzlerOffenburgPullConverter,
-    KienzlerRadSafePullConverter,
-    KienzlerStuttgartPullConverter,
-    KienzlerUlmPullConverter,
-    KienzlerVrnPullConverter,
-    KienzlerVVSPullConverter,
-    KonstanzBikePullConverter,
-    KonstanzDisabledPullConverter,
-    KonstanzPullConverter,
-    LadenburgParkraumcheckPushConverter,
-    MannheimPushConverter,
-    NeckarsulmBikePushConverter,
-    NeckarsulmPushConverter,
-    OpenDataSwissPullConverter,
-    ParkRaumCheckKehlPushConverter,
-    ParkRaumCheckSachsenheimPushConverter,
-    PbwPullConverter,
-    PforzheimPushConverter,
-    PMBWPullConverter,
-    PMSensadePullConverter,
-    PumBwPushConverter,
-    RadolfzellPushConverter,
-    RadvisBwPullConverter,
-    ReutlingenBikePushConverter,
-    ReutlingenDisabledPushConverter,
-    ReutlingenPushConverter,
-    StuttgartPushConverter,
-    TollCollectPullConverter,
-    UlmPullConverter,
-    UlmSensorsPullConverter,
-    VelobrixPullConverter,
-    VrnParkAndRidePullConverter,
-    VrsBondorfPullConverter,
-    VrsKirchheimPullConverter,
-    VrsNeustadtPullConverter,
-    VrsParkAndRidePushConverter,
-    VrsVaihingenPullConverter,
-)
+import inspect
+from typing import Iterator, Optional, Type
+
+from .batch_runner import BatchRunner, SourceResult
+from .converters import BaseConverter
 from .converters.base_converter.pull import PullConverter
 from .converters.base_converter.push import PushConverter
-from .exceptions import MissingConfigException, MissingConverterException
-from .util import ConfigHelper, RequestHelper
+from .converters.converter_registry import ConverterRegistry
+from .exceptions import MissingConfigException
+from .realtime_delta import RealtimeDeltaTracker
+from .util import ConfigHelper, MetricsHook, RequestHelper
+
+
+class _AllConverterClasses:
+    """
+    Keeps `ParkAPISources.converter_classes` available for existing users. Accessing it imports all converters. It
+    returns a new list on each access, so appending to it has no effect: subclasses can either set their own
+    `converter_classes` list, or register additional converters at their `converter_registry`.
+    """
+
+    def __get__(self, instance: Optional['ParkAPISources'], owner: type['ParkAPISources']) -> list[Type[BaseConverter]]:
+        return owner.converter_registry.get_converter_classes()
 
 
 class ParkAPISources:
-    converter_classes: list[Type[BaseConverter]] = [
-        AachenPullConverter,
-        AalenPullConverter,
-        ApcoaPullConverter,
-        BahnV2PullConverter,
-        BaselPullConverter,
-        BBParkhausPushConverter,
-        BfrkBwBikePushConverter,
-        BfrkBwCarPullConverter,
-        BielefeldPullConverter,
-        BietigheimBissingenPullConverter,
-        BuchenPushConverter,
-        EllwangenPushConverter,
-        EllwangenSensitPullConverter,
-        EsslingenPushConverter,
-        FreiburgDisabledSensorsPullConverter,
-        FreiburgDisabledStaticPullConverter,
-        FreiburgParkAndRideRealtimePullConverter,
-        FreiburgParkAndRideStaticPullConverter,
-        FreiburgPullConverter,
-        FreiburgScannerPullConverter,
-        FreiburgVAGBikePullConverter,
-        FriedrichshafenEasyParkPushConverter,
-        FriedrichshafenSensorsPullConverter,
-        GoldbeckPushConverter,
-        HeidelbergEasyParkPullConverter,
-        HeidelbergDisabledPullConverter,
-        HeidelbergPullConverter,
-        HeilbronnGoldbeckPullConverter,
-        HerrenbergBikePullConverter,
-        HerrenbergPullConverter,
-        HuefnerPushConverter,
-        JenaPullConverter,
-        KarlsruheBikePullConverter,
-        KarlsruhePullConverter,
-        KarlsruheDisabledPullConverter,
-        KelternPushConverter,
-        KienzlerBikeAndRidePullConverter,
-        KienzlerVVSPullConverter,
-        KienzlerKarlsruhePullConverter,
-        KienzlerNeckarsulmPullConverter,
-        KienzlerOffenburgPullConverter,
-        KienzlerRadSafePullConverter,
-        KienzlerStuttgartPullConverter,
-        KienzlerUlmPullConverter,
-        KienzlerVrnPullConverter,
-        KonstanzBikePullConverter,
-        KonstanzDisabledPullConverter,
-        KonstanzPullConverter,
-        LadenburgParkraumcheckPushConverter,
-        MannheimPushConverter,
-        NeckarsulmBikePushConverter,
-        NeckarsulmPushConverter,
-        OpenDataSwissPullConverter,
-        PbwPullConverter,
-        PforzheimPushConverter,
-        ParkRaumCheckKehlPushConverter,
-        ParkRaumCheckSachsenheimPushConverter,
-        PMBWPullConverter,
-        PMSensadePullConverter,
-        PumBwPushConverter,
-        RadolfzellPushConverter,
-        RadvisBwPullConverter,
-        ReutlingenPushConverter,
-        ReutlingenBikePushConverter,
-        ReutlingenDisabledPushConverter,
-        StuttgartPushConverter,
-        TollCollectPullConverter,
-        UlmPullConverter,
-        UlmSensorsPullConverter,
-        VrnParkAndRidePullConverter,
-        VelobrixPullConverter,
-        VrsBondorfPullConverter,
-        VrsKirchheimPullConverter,
-        VrsNeustadtPullConverter,
-        VrsParkAndRidePushConverter,
-        VrsVaihingenPullConverter,
-    ]
+    # Converter modules are imported by uid on demand, so loading some sources does not import all converters
+    converter_registry: ConverterRegistry = ConverterRegistry()
+    converter_classes = _AllConverterClasses()
     config_helper: ConfigHelper
     converter_by_uid: dict[str, BaseConverter]
 
@@ -180,29 +42,28 @@ class ParkAPISources:
         no_push_converter: bool = False,
         # custom_converters can be used to inject own converter classes
         custom_converters: list[BaseConverter] = None,
+        # metrics_hook gets fetch, parse, validation, mapping and patch times as well as counters per source
+        metrics_hook: Optional[MetricsHook] = None,
     ):
         self.config_helper = ConfigHelper(config=config)
-        self.request_helper = RequestHelper(config_helper=self.config_helper)
+        self.request_helper = RequestHelper(config_helper=self.config_helper, metrics_hook=metrics_hook)
         self.converter_by_uid = {}
 
-        converter_classes_by_uid: dict[str, Type[BaseConverter]] = {
-            converter_class.source_info.uid: converter_class for converter_class in self.converter_classes
-        }
-
+        converter_registry = self._get_converter_registry()
         if converter_uids is None:
-            converter_uids = list(converter_classes_by_uid.keys())
+            converter_uids = converter_registry.uids
 
         for converter_uid in converter_uids:
-            if no_push_converter and issubclass(converter_classes_by_uid[converter_uid], PushConverter):
-                continue
+            # Raises a MissingConverterException for unknown uids, and just imports the requested converters
+            converter_class = converter_registry.get_converter_class(converter_uid)
 
-            if no_pull_converter and issubclass(converter_classes_by_uid[converter_uid], PullConverter):
+            if no_push_converter and issubclass(converter_class, PushConverter):
                 continue
 
-            if converter_uid not in converter_classes_by_uid.keys():
-                raise MissingConverterException(f'Converter {converter_uid} does not exist.')
+            if no_pull_converter and issubclass(converter_class, PullConverter):
+                continue
 
-            self.converter_by_uid[converter_uid] = converter_classes_by_uid[converter_uid](
+            self.converter_by_uid[converter_uid] = converter_class(
                 config_helper=self.config_helper,
                 request_helper=self.request_helper,
             )
@@ -210,8 +71,66 @@ class ParkAPISources:
         if custom_converters is not None:
             self.converter_by_uid.update({converter.source_info.uid: converter for converter in custom_converters})
 
+    @classmethod
+    def _get_converter_registry(cls) -> ConverterRegistry:
+        # Subclasses which set their own converter_classes list get exactly these converters
+        converter_classes = inspect.getattr_static(cls, 'converter_classes')
+        if isinstance(converter_classes, _AllConverterClasses):
+            return cls.converter_registry
+        return ConverterRegistry.from_converter_classes(converter_classes)
+
     def check_credentials(self):
         for converter in self.converter_by_uid.values():
             for config_key in converter.required_config_keys:
                 if self.config_helper.get(config_key) is None:
                     raise MissingConfigException(f'Config key {config_key} is missing.')
+
+    def run_pull_converters(
+        self,
+        parallel: int = 1,
+        source_timeout: Optional[float] = None,
+        include_parking_spots: bool = True,
+        realtime_delta_tracker: Optional[RealtimeDeltaTracker] = None,
+        use_processes: bool = False,
+    ) -> dict[str, SourceResult]:
+        """
+        Fetches static and realtime data of all loaded pull converters, up to `parallel` sources at the same time.
+        Exceptions are collected per source, so a failing or slow source does not affect the other ones. If
+        `realtime_delta_tracker` is set, the results contain the realtime changes since the last run, too. If
+        `use_processes` is set, sources run in worker processes instead of threads, which helps with CPU-bound static
+        imports.
+        """
+        with BatchRunner(
+            parallel=parallel,
+            source_timeout=source_timeout,
+            include_parking_spots=include_parking_spots,
+            realtime_delta_tracker=realtime_delta_tracker,
+            use_processes=use_processes,
+        ) as batch_runner:
+            return batch_runner.run(self._get_pull_converters())
+
+    def iter_run_pull_converters(
+        self,
+        parallel: int = 1,
+        source_timeout: Optional[float] = None,
+        include_parking_spots: bool = True,
+        realtime_delta_tracker: Optional[RealtimeDeltaTracker] = None,
+        use_processes: bool = False,
+        ordered: bool = False,
+    ) -> Iterator[SourceResult]:
+        """
+        Works like `run_pull_converters()`, but yields the result of each source as soon as it is done, so consumers
+        can write results source by source with memory bounded by the largest source. If `ordered` is set, results are
+        yielded in the order of the loaded converters instead of the order they are done.
+        """
+        with BatchRunner(
+            parallel=parallel,
+            source_timeout=source_timeout,
+            include_parking_spots=include_parking_spots,
+            realtime_delta_tracker=realtime_delta_tracker,
+            use_processes=use_processes,
+        ) as batch_runner:
+            yield from batch_runner.iter_run(self._get_pull_converters(), ordered=ordered)
+
+    def _get_pull_converters(self) -> list[PullConverter]:
+        return [converter for converter in self.converter_by_uid.values() if isinstance(converter, PullConverter)]
@@ -0,0 +1,173 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Collection, Optional
+
+from .models import RealtimeParkingSiteInput, RealtimeParkingSpotInput
+from .util import DefaultJSONEncoder, to_serializable_dict
+
+
+class RealtimeChangeType(Enum):
+    INSERT = 'INSERT'
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+
+
+@dataclass
+class RealtimeChange:
+    change_type: RealtimeChangeType
+    source_uid: str
+    uid: str
+    # None for deleted datasets
+    realtime_input: Optional[RealtimeParkingSiteInput | RealtimeParkingSpotInput]
+    # The last emitted values without uid and realtime_data_updated_at, None for inserted datasets
+    previous_values: Optional[dict[str, Any]]
+
+
+class RealtimeDeltaTracker:
+    """
+    Keeps the last emitted realtime values per source and uid, and turns full realtime results into inserts, updates
+    and deletes. `realtime_data_updated_at` is not compared, because many sources set it to the time of the request.
+
+    Values are stored as compact JSON strings. If `state_dir` is set, the state is stored at
+    `{state_dir}/{source_uid}-{data_type}.json`, so it survives restarts. Deletes are derived from missing uids, so just
+    complete results of successful runs should be passed.
+
+    Datasets which failed validation are missing in the results, too. Their uids can be passed as `failed_uids`, so they
+    keep their previous values instead of being deleted. If the uids of failed datasets are unknown, `keep_missing`
+    keeps all missing uids.
+    """
+
+    state_dir: Optional[Path]
+    _states: dict[tuple[str, str], dict[str, str]]
+    _lock: Lock
+
+    IGNORED_FIELDS = frozenset({'uid', 'realtime_data_updated_at'})
+
+    def __init__(self, state_dir: Optional[Path | str] = None):
+        self.state_dir = None if state_dir is None else Path(state_dir)
+        self._states = {}
+        self._lock = Lock()
+
+    def get_parking_site_changes(
+        self,
+        source_uid: str,
+        realtime_parking_site_inputs: list[RealtimeParkingSiteInput],
+        failed_uids: Collection[str] = (),
+        keep_missing: bool = False,
+    ) -> list[RealtimeChange]:
+        return self._get_changes(source_uid, 'parking_sites', realtime_parking_site_inputs, failed_uids, keep_missing)
+
+    def get_parking_spot_changes(
+        self,
+        source_uid: str,
+        realtime_parking_spot_inputs: list[RealtimeParkingSpotInput],
+        failed_uids: Collection[str] = (),
+        keep_missing: bool = False,
+    ) -> list[RealtimeChange]:
+        return self._get_changes(source_uid, 'parking_spots', realtime_parking_spot_inputs, failed_uids, keep_missing)
+
+    def clear(self, source_uid: str) -> None:
+        with self._lock:
+            for data_type in ('parking_sites', 'parking_spots'):
+                self._states.pop((source_uid, data_type), None)
+                if self.state_dir is not None:
+                    self._get_path(source_uid, data_type).unlink(missing_ok=True)
+
+    def _get_changes(
+        self,
+        source_uid: str,
+        data_type: str,
+        realtime_inputs: list[RealtimeParkingSiteInput] | list[RealtimeParkingSpotInput],
+        failed_uids: Collection[str],
+        keep_missing: bool,
+    ) -> list[RealtimeChange]:
+        with self._lock:
+            previous_state = self._load_state(source_uid, data_type)
+
+        state: dict[str, str] = {}
+        changes: list[RealtimeChange] = []
+        for realtime_input in realtime_inputs:
+            values = self._serialize(realtime_input)
+            previous_values = previous_state.get(realtime_input.uid)
+            state[realtime_input.uid] = values
+
+            if previous_values == values:
+                continue
+            changes.append(
+                RealtimeChange(
+                    change_type=RealtimeChangeType.INSERT if previous_values is None else RealtimeChangeType.UPDATE,
+                    source_uid=source_uid,
+                    uid=realtime_input.uid,
+                    realtime_input=realtime_input,
+                    previous_values=None if previous_values is None else json.loads(previous_values),
+                ),
+            )
+
+        for uid, previous_values in previous_state.items():
+            if uid in state:
+                continue
+            # A single invalid dataset must not delete the dataset, so it keeps its previous values until it's valid again
+            if keep_missing or uid in failed_uids:
+                state[uid] = previous_values
+                continue
+            changes.append(
+                RealtimeChange(
+                    change_type=RealtimeChangeType.DELETE,
+                    source_uid=source_uid,
+                    uid=uid,
+                    realtime_input=None,
+                    previous_values=json.loads(previous_values),
+                ),
+            )
+
+        with self._lock:
+            self._states[(source_uid, data_type)] = state
+            if self.state_dir is not None and len(changes) > 0:
+                self._store_state(source_uid, data_type, state)
+
+        return changes
+
+    def _serialize(self, realtime_input: RealtimeParkingSiteInput | RealtimeParkingSpotInput) -> str:
+        values = {
+            key: value for key, value in to_serializable_dict(realtime_input).items() if key not in self.IGNORED_FIELDS
+        }
+        return json.dumps(values, cls=DefaultJSONEncoder, sort_keys=True, separators=(',', ':'))
+
+    def _load_state(self, source_uid: str, data_type: str) -> dict[str, str]:
+        state = self._states.get((source_uid, data_type))
+        if state is not None:
+            return state
+
+        state = {}
+        if self.state_dir is not None:
+            try:
+                state = json.loads(self._get_path(source_uid, data_type).read_text())
+            except FileNotFoundError:
+                pass
+            except ValueError:
+                # Broken state files are handled as empty state, they get replaced at the next change
+                pass
+
+        self._states[(source_uid, data_type)] = state
+        return state
+
+    def _store_state(self, source_uid: str, data_type: str, state: dict[str, str]) -> None:
+        path = self._get_path(source_uid, data_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile('w', dir=path.parent, prefix=f'.{path.name}-', delete=False) as temp_file:
+            json.dump(state, temp_file, separators=(',', ':'))
+        os.replace(temp_file.name, path)
+
+    def _get_path(self, source_uid: str, data_type: str) -> Path:
+        return Path(self.state_dir, f'{source_uid}-{data_type}.json')  # type: ignore
@@ -6,13 +6,13 @@ Use of this source code is governed by an MIT-style license that can be found in
 import argparse
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
-from parkapi_sources import ParkAPISources
-from parkapi_sources.converters.base_converter.pull import PullConverter
+from parkapi_sources import ParkAPISources, SourceResult
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
-from parkapi_sources.util import DefaultJSONEncoder
+from parkapi_sources.util import ColumnarWriter, DefaultJSONEncoder, to_serializable_dict
 
 
 def main():
@@ -26,9 +26,15 @@ def main():
         '-t',
         '--type',
         dest='output_type',
-        choices=['json', 'geojson'],
+        choices=['json', 'geojson', 'columnar'],
         default='json',
-        help='Output format.',
+        help='Output format. Columnar output needs an output file or directory.',
+    )
+    parser.add_argument(
+        '--ndjson',
+        dest='ndjson',
+        action='store_true',
+        help='Output one JSON document per line: a source for JSON output, a feature for GeoJSON output.',
     )
     parser.add_argument(
         '-d',
@@ -42,6 +48,26 @@ def main():
         dest='output_file',
         help='Single File where all data should be saved in one file.',
     )
+    parser.add_argument(
+        '-p',
+        '--parallel',
+        dest='parallel',
+        type=int,
+        default=1,
+        help='Amount of sources which are fetched at the same time.',
+    )
+    parser.add_argument(
+        '--processes',
+        dest='use_processes',
+        action='store_true',
+        help='Fetch sources in worker processes instead of threads, which uses multiple cores for static imports.',
+    )
+    parser.add_argument(
+        '--source-timeout',
+        dest='source_timeout',
+        type=float,
+        help='Wall-clock budget in seconds per source. Sources exceeding it are skipped.',
+    )
     parser.add_argument(
         '-gtd',
         '--geojson-template-directory',
@@ -72,6 +98,12 @@ def main():
     if output_file_path is not None and output_directory is not None:
         raise ValueError('output directory and output file cannot be set at the same time.')
 
+    if args.output_type == 'columnar' and output_file_path is None and output_directory is None:
+        raise ValueError('Columnar output needs an output file or an output directory.')
+
+    if args.output_type == 'columnar' and args.ndjson:
+        raise ValueError('NDJSON is just available for JSON and GeoJSON output.')
+
     # Load config variables from environment
     config = dict(os.environ)
     if geojson_template_directory is not None:
@@ -82,75 +114,211 @@ def main():
     # Check if all credentials are given by env vars.
     parkapi_sources.check_credentials()
 
-    # Initiate result dict. We collect all info in one dict because we decide later if we output it to stdout, to a single file or to
-    # multiple files. The list has always two entries, one first is a StaticParkingSiteInput, second an Optional[RealtimeParkingSiteInput].
-    result: dict[
-        str, tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]
-    ] = {}
-    for source_uid, converter in parkapi_sources.converter_by_uid.items():
-        result[source_uid] = (converter.source_info, {})
-
-    # Iterate over sources and get all the data
-    for source_uid, (_, source_results) in result.items():
-        converter: PullConverter = parkapi_sources.converter_by_uid[source_uid]  # type: ignore
-
-        static_parking_site_inputs, _ = converter.get_static_parking_sites()
-        for static_parking_site_input in static_parking_site_inputs:
-            source_results[static_parking_site_input.uid] = [static_parking_site_input, None]
-
-        realtime_parking_site_inputs, _ = converter.get_realtime_parking_sites()
-        for realtime_parking_site_input in realtime_parking_site_inputs:
-            # If the realtime uid does not have a corresponding static dataset: ignore the realtime dataset
-            if realtime_parking_site_input.uid not in result[source_uid][1]:
-                continue
-            source_results[realtime_parking_site_input.uid][1] = realtime_parking_site_input
+    if args.output_type == 'columnar':
+        output_writer: ColumnarOutputWriter | JsonOutputWriter = ColumnarOutputWriter(
+            output_file_path=output_file_path,
+            output_directory=output_directory,
+        )
+    else:
+        output_writer = JsonOutputWriter(
+            output_type=args.output_type,
+            ndjson=args.ndjson,
+            output_file_path=output_file_path,
+            output_directory=output_directory,
+        )
 
-    if args.output_type == 'geojson':
+    # Fetch all sources, up to args.parallel at the same time, and write each source in the order of the sources as soon
+    # as it and all sources before it are done, so the output does not depend on the amount of parallel sources
+    try:
+        for source_result in parkapi_sources.iter_run_pull_converters(
+            parallel=args.parallel,
+            source_timeout=args.source_timeout,
+            include_parking_spots=False,
+            use_processes=args.use_processes,
+            ordered=True,
+        ):
+            source_uid = source_result.source_info.uid
+            if not source_result.success or source_result.import_exceptions:
+                report_source_errors(source_uid, source_result)
+            # Failed sources have no or incomplete data, so they are just reported, but not written
+            if not source_result.success or source_result.aborted:
+                continue
+            if source_result.static_data_unchanged:
+                sys.stderr.write(f'{source_uid}: static data unchanged since last run\n')
+
+            output_writer.write_source(source_result.source_info, get_source_results(source_result))
+    finally:
+        output_writer.close()
+
+
+class JsonOutputWriter:
+    """
+    Writes JSON or GeoJSON output source by source. A single output is framed incrementally as JSON array or GeoJSON
+    FeatureCollection, or written as NDJSON with one source dict or GeoJSON feature per line. With an output directory,
+    each source gets its own file.
+    """
+
+    output_type: str
+    ndjson: bool
+    output_directory: Optional[Path]
+    _output: Optional[TextIO]
+    _has_items: bool
+
+    def __init__(
+        self,
+        output_type: str,
+        ndjson: bool,
+        output_file_path: Optional[Path] = None,
+        output_directory: Optional[Path] = None,
+    ):
+        self.output_type = output_type
+        self.ndjson = ndjson
+        self.output_directory = output_directory
+        self._has_items = False
+
+        self._output = None
         if output_directory is None:
-            # If we don't have an output directory, we have to create a single GeoJSON file with all features
-            output_geojson_features: list[dict] = []
-            for source_info, source_results in result.values():
-                output_geojson_features += source_results_to_geojson_feature(source_info, source_results)
-
-            output_geojson = json_dump(geojson_collection(output_geojson_features))
-            if output_file_path is None:
-                print(output_geojson)  # noqa: T201
-            else:
-                with output_file_path.open('w') as output_file:
-                    output_file.write(output_geojson)
+            self._output = sys.stdout if output_file_path is None else output_file_path.open('w')
+
+    def write_source(
+        self,
+        source_info: SourceInfo,
+        source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
+    ):
+        if self.output_type == 'geojson':
+            output_items = source_results_to_geojson_feature(source_info, source_results)
+        else:
+            output_items = [source_results_to_dict(source_info, source_results)]
+
+        if self.output_directory is not None:
+            suffix = 'ndjson' if self.ndjson else self.output_type
+            with Path(self.output_directory, f'{source_info.uid}.{suffix}').open('w') as output_file:
+                if self.ndjson:
+                    self._write_lines(output_file, output_items)
+                elif self.output_type == 'geojson':
+                    output_file.write(json_dump(geojson_collection(output_items)))
+                else:
+                    output_file.write(json_dump(output_items[0]))
+            return
+
+        if self.ndjson:
+            self._write_lines(self._output, output_items)
+        else:
+            for output_item in output_items:
+                self._output.write(', ' if self._has_items else self._get_opening())
+                self._output.write(json_dump(output_item))
+                self._has_items = True
+        self._output.flush()
+
+    def close(self):
+        if self._output is None:
             return
 
-        # If we have an output directory, we have to split the GeoJSON data up in separate files
-        for source_info, source_results in result.values():
-            geojson_file_path = Path(output_directory, f'{source_info.uid}.geojson')
-            output_geojson_features = source_results_to_geojson_feature(source_info, source_results)
-            output_geojson = json_dump(geojson_collection(output_geojson_features))
-            with geojson_file_path.open('w') as geojson_file:
-                geojson_file.write(output_geojson)
-
-        return
-
-    if output_directory is None:
-        # If we don't have an output directory, we have to create a single JSON file with all the data
-        output_dicts: list[dict] = []
-        for source_info, source_results in result.values():
-            output_dicts.append(source_results_to_dict(source_info, source_results))
-
-        output_json = json_dump(output_dicts)
-        if output_file_path is None:
-            print(output_json)  # noqa: T201
+        if not self.ndjson:
+            if not self._has_items:
+                self._output.write(self._get_opening())
+            self._output.write(']}\n' if self.output_type == 'geojson' else ']\n')
+
+        if self._output is sys.stdout:
+            self._output.flush()
         else:
-            with output_file_path.open('w') as output_file:
-                output_file.write(output_json)
-        return
+            self._output.close()
+
+    def _get_opening(self) -> str:
+        return '{"type": "FeatureCollection", "features": [' if self.output_type == 'geojson' else '['
+
+    @staticmethod
+    def _write_lines(output: TextIO, output_items: list[dict]):
+        for output_item in output_items:
+            output.write(json_dump(output_item))
+            output.write('\n')
+
+
+class ColumnarOutputWriter:
+    """
+    Writes columnar output source by source, either as one row group per source into a single file, or as one file per
+    source into an output directory.
+    """
+
+    output_directory: Optional[Path]
+    _columnar_writer: Optional[ColumnarWriter]
+
+    def __init__(self, output_file_path: Optional[Path] = None, output_directory: Optional[Path] = None):
+        self.output_directory = output_directory
+        self._columnar_writer = None if output_file_path is None else ColumnarWriter(output_file_path)
+
+    def write_source(
+        self,
+        source_info: SourceInfo,
+        source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
+    ):
+        if self._columnar_writer is not None:
+            # All sources share the tables of a single file, so each row gets its source uid
+            write_columnar_source_results(self._columnar_writer, source_info, source_results, with_source_uid=True)
+            return
+
+        with ColumnarWriter(Path(self.output_directory, f'{source_info.uid}.pkcol')) as columnar_writer:
+            write_columnar_source_results(columnar_writer, source_info, source_results)
+
+    def close(self):
+        if self._columnar_writer is not None:
+            self._columnar_writer.close()
+
+
+def get_source_results(
+    source_result: SourceResult,
+) -> dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]:
+    """
+    Returns static and realtime inputs per uid. The list has always two entries, the first one is a
+    StaticParkingSiteInput, the second one an Optional[RealtimeParkingSiteInput].
+    """
+    source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]] = {}
+    for static_parking_site_input in source_result.static_parking_site_inputs:
+        source_results[static_parking_site_input.uid] = [static_parking_site_input, None]
 
-    for source_info, source_results in result.values():
-        geojson_file_path = Path(output_directory, f'{source_info.uid}.json')
-        output_dict = source_results_to_dict(source_info, source_results)
-        output_json = json_dump(output_dict)
+    for realtime_parking_site_input in source_result.realtime_parking_site_inputs:
+        # If the realtime uid does not have a corresponding static dataset: ignore the realtime dataset
+        if realtime_parking_site_input.uid not in source_results:
+            continue
+        source_results[realtime_parking_site_input.uid][1] = realtime_parking_site_input
 
-        with geojson_file_path.open('w') as geojson_file:
-            geojson_file.write(output_json)
+    return source_results
+
+
+def report_source_errors(source_uid: str, source_result: SourceResult):
+    if source_result.timed_out:
+        sys.stderr.write(f'{source_uid}: source timed out after {source_result.duration} seconds\n')
+    if source_result.exception is not None:
+        sys.stderr.write(f'{source_uid}: unexpected error: {source_result.exception!r}\n')
+    if source_result.aborted:
+        sys.stderr.write(f'{source_uid}: source aborted: {source_result.import_exceptions[-1]}\n')
+    if source_result.import_exceptions:
+        sys.stderr.write(f'{source_uid}: {len(source_result.import_exceptions)} import exceptions\n')
+
+
+def write_columnar_source_results(
+    columnar_writer: ColumnarWriter,
+    source_info: SourceInfo,
+    source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
+    with_source_uid: bool = False,
+):
+    constant_columns: Optional[dict[str, str]] = {'source_uid': source_info.uid} if with_source_uid else None
+    columnar_writer.write_table(
+        'static_parking_sites',
+        StaticParkingSiteInput,
+        [static_parking_site_input for static_parking_site_input, _ in source_results.values()],
+        constant_columns=constant_columns,
+    )
+    columnar_writer.write_table(
+        'realtime_parking_sites',
+        RealtimeParkingSiteInput,
+        [
+            realtime_parking_site_input
+            for _, realtime_parking_site_input in source_results.values()
+            if realtime_parking_site_input is not None
+        ],
+        constant_columns=constant_columns,
+    )
 
 
 def parking_site_inputs_to_geojson_feature(
@@ -164,8 +332,8 @@ def parking_site_inputs_to_geojson_feature(
             'coordinates': [float(static_parking_site_input.lon), float(static_parking_site_input.lat)],
         },
         'properties': {
-            **static_parking_site_input.to_dict(),
-            **({} if realtime_parking_site_input is None else realtime_parking_site_input.to_dict()),
+            **to_serializable_dict(static_parking_site_input),
+            **({} if realtime_parking_site_input is None else to_serializable_dict(realtime_parking_site_input)),
             'source': source_info.to_dict(),
         },
         'type': 'Feature',
@@ -215,10 +383,10 @@ def source_results_to_parking_site_dicts(
 ) -> list[dict]:
     output_json_items: list[dict] = []
     for static_parking_site_input, realtime_parking_site_input in source_results.values():
-        output_json_item = static_parking_site_input.to_dict()
+        output_json_item = to_serializable_dict(static_parking_site_input)
 
         if realtime_parking_site_input is not None:
-            output_json_item.update(realtime_parking_site_input.to_dict())
+            output_json_item.update(to_serializable_dict(realtime_parking_site_input))
 
         output_json_items.append(output_json_item)
 
@@ -3,10 +3,26 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from .columnar import ColumnarReader, ColumnarWriter
+from .concurrent_fetcher import ConcurrentFetcher, HostRateLimiter
 from .config_helper import ConfigHelper
 from .dict import AnyDict
-from .encoding import DefaultJSONEncoder
-from .helper import round_7d
+from .encoding import DefaultJSONEncoder, to_serializable_dict
+from .exception_state import ExceptionState, get_exception_state, restore_exception
+from .helper import round_7d, round_7d_all
+from .http_cache import HttpCache, HttpCacheEntry
+from .metrics import MetricsCollector, MetricsHook, PhaseDuration, PhaseTimer
 from .multi_point_generator import generate_point
+from .projection_helper import (
+    UTM32_PROJ_KWARGS,
+    get_utm32_transformer,
+    reproject_utm32_lat_lon,
+    transform_utm32_coordinates,
+    transform_utm32_geometries,
+)
 from .request_helper import RequestHelper
-from .xml_helper import XMLHelper
+from .static_patch_store import StaticPatchFile, StaticPatchStore
+from .static_result_cache import StaticResultCache
+from .template_cache import CachedTemplate, TemplateCache
+from .token_cache import TokenCache
+from .xml_helper import XMLHelper, XMLToDictConverter
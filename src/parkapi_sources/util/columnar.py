@@ -0,0 +1,313 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import dataclasses
+import json
+import mmap
+import sys
+import types
+from array import array
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Optional, Union, get_args, get_origin
+
+from validataclass.helpers import UnsetValue, UnsetValueType
+
+from .encoding import DefaultJSONEncoder
+
+COLUMNAR_MAGIC = b'PKCOL1\x00\x00'
+COLUMNAR_VERSION = 1
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Array type codes per column type, all numeric buffers are stored little-endian
+ARRAY_TYPE_CODES: dict[str, str] = {
+    'bool': 'B',
+    'int64': 'q',
+    'float64': 'd',
+    'timestamp': 'q',
+    'dictionary': 'i',
+}
+
+
+class ColumnarWriter:
+    """
+    Writes inputs column by column into a local file, which can be bulk-loaded or memory-mapped. Each dataclass field is
+    one column: strings are stored as int64 offsets and UTF-8 data, ints, bools and timestamps (microseconds since
+    epoch, UTC) as numeric arrays, coordinates and other decimals as float64 arrays, and enums dictionary-encoded as
+    int32 codes with the values in the footer. Nested values like restrictions, tags or geometries are stored as JSON
+    strings. Columns with missing values get a validity buffer with one byte per row.
+
+    The file starts with a magic, followed by 8-byte aligned buffers, a JSON footer describing all tables, the footer
+    length as uint64 and the magic again. As the footer is written last, each `write_table()` call is written at once
+    as a row group, so sources can be written one after another. Row groups of the same table have to share the model
+    and the constant columns.
+    """
+
+    path: Path
+    _file: BinaryIO
+    _position: int
+    _tables: dict[str, dict]
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file = self.path.open('wb')
+        self._file.write(COLUMNAR_MAGIC)
+        self._position = len(COLUMNAR_MAGIC)
+        self._tables = {}
+
+    def write_table(
+        self,
+        name: str,
+        model: type,
+        items: Iterable[Any],
+        constant_columns: Optional[dict[str, str]] = None,
+    ) -> None:
+        """
+        Writes `items` as a row group of table `name`. Items can be any objects with the attributes of the dataclass
+        `model`, e.g. inputs or realtime records. `constant_columns` adds dictionary-encoded columns with the same value
+        in each row, like the source uid.
+        """
+        items = list(items)
+        constant_columns = constant_columns or {}
+        column_types: dict[str, str] = {key: 'dictionary' for key in constant_columns}
+        column_types.update({field.name: get_column_type(field.type) for field in dataclasses.fields(model)})
+
+        table = self._tables.get(name)
+        if table is None:
+            table = {'columns': column_types, 'row_groups': []}
+            self._tables[name] = table
+        elif table['columns'] != column_types:
+            raise ValueError(f'Row group does not match the columns of table {name}.')
+
+        row_group_columns: dict[str, dict] = {}
+        for column_name, column_type in column_types.items():
+            if column_name in constant_columns:
+                values: list = [constant_columns[column_name]] * len(items)
+            else:
+                values = [getattr(item, column_name) for item in items]
+            row_group_columns[column_name] = self._write_column(column_type, values)
+
+        table['row_groups'].append({'row_count': len(items), 'columns': row_group_columns})
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+
+        footer = json.dumps({'version': COLUMNAR_VERSION, 'tables': self._tables}, separators=(',', ':')).encode()
+        self._file.write(footer)
+        self._file.write(len(footer).to_bytes(8, 'little'))
+        self._file.write(COLUMNAR_MAGIC)
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnarWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write_column(self, column_type: str, values: list) -> dict:
+        validity = bytearray(value is not None and value is not UnsetValue for value in values)
+        column: dict[str, Any] = {'buffers': {}}
+        if not all(validity):
+            column['buffers']['validity'] = self._write_buffer(bytes(validity))
+
+        if column_type in ('string', 'json'):
+            offsets = array('q', [0])
+            data = bytearray()
+            for value, is_valid in zip(values, validity):
+                if is_valid:
+                    data += self._to_string(column_type, value).encode()
+                offsets.append(len(data))
+            column['buffers']['offsets'] = self._write_buffer(self._array_to_bytes(offsets))
+            column['buffers']['data'] = self._write_buffer(bytes(data))
+            return column
+
+        if column_type == 'dictionary':
+            codes_by_value: dict[Any, int] = {}
+            codes = array(ARRAY_TYPE_CODES[column_type])
+            for value, is_valid in zip(values, validity):
+                codes.append(codes_by_value.setdefault(value, len(codes_by_value)) if is_valid else -1)
+            column['dictionary'] = [value.value if isinstance(value, Enum) else value for value in codes_by_value]
+            column['buffers']['data'] = self._write_buffer(self._array_to_bytes(codes))
+            return column
+
+        data_array = array(
+            ARRAY_TYPE_CODES[column_type],
+            [self._to_number(column_type, value) if is_valid else 0 for value, is_valid in zip(values, validity)],
+        )
+        column['buffers']['data'] = self._write_buffer(self._array_to_bytes(data_array))
+        return column
+
+    def _write_buffer(self, data: bytes) -> list[int]:
+        offset = self._position
+        self._file.write(data)
+        # Keeps all buffers 8-byte aligned, so they can be used directly from a memory map
+        padding = -len(data) % 8
+        self._file.write(b'\x00' * padding)
+        self._position += len(data) + padding
+        return [offset, len(data)]
+
+    @staticmethod
+    def _to_string(column_type: str, value: Any) -> str:
+        if column_type == 'json':
+            return json.dumps(value, cls=DefaultJSONEncoder, separators=(',', ':'))
+        return value
+
+    @staticmethod
+    def _to_number(column_type: str, value: Any) -> int | float:
+        if column_type == 'timestamp':
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return (value - EPOCH) // timedelta(microseconds=1)
+        if column_type == 'float64':
+            return float(value)
+        return int(value)
+
+    @staticmethod
+    def _array_to_bytes(data_array: array) -> bytes:
+        if sys.byteorder == 'big':
+            data_array.byteswap()
+        return data_array.tobytes()
+
+
+class ColumnarReader:
+    """
+    Reads files of `ColumnarWriter` via a memory map. `read_column()` and `read_table()` decode values, with enums as
+    their values, decimals as floats and nested values as parsed JSON. `get_buffer()` returns raw buffers without
+    copying them, e.g. for bulk loading.
+    """
+
+    path: Path
+    tables: dict[str, dict]
+    _file: BinaryIO
+    _mmap: mmap.mmap
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file = self.path.open('rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic_length = len(COLUMNAR_MAGIC)
+        if self._mmap[:magic_length] != COLUMNAR_MAGIC or self._mmap[-magic_length:] != COLUMNAR_MAGIC:
+            self.close()
+            raise ValueError(f'{self.path} is not a columnar file.')
+
+        footer_end = len(self._mmap) - magic_length - 8
+        footer_length = int.from_bytes(self._mmap[footer_end : footer_end + 8], 'little')
+        footer = json.loads(self._mmap[footer_end - footer_length : footer_end])
+        self.tables = footer['tables']
+
+    def get_row_count(self, table_name: str) -> int:
+        return sum(row_group['row_count'] for row_group in self.tables[table_name]['row_groups'])
+
+    def get_column_types(self, table_name: str) -> dict[str, str]:
+        return dict(self.tables[table_name]['columns'])
+
+    def get_buffer(self, table_name: str, row_group_index: int, column_name: str, buffer_name: str) -> memoryview:
+        column = self.tables[table_name]['row_groups'][row_group_index]['columns'][column_name]
+        offset, length = column['buffers'][buffer_name]
+        return memoryview(self._mmap)[offset : offset + length]
+
+    def read_column(self, table_name: str, column_name: str) -> list:
+        column_type = self.tables[table_name]['columns'][column_name]
+        values: list = []
+        for row_group_index, row_group in enumerate(self.tables[table_name]['row_groups']):
+            values += self._read_row_group_column(table_name, row_group_index, row_group, column_name, column_type)
+        return values
+
+    def read_table(self, table_name: str) -> list[dict[str, Any]]:
+        columns = {
+            column_name: self.read_column(table_name, column_name) for column_name in self.tables[table_name]['columns']
+        }
+        return [dict(zip(columns.keys(), row)) for row in zip(*columns.values())]
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnarReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _read_row_group_column(
+        self,
+        table_name: str,
+        row_group_index: int,
+        row_group: dict,
+        column_name: str,
+        column_type: str,
+    ) -> list:
+        column = row_group['columns'][column_name]
+        row_count = row_group['row_count']
+        if 'validity' in column['buffers']:
+            validity: bytes | list[bool] = bytes(self.get_buffer(table_name, row_group_index, column_name, 'validity'))
+        else:
+            validity = [True] * row_count
+
+        if column_type in ('string', 'json'):
+            offsets = self._read_array('q', self.get_buffer(table_name, row_group_index, column_name, 'offsets'))
+            data = bytes(self.get_buffer(table_name, row_group_index, column_name, 'data'))
+            values: list = []
+            for index in range(row_count):
+                if not validity[index]:
+                    values.append(None)
+                    continue
+                value = data[offsets[index] : offsets[index + 1]].decode()
+                values.append(json.loads(value) if column_type == 'json' else value)
+            return values
+
+        data_array = self._read_array(
+            ARRAY_TYPE_CODES[column_type],
+            self.get_buffer(table_name, row_group_index, column_name, 'data'),
+        )
+        if column_type == 'dictionary':
+            dictionary = column['dictionary']
+            return [dictionary[code] if code >= 0 else None for code in data_array]
+        if column_type == 'timestamp':
+            return [
+                EPOCH + timedelta(microseconds=value) if is_valid else None
+                for value, is_valid in zip(data_array, validity)
+            ]
+        if column_type == 'bool':
+            return [bool(value) if is_valid else None for value, is_valid in zip(data_array, validity)]
+        return [value if is_valid else None for value, is_valid in zip(data_array, validity)]
+
+    @staticmethod
+    def _read_array(type_code: str, buffer: memoryview) -> array:
+        data_array = array(type_code, bytes(buffer))
+        if sys.byteorder == 'big':
+            data_array.byteswap()
+        return data_array
+
+
+def get_column_type(field_type: Any) -> str:
+    # Optional and unset values are handled by the validity buffer, so just the actual value type matters
+    if get_origin(field_type) in (Union, types.UnionType):
+        value_types = [item for item in get_args(field_type) if item not in (type(None), UnsetValueType)]
+        if len(value_types) != 1:
+            return 'json'
+        field_type = value_types[0]
+
+    if not isinstance(field_type, type):
+        return 'json'
+    if issubclass(field_type, Enum):
+        return 'dictionary'
+    if issubclass(field_type, str):
+        return 'string'
+    # bool is a subclass of int, so it has to be checked first
+    if issubclass(field_type, bool):
+        return 'bool'
+    if issubclass(field_type, int):
+        return 'int64'
+    if issubclass(field_type, (Decimal, float)):
+        return 'float64'
+    if issubclass(field_type, datetime):
+        return 'timestamp'
+    return 'json'
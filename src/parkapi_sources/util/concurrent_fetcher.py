@@ -0,0 +1,64 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+T = TypeVar('T')
+
+
+class HostRateLimiter:
+    """
+    Limits the amount of requests started per second and host. Slots are reserved under a lock, but the waiting itself
+    happens outside of it, so requests to other hosts are not blocked.
+    """
+
+    _interval: float
+    _next_slot_by_host: dict[str, float]
+    _lock: Lock
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1 / requests_per_second
+        self._next_slot_by_host = {}
+        self._lock = Lock()
+
+    def wait(self, host: str) -> None:
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_slot_by_host.get(host, now))
+            self._next_slot_by_host[host] = slot + self._interval
+
+        if slot > now:
+            sleep(slot - now)
+
+
+class ConcurrentFetcher:
+    """
+    Runs a fetch function for a list of request kwargs with at most `max_in_flight` requests at the same time and an
+    optional rate limit per host. Results keep the order of the given request kwargs. As with sequential requests, the
+    first exception in order is raised.
+    """
+
+    max_in_flight: int
+    rate_limiter: Optional[HostRateLimiter]
+
+    def __init__(self, max_in_flight: int, requests_per_second: Optional[float] = None):
+        self.max_in_flight = max_in_flight
+        self.rate_limiter = None if requests_per_second is None else HostRateLimiter(requests_per_second)
+
+    def fetch_all(self, fetch: Callable[..., T], request_kwargs_list: list[dict[str, Any]]) -> list[T]:
+        def fetch_one(request_kwargs: dict[str, Any]) -> T:
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait(urlparse(request_kwargs['url']).netloc)
+            return fetch(**request_kwargs)
+
+        if self.max_in_flight <= 1 or len(request_kwargs_list) <= 1:
+            return [fetch_one(request_kwargs) for request_kwargs in request_kwargs_list]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(request_kwargs_list))) as executor:
+            return list(executor.map(fetch_one, request_kwargs_list))
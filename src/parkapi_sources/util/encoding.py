@@ -3,41 +3,123 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import dataclasses
 import json
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
 import shapely
 from isodate import Duration, duration_isoformat
 from shapely.geometry.base import BaseGeometry
+from validataclass.dataclasses import ValidataclassMixin
+from validataclass.helpers import UnsetValue
+
+# Values of these types are serialized by the json module itself
+JSON_NATIVE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None), list, tuple, dict})
+
+# Handlers per exact class, looked up once per class by _get_handler()
+_handlers: dict[type, Callable[[Any], Any]] = {}
+
+# Field encoders per validataclass, built once per class by _get_dataclass_encoder()
+_dataclass_encoders: dict[type, Callable[[Any], dict[str, Any]]] = {}
 
 
 def convert_to_serializable_value(obj: Any) -> Any:
+    handler = _handlers.get(type(obj))
+    if handler is None:
+        handler = _get_handler(obj)
+        _handlers[type(obj)] = handler
+    return handler(obj)
+
+
+def to_serializable_dict(obj: Any) -> dict[str, Any]:
+    """
+    Returns the same data as `obj.to_dict()`, but with serializable values at the first level. For validataclasses,
+    it uses a field encoder instead of `dataclasses.asdict()`, so nested values are neither copied nor converted to
+    dicts up front. Nested values are handled by `DefaultJSONEncoder` later on.
+    """
+    dataclass_encoder = _dataclass_encoders.get(type(obj))
+    if dataclass_encoder is not None:
+        return dataclass_encoder(obj)
+    if _uses_validataclass_to_dict(type(obj)):
+        return _get_dataclass_encoder(type(obj))(obj)
+    return obj.to_dict()
+
+
+def _get_handler(obj: Any) -> Callable[[Any], Any]:
+    # The order matters, as datetime is a subclass of date
     if isinstance(obj, datetime):
-        return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return _convert_datetime
     if isinstance(obj, date):
-        return obj.isoformat()
-    if isinstance(obj, timedelta) or isinstance(obj, Duration):
-        return duration_isoformat(obj)
+        return date.isoformat
+    if isinstance(obj, (timedelta, Duration)):
+        return duration_isoformat
     if isinstance(obj, Decimal):
-        return str(obj)
+        return str
     if isinstance(obj, Enum):
-        return obj.value
+        return _convert_enum
     if isinstance(obj, bytes):
-        return obj.decode()
+        return bytes.decode
     if isinstance(obj, BaseGeometry):
-        return shapely.geometry.mapping(obj)
+        return shapely.geometry.mapping
 
     # Serialize data models (not only, but mostly ORM) using to_dict.
+    if _uses_validataclass_to_dict(type(obj)):
+        return _get_dataclass_encoder(type(obj))
     if hasattr(obj, 'to_dict'):
-        return obj.to_dict()
+        return _convert_with_to_dict
 
     # Fallback to either the object's attribute dictionary or cast it to a string
     if hasattr(obj, '__dict__'):
-        return obj.__dict__
-    return str(obj)
+        return _convert_with_attribute_dict
+    return str
+
+
+def _get_dataclass_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    dataclass_encoder = _dataclass_encoders.get(cls)
+    if dataclass_encoder is not None:
+        return dataclass_encoder
+
+    field_names: tuple[str, ...] = tuple(field.name for field in dataclasses.fields(cls))
+    # attrgetter gets all field values at once as a tuple, but it returns single values for a single field
+    get_values: Callable[[Any], tuple] = (
+        attrgetter(*field_names)
+        if len(field_names) > 1
+        else lambda obj: tuple(getattr(obj, field_name) for field_name in field_names)
+    )
+
+    def dataclass_encoder(obj: Any) -> dict[str, Any]:
+        return {
+            field_name: value if type(value) in JSON_NATIVE_TYPES else convert_to_serializable_value(value)
+            for field_name, value in zip(field_names, get_values(obj))
+            if value is not UnsetValue
+        }
+
+    _dataclass_encoders[cls] = dataclass_encoder
+    return dataclass_encoder
+
+
+def _uses_validataclass_to_dict(cls: type) -> bool:
+    return dataclasses.is_dataclass(cls) and getattr(cls, 'to_dict', None) is ValidataclassMixin.to_dict
+
+
+def _convert_datetime(obj: datetime) -> str:
+    return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _convert_enum(obj: Enum) -> Any:
+    return obj.value
+
+
+def _convert_with_to_dict(obj: Any) -> Any:
+    return obj.to_dict()
+
+
+def _convert_with_attribute_dict(obj: Any) -> dict[str, Any]:
+    return obj.__dict__
 
 
 class DefaultJSONEncoder(json.JSONEncoder):
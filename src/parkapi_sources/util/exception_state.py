@@ -0,0 +1,24 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from typing import Any
+
+ExceptionState = tuple[type[BaseException], tuple, dict[str, Any]]
+
+
+def get_exception_state(exception: BaseException) -> ExceptionState:
+    """
+    ImportExceptions don't pass their arguments to Exception, so they cannot be pickled directly. Their state can be
+    pickled instead, e.g. for on-disk caches or for sending them from worker processes.
+    """
+    return type(exception), exception.args, exception.__dict__
+
+
+def restore_exception(exception_state: ExceptionState) -> BaseException:
+    exception_class, exception_args, exception_dict = exception_state
+    exception = exception_class.__new__(exception_class)
+    exception.args = exception_args
+    exception.__dict__.update(exception_dict)
+    return exception
@@ -4,9 +4,22 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable
+
+DECIMAL_7D = Decimal('1.0000000')
 
 
 def round_7d(value: Decimal | float) -> Decimal:
     if isinstance(value, float):
         value = Decimal(str(value))
-    return value.quantize(Decimal('1.0000000'), rounding=ROUND_HALF_UP)
+    return value.quantize(DECIMAL_7D, rounding=ROUND_HALF_UP)
+
+
+def round_7d_all(values: Iterable[Decimal | float]) -> list[Decimal]:
+    """
+    Same as `round_7d`, but for a whole batch of values, e.g. the result of a coordinate transformation.
+    """
+    return [
+        (Decimal(str(value)) if isinstance(value, float) else value).quantize(DECIMAL_7D, rounding=ROUND_HALF_UP)
+        for value in values
+    ]
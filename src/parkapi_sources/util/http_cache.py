@@ -0,0 +1,143 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class HttpCacheEntry:
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    encoding: Optional[str]
+    body: bytes
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('Last-Modified')
+
+    def to_response(self, request_response: Response) -> Response:
+        """
+        Builds a response from the cached body, using the request of the actual (304) response.
+        """
+        response = Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.url = self.url
+        response.reason = 'OK'
+        response.request = request_response.request
+        response.elapsed = request_response.elapsed
+        response._content = self.body
+        return response
+
+
+class HttpCache:
+    """
+    On-disk cache for responses with ETag or Last-Modified validators. Each entry is stored in a single file at
+    `{cache_dir}/{source_uid}/{key}`, containing a JSON line with the metadata followed by the raw body. Files are
+    replaced atomically, so concurrent readers never see partial entries.
+    """
+
+    cache_dir: Path
+
+    # The body is stored decoded, and hop-by-hop or connection specific headers are not valid for a cached response
+    IGNORED_HEADERS = frozenset({'connection', 'content-encoding', 'content-length', 'set-cookie', 'transfer-encoding'})
+
+    def __init__(self, cache_dir: Path | str):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def build_key(method: str, request_kwargs: dict[str, Any]) -> str:
+        # Everything which could change the response is part of the key. It's hashed, so credentials are not stored.
+        key_data = [
+            method.upper(),
+            request_kwargs.get('url'),
+            request_kwargs.get('params'),
+            sorted((request_kwargs.get('headers') or {}).items()),
+            request_kwargs.get('auth'),
+        ]
+        return sha256(json.dumps(key_data, default=str, sort_keys=True).encode()).hexdigest()
+
+    def get(self, source_uid: str, key: str) -> Optional[HttpCacheEntry]:
+        try:
+            data = self._get_path(source_uid, key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        metadata_line, _, body = data.partition(b'\n')
+        try:
+            return HttpCacheEntry(**json.loads(metadata_line), body=body)
+        except (ValueError, TypeError):
+            # Broken or outdated entries are just handled as missing, they get replaced at the next store
+            return None
+
+    def set(self, source_uid: str, key: str, entry: HttpCacheEntry) -> None:
+        path = self._get_path(source_uid, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        metadata = asdict(entry)
+        metadata.pop('body')
+
+        with NamedTemporaryFile('wb', dir=path.parent, prefix=f'.{key}-', delete=False) as temp_file:
+            temp_file.write(json.dumps(metadata).encode())
+            temp_file.write(b'\n')
+            temp_file.write(entry.body)
+        os.replace(temp_file.name, path)
+
+    def add_conditional_headers(self, entry: HttpCacheEntry, headers: dict[str, str]) -> dict[str, str]:
+        headers = dict(headers)
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def build_entry(self, response: Response) -> Optional[HttpCacheEntry]:
+        """
+        Returns a cache entry for successful responses which can be validated later, otherwise None.
+        """
+        if response.status_code != 200:
+            return None
+        if 'ETag' not in response.headers and 'Last-Modified' not in response.headers:
+            return None
+
+        return HttpCacheEntry(
+            url=response.url,
+            status_code=response.status_code,
+            headers={key: value for key, value in response.headers.items() if key.lower() not in self.IGNORED_HEADERS},
+            encoding=response.encoding,
+            body=response.content,
+        )
+
+    def update_entry(self, entry: HttpCacheEntry, not_modified_response: Response) -> bool:
+        """
+        Applies updated validators of a 304 response to the entry. Returns True if the entry changed.
+        """
+        changed = False
+        for header in ('ETag', 'Last-Modified'):
+            value = not_modified_response.headers.get(header)
+            if value is None or CaseInsensitiveDict(entry.headers).get(header) == value:
+                continue
+            entry.headers = {key: item for key, item in entry.headers.items() if key.lower() != header.lower()}
+            entry.headers[header] = value
+            changed = True
+        return changed
+
+    def _get_path(self, source_uid: str, key: str) -> Path:
+        return Path(self.cache_dir, source_uid, key)
@@ -0,0 +1,195 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+
+
+class MetricsHook(ABC):
+    """
+    Receives metrics per source. Durations are reported per phase in seconds, e.g. `fetch`, `parse`, `validate`, `map`
+    and `patch`, counters by name, e.g. `requests`, `bytes_received`, `records` and `errors`. Converters run in
+    parallel threads, so implementations have to be thread-safe.
+    """
+
+    @abstractmethod
+    def observe_duration(self, source_uid: str, phase: str, duration: float) -> None: ...
+
+    @abstractmethod
+    def increment(self, source_uid: str, counter: str, value: int = 1) -> None: ...
+
+    def increment_labelled(self, source_uid: str, counter: str, labels: dict[str, str], value: int = 1) -> None:
+        """
+        Increments a counter with additional labels, e.g. `request_errors` per `error_type`. Hooks without label support
+        just count it without labels.
+        """
+        self.increment(source_uid, counter, value)
+
+
+@dataclass
+class PhaseDuration:
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+
+class MetricsCollector(MetricsHook):
+    """
+    Thread-safe in-memory metrics hook, which can be scraped as dict or in the Prometheus text format.
+    """
+
+    _durations: defaultdict[tuple[str, str], PhaseDuration]
+    _counters: defaultdict[tuple[str, str], int]
+    _labelled_counters: defaultdict[tuple[str, str, tuple[tuple[str, str], ...]], int]
+    _lock: Lock
+
+    def __init__(self):
+        self._durations = defaultdict(PhaseDuration)
+        self._counters = defaultdict(int)
+        self._labelled_counters = defaultdict(int)
+        self._lock = Lock()
+
+    def observe_duration(self, source_uid: str, phase: str, duration: float) -> None:
+        with self._lock:
+            phase_duration = self._durations[(source_uid, phase)]
+            phase_duration.count += 1
+            phase_duration.sum += duration
+            phase_duration.max = max(phase_duration.max, duration)
+
+    def increment(self, source_uid: str, counter: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[(source_uid, counter)] += value
+
+    def increment_labelled(self, source_uid: str, counter: str, labels: dict[str, str], value: int = 1) -> None:
+        with self._lock:
+            self._labelled_counters[(source_uid, counter, tuple(sorted(labels.items())))] += value
+
+    def get_durations(self) -> dict[str, dict[str, PhaseDuration]]:
+        with self._lock:
+            durations: dict[str, dict[str, PhaseDuration]] = {}
+            for (source_uid, phase), phase_duration in self._durations.items():
+                durations.setdefault(source_uid, {})[phase] = PhaseDuration(**phase_duration.__dict__)
+            return durations
+
+    def get_counters(self) -> dict[str, dict[str, int]]:
+        """
+        Returns all counters per source. Labelled counters are summed up over all labels.
+        """
+        with self._lock:
+            counters: dict[str, dict[str, int]] = {}
+            for (source_uid, counter), value in self._counters.items():
+                counters.setdefault(source_uid, {})[counter] = value
+            for (source_uid, counter, _), value in self._labelled_counters.items():
+                source_counters = counters.setdefault(source_uid, {})
+                source_counters[counter] = source_counters.get(counter, 0) + value
+            return counters
+
+    def get_labelled_counters(self) -> dict[str, dict[str, dict[tuple[tuple[str, str], ...], int]]]:
+        """
+        Returns labelled counters per source and counter, keyed by their sorted label items.
+        """
+        with self._lock:
+            counters: dict[str, dict[str, dict[tuple[tuple[str, str], ...], int]]] = {}
+            for (source_uid, counter, labels), value in self._labelled_counters.items():
+                counters.setdefault(source_uid, {}).setdefault(counter, {})[labels] = value
+            return counters
+
+    def reset(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._counters.clear()
+            self._labelled_counters.clear()
+
+    def to_prometheus_text(self, namespace: str = 'parkapi_sources') -> str:
+        with self._lock:
+            durations = sorted(self._durations.items())
+            counters = sorted(
+                [((source_uid, counter, ()), value) for (source_uid, counter), value in self._counters.items()]
+                + list(self._labelled_counters.items())
+            )
+
+        lines: list[str] = []
+        if durations:
+            metric_name = f'{namespace}_phase_duration_seconds'
+            lines += [
+                f'# HELP {metric_name} Time spent per source and phase.',
+                f'# TYPE {metric_name} summary',
+            ]
+            for (source_uid, phase), phase_duration in durations:
+                labels = f'source="{self._escape(source_uid)}",phase="{self._escape(phase)}"'
+                lines += [
+                    f'{metric_name}_count{{{labels}}} {phase_duration.count}',
+                    f'{metric_name}_sum{{{labels}}} {phase_duration.sum!r}',
+                ]
+
+        counter_names = sorted({counter for (_, counter, _), _ in counters})
+        for counter in counter_names:
+            metric_name = f'{namespace}_{counter}_total'
+            lines.append(f'# TYPE {metric_name} counter')
+            for (source_uid, item_counter, labels), value in counters:
+                if item_counter == counter:
+                    label_text = ''.join(f',{key}="{self._escape(label)}"' for key, label in labels)
+                    lines.append(f'{metric_name}{{source="{self._escape(source_uid)}"{label_text}}} {value}')
+
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PhaseTimer:
+    """
+    Accumulates the time of interleaved phases, like validating and mapping each item of a list, and reports the sums
+    once at `stop()`. `switch()` ends the current phase and starts the next one. Without a metrics hook, it does
+    nothing, so it's cheap enough for hot loops.
+    """
+
+    metrics_hook: Optional[MetricsHook]
+    source_uid: str
+    _durations: dict[str, float]
+    _phase: Optional[str]
+    _started_at: float
+
+    def __init__(self, metrics_hook: Optional[MetricsHook], source_uid: str, phase: Optional[str] = None):
+        self.metrics_hook = metrics_hook
+        self.source_uid = source_uid
+        self._durations = {}
+        self._phase = None
+        if phase is not None:
+            self.switch(phase)
+
+    def switch(self, phase: str) -> None:
+        if self.metrics_hook is None:
+            return
+
+        now = perf_counter()
+        if self._phase is not None:
+            self._durations[self._phase] = self._durations.get(self._phase, 0.0) + now - self._started_at
+        self._phase = phase
+        self._started_at = now
+
+    def pause(self) -> None:
+        """
+        Ends the current phase without starting another one, e.g. while a generator waits for its consumer.
+        """
+        if self.metrics_hook is None or self._phase is None:
+            return
+
+        self._durations[self._phase] = self._durations.get(self._phase, 0.0) + perf_counter() - self._started_at
+        self._phase = None
+
+    def stop(self) -> None:
+        if self.metrics_hook is None:
+            return
+
+        self.pause()
+        for phase, duration in self._durations.items():
+            self.metrics_hook.observe_duration(self.source_uid, phase, duration)
+        self._durations = {}
@@ -0,0 +1,75 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import local
+from typing import Any, Iterable, Sequence
+
+import pyproj
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from .helper import round_7d_all
+
+UTM32_PROJ_KWARGS: dict[str, Any] = {'proj': 'utm', 'zone': 32, 'ellps': 'WGS84', 'preserve_units': True}
+
+_thread_local = local()
+
+
+def get_utm32_transformer() -> pyproj.Transformer:
+    """
+    Returns a cached transformer from UTM zone 32 to longitude / latitude, which gives the same results as
+    `pyproj.Proj(**UTM32_PROJ_KWARGS)(x, y, inverse=True)`. Transformers should not be shared between threads, so there
+    is one per thread.
+    """
+    transformer: pyproj.Transformer | None = getattr(_thread_local, 'utm32_transformer', None)
+    if transformer is None:
+        crs = pyproj.CRS.from_dict(UTM32_PROJ_KWARGS)
+        transformer = pyproj.Transformer.from_crs(crs, crs.geodetic_crs, always_xy=True)
+        _thread_local.utm32_transformer = transformer
+    return transformer
+
+
+def transform_utm32_coordinates(
+    eastings: Sequence[float],
+    northings: Sequence[float],
+) -> tuple[list[float], list[float]]:
+    """
+    Transforms UTM32 coordinates to longitudes and latitudes in one call for the whole batch.
+    """
+    if len(eastings) == 0:
+        return [], []
+    longitudes, latitudes = get_utm32_transformer().transform(list(eastings), list(northings))
+    return list(longitudes), list(latitudes)
+
+
+def transform_utm32_geometries(geometries: Sequence[BaseGeometry]) -> list[BaseGeometry]:
+    """
+    Transforms the coordinates of all geometries from UTM32 to longitude / latitude in one call for the whole batch.
+    """
+    if len(geometries) == 0:
+        return []
+    transformer = get_utm32_transformer()
+    return list(
+        shapely.transform(
+            list(geometries),
+            lambda *coordinates: transformer.transform(*coordinates),
+            interleaved=False,
+        ),
+    )
+
+
+def reproject_utm32_lat_lon(items: Iterable[Any]) -> None:
+    """
+    Sets `lat` and `lon` of items which hold UTM32 northings and eastings there, typically `StaticParkingSiteInput`s,
+    to rounded latitudes and longitudes.
+    """
+    items = list(items)
+    longitudes, latitudes = transform_utm32_coordinates(
+        [float(item.lon) for item in items],
+        [float(item.lat) for item in items],
+    )
+    for item, lon, lat in zip(items, round_7d_all(longitudes), round_7d_all(latitudes), strict=True):
+        item.lon = lon
+        item.lat = lat
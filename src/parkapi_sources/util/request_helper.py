@@ -5,14 +5,23 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 import os
 from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NotRequired, TypedDict, Unpack
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NotRequired, Optional, TypedDict, Unpack
+from urllib.parse import urlparse
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from parkapi_sources.exceptions import MissingConfigException
 
 from .config_helper import ConfigHelper
+from .http_cache import HttpCache
+from .metrics import MetricsHook
+from .token_cache import TokenCache
 
 if TYPE_CHECKING:
     from parkapi_sources.models import SourceInfo
@@ -38,11 +47,40 @@ class RequestKwargs(TypedDict):
 
 class RequestHelper:
     config_helper: ConfigHelper
+    # Shared by all converters using this helper, so tokens survive between import runs
+    token_cache: TokenCache
+    _sessions: dict[tuple[str, str, str], Session]
+    _sessions_lock: Lock
+    _http_cache: HttpCache | None = None
+    # Gets fetch durations and request counters per source, and is used by converters for their own metrics
+    metrics_hook: Optional[MetricsHook]
 
-    def __init__(self, config_helper: ConfigHelper):
+    # Default (connect, read) timeout applied when a caller does not set one. The short connect timeout
+    # bounds the TLS handshake, so an unresponsive host cannot block a request indefinitely.
+    DEFAULT_TIMEOUT = (5, 30)
+    # Default amount of keep-alive connections per host, can be overwritten by config value REQUEST_POOL_MAXSIZE
+    DEFAULT_POOL_MAXSIZE = 10
+    # Default amount of retries on connection errors and gateway errors, can be overwritten by REQUEST_MAX_RETRIES
+    DEFAULT_MAX_RETRIES = 2
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(self, config_helper: ConfigHelper, metrics_hook: Optional[MetricsHook] = None):
         self.config_helper = config_helper
+        self.metrics_hook = metrics_hook
+        self._sessions = {}
+        self._sessions_lock = Lock()
+        self.token_cache = TokenCache()
+
+    def get(self, *, source_info: 'SourceInfo', http_cache: bool = False, **kwargs: Unpack[RequestKwargs]) -> Response:
+        """
+        Converters set `http_cache` for static data requests which can be served from the HTTP cache. The cache is just
+        used if it's enabled for the source by config values HTTP_CACHE_DIR and HTTP_CACHE_SOURCES.
+        """
+        if http_cache:
+            cache = self._get_http_cache(source_info)
+            if cache is not None:
+                return self._cached_get(cache, source_info=source_info, **kwargs)
 
-    def get(self, *, source_info: 'SourceInfo', **kwargs: Unpack[RequestKwargs]) -> Response:
         return self._request(source_info=source_info, method='get', **kwargs)
 
     def post(self, *, source_info: 'SourceInfo', **kwargs: Unpack[RequestKwargs]) -> Response:
@@ -57,19 +95,151 @@ class RequestHelper:
     def delete(self, *, source_info: 'SourceInfo', **kwargs: Unpack[RequestKwargs]) -> Response:
         return self._request(source_info=source_info, method='delete', **kwargs)
 
-    # Default (connect, read) timeout applied when a caller does not set one. The short connect timeout
-    # bounds the TLS handshake, so an unresponsive host cannot block a request indefinitely.
-    DEFAULT_TIMEOUT = (5, 30)
+    def close(self) -> None:
+        """
+        Closes all pooled sessions. The helper can still be used afterwards, new sessions are created on demand.
+        """
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.close()
 
     def _request(self, *, source_info: 'SourceInfo', method: str, **kwargs: Unpack[RequestKwargs]) -> Response:
         kwargs.setdefault('timeout', self.DEFAULT_TIMEOUT)
 
-        with Session() as session:
+        session = self._get_session(source_info, kwargs['url'])
+        start = perf_counter()
+        try:
             response = session.request(method=method, **kwargs)
+        except Exception as e:
+            if self.metrics_hook is not None:
+                self.metrics_hook.increment_labelled(
+                    source_info.uid,
+                    'request_errors',
+                    {'error_type': e.__class__.__name__},
+                )
+            raise
+        finally:
+            # Failed requests, e.g. timeouts, are measured as well, as they are often the slowest ones
+            if self.metrics_hook is not None:
+                self.metrics_hook.observe_duration(source_info.uid, 'fetch', perf_counter() - start)
+
+        if self.metrics_hook is not None:
+            self._add_request_metrics(source_info, response, stream=bool(kwargs.get('stream')))
+
+        self._handle_request_response(source_info, response)
+
+        return response
+
+    def _cached_get(self, cache: HttpCache, *, source_info: 'SourceInfo', **kwargs: Unpack[RequestKwargs]) -> Response:
+        """
+        Does a conditional request with the validators of the cached response, and returns the cached body if the
+        upstream server answers with 304 Not Modified.
+        """
+        key = cache.build_key('get', kwargs)
+        entry = cache.get(source_info.uid, key)
+        if entry is not None:
+            kwargs['headers'] = cache.add_conditional_headers(entry, kwargs.get('headers') or {})
+
+        response = self._request(source_info=source_info, method='get', **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            if cache.update_entry(entry, response):
+                cache.set(source_info.uid, key, entry)
+            return entry.to_response(response)
+
+        new_entry = cache.build_entry(response)
+        if new_entry is not None:
+            cache.set(source_info.uid, key, new_entry)
+
+        return response
+
+    def _get_http_cache(self, source_info: 'SourceInfo') -> HttpCache | None:
+        http_cache_dir: str | None = self.config_helper.get('HTTP_CACHE_DIR')
+        if not http_cache_dir:
+            return None
+        if source_info.uid not in (self.config_helper.get('HTTP_CACHE_SOURCES') or []):
+            return None
+
+        # The cache is stateless apart from its directory, so it's just re-created if the directory changes
+        if self._http_cache is None or self._http_cache.cache_dir != Path(http_cache_dir):
+            self._http_cache = HttpCache(http_cache_dir)
+
+        return self._http_cache
+
+    def _get_session(self, source_info: 'SourceInfo', url: str) -> Session:
+        """
+        Returns a long-living session per source and host, so subsequent requests re-use keep-alive connections instead
+        of doing a new TCP and TLS handshake. Sessions are separated per source, so nothing set at one source can leak
+        into another one. Client certificates given via `cert` are part of the connection pool key in requests, so
+        connections with and without certificates are never mixed up.
+        """
+        parsed_url = urlparse(url)
+        session_key = (source_info.uid, parsed_url.scheme, parsed_url.netloc)
+
+        with self._sessions_lock:
+            session = self._sessions.get(session_key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[session_key] = session
+
+        return session
+
+    def _create_session(self) -> Session:
+        session = Session()
+        # Converters expect stateless requests, so cookies are never persisted between requests. Cookies set during
+        # redirects still work, because requests handles them at a request-level cookie jar.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        pool_maxsize = self._get_int_config('REQUEST_POOL_MAXSIZE', self.DEFAULT_POOL_MAXSIZE)
+        max_retries = self._get_int_config('REQUEST_MAX_RETRIES', self.DEFAULT_MAX_RETRIES)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                # Read errors are not retried, because some sources have very long timeouts
+                read=0,
+                status=max_retries,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                backoff_factor=0.5,
+                raise_on_status=False,
+            ),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    def _get_int_config(self, key: str, default: int) -> int:
+        value = self.config_helper.get(key)
+        # Config values from env vars are strings, so we have to cast them
+        return default if value is None else int(value)
 
-            self._handle_request_response(source_info, response)
+    def _add_request_metrics(self, source_info: 'SourceInfo', response: Response, stream: bool) -> None:
+        self.metrics_hook.increment(source_info.uid, 'requests')
+        if response.status_code >= 400:
+            self.metrics_hook.increment(source_info.uid, 'http_errors')
+        bytes_received = self._get_bytes_received(response, stream)
+        if bytes_received is not None:
+            self.metrics_hook.increment(source_info.uid, 'bytes_received', bytes_received)
 
-            return response
+    @staticmethod
+    def _get_bytes_received(response: Response, stream: bool) -> int | None:
+        """
+        Returns the size of the body as transferred, so compressed bodies count with their compressed size. Streamed
+        bodies without Content-Length are not counted, because they are not read yet.
+        """
+        content_length = response.headers.get('Content-Length')
+        if content_length is not None and content_length.isdigit():
+            return int(content_length)
+        if stream or not hasattr(response.raw, 'tell'):
+            return None
+        # For already loaded bodies, urllib3 counts the bytes read from the connection before decoding
+        return response.raw.tell()
 
     def _handle_request_response(self, source_info: 'SourceInfo', response: Response) -> None:
         if source_info.uid not in self.config_helper.get('DEBUG_SOURCES', []):
@@ -103,6 +273,6 @@ class RequestHelper:
         with metadata_file_path.open('w') as metadata_file:
             metadata_file.writelines('\n'.join(metadata))
 
+        # Loads streamed bodies as well, so they are still available for the caller after dumping them
         with response_body_file_path.open('wb') as response_file:
-            for chunk in response.iter_content(chunk_size=128):
-                response_file.write(chunk)
+            response_file.write(response.content)
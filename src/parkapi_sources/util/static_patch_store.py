@@ -0,0 +1,138 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+
+from validataclass.exceptions import ValidationError
+from validataclass.validators import DataclassValidator
+
+from parkapi_sources.exceptions import ImportSourceException
+
+
+@dataclass
+class StaticPatchFile:
+    # mtime in nanoseconds and size, so changes within the mtime resolution are detected in most cases, too
+    version: tuple[int, int]
+    field_updates_by_uid: dict[str, dict[str, Any]]
+    # Errors which were not taken by pop_import_exceptions() yet
+    import_exceptions: list[ImportSourceException] = field(default_factory=list)
+
+
+class StaticPatchStore:
+    """
+    Thread-safe store for static patch files, meant to live as long as the process. Each patch file is parsed and
+    validated once, and just loaded again if its mtime or size changed. Valid patches are compiled to field updates per
+    uid, so applying them is a dict lookup per input. Errors in patch files are kept until they are taken once by
+    `pop_import_exceptions()`.
+    """
+
+    _patch_files: dict[Path, StaticPatchFile]
+    _lock: Lock
+
+    # These fields hold child objects, so they are taken from the validated patch instead of its dict representation,
+    # and just if they are not empty.
+    CHILD_OBJECT_FIELDS = ('external_identifiers', 'restrictions')
+
+    def __init__(self):
+        self._patch_files = {}
+        self._lock = Lock()
+
+    def get_field_updates_by_uid(
+        self,
+        path: Path,
+        source_uid: str,
+        patch_list_validator: DataclassValidator,
+        patch_validator: DataclassValidator,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Returns the field updates per uid of the patch file at `path`. Field updates must not be modified.
+        """
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._patch_files.pop(path, None)
+            return {}
+
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._lock:
+            patch_file = self._patch_files.get(path)
+            if patch_file is None or patch_file.version != version:
+                patch_file = self._load(path, version, source_uid, patch_list_validator, patch_validator)
+                self._patch_files[path] = patch_file
+
+            return patch_file.field_updates_by_uid
+
+    def pop_import_exceptions(self, path: Path) -> list[ImportSourceException]:
+        with self._lock:
+            patch_file: Optional[StaticPatchFile] = self._patch_files.get(path)
+            if patch_file is None:
+                return []
+            import_exceptions = patch_file.import_exceptions
+            patch_file.import_exceptions = []
+            return import_exceptions
+
+    def clear(self) -> None:
+        with self._lock:
+            self._patch_files = {}
+
+    @classmethod
+    def apply_field_updates(cls, parking_input: Any, field_updates: dict[str, Any]) -> None:
+        for key, value in field_updates.items():
+            # Lists are copied, so inputs don't share them with the store or with each other
+            setattr(parking_input, key, list(value) if isinstance(value, list) else value)
+
+    def _load(
+        self,
+        path: Path,
+        version: tuple[int, int],
+        source_uid: str,
+        patch_list_validator: DataclassValidator,
+        patch_validator: DataclassValidator,
+    ) -> StaticPatchFile:
+        patch_file = StaticPatchFile(version=version, field_updates_by_uid={})
+
+        try:
+            items = patch_list_validator.validate(json.loads(path.read_text()))
+        except ValueError as e:
+            patch_file.import_exceptions.append(
+                ImportSourceException(source_uid=source_uid, message=f'invalid static patch file {path}: {e}'),
+            )
+            return patch_file
+        except ValidationError as e:
+            patch_file.import_exceptions.append(
+                ImportSourceException(
+                    source_uid=source_uid, message=f'invalid static patch file {path}: {e.to_dict()}'
+                ),
+            )
+            return patch_file
+
+        for item_dict in items.items:
+            try:
+                parking_patch = patch_validator.validate(item_dict)
+            except ValidationError as e:
+                patch_file.import_exceptions.append(
+                    ImportSourceException(
+                        source_uid=source_uid,
+                        message=f'invalid static patch {item_dict} in {path}: {e.to_dict()}',
+                    ),
+                )
+                continue
+
+            field_updates = {
+                key: value for key, value in parking_patch.to_dict().items() if key not in self.CHILD_OBJECT_FIELDS
+            }
+            for key in self.CHILD_OBJECT_FIELDS:
+                if getattr(parking_patch, key, None):
+                    field_updates[key] = getattr(parking_patch, key)
+
+            # Several patches for the same uid are applied in order
+            patch_file.field_updates_by_uid.setdefault(parking_patch.uid, {}).update(field_updates)
+
+        return patch_file
@@ -0,0 +1,77 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import os
+import pickle  # noqa: S403
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional
+
+from .exception_state import get_exception_state, restore_exception
+
+try:
+    PACKAGE_VERSION = version('parkapi_sources')
+except PackageNotFoundError:
+    PACKAGE_VERSION = 'dev'
+
+
+class StaticResultCache:
+    """
+    On-disk cache for the results of static imports. Results are stored per source and result type at
+    `{cache_dir}/{source_uid}-{result_type}.pickle`, together with a key which is built from the raw upstream data, the
+    patch file and the package version. If the key matches, the stored result can be used instead of parsing and
+    validating the same data again. Pickle files are just read from the local cache dir which is written by this
+    class, so they are as trusted as the code itself.
+    """
+
+    cache_dir: Path
+
+    # Bump if the stored format changes
+    FORMAT_VERSION = 2
+
+    def __init__(self, cache_dir: Path | str):
+        self.cache_dir = Path(cache_dir)
+
+    @classmethod
+    def build_key(cls, raw_data: bytes, patch_data: Optional[bytes], key_data: Any = None) -> str:
+        """
+        `key_data` contains anything else which changes the result, like config values used by the converter.
+        """
+        key_hash = sha256(f'{cls.FORMAT_VERSION}\x00{PACKAGE_VERSION}\x00'.encode())
+        key_hash.update(sha256(raw_data).digest())
+        key_hash.update(b'\x00' if patch_data is None else sha256(patch_data).digest())
+        key_hash.update(json.dumps(key_data, default=str, sort_keys=True).encode())
+        return key_hash.hexdigest()
+
+    def get(self, source_uid: str, result_type: str, key: str) -> Optional[tuple[list, list]]:
+        try:
+            with self._get_path(source_uid, result_type).open('rb') as cache_file:
+                cached_key, inputs, exception_states = pickle.load(cache_file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError, TypeError, ValueError):
+            # Broken entries or entries with outdated classes are handled as missing, they get replaced at next set
+            return None
+
+        if cached_key != key:
+            return None
+
+        return inputs, [restore_exception(exception_state) for exception_state in exception_states]
+
+    def set(self, source_uid: str, result_type: str, key: str, inputs: list, import_exceptions: list) -> None:
+        path = self._get_path(source_uid, result_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        exception_states = [get_exception_state(exception) for exception in import_exceptions]
+
+        with NamedTemporaryFile('wb', dir=path.parent, prefix=f'.{path.name}-', delete=False) as temp_file:
+            pickle.dump((key, inputs, exception_states), temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file.name, path)
+
+    def _get_path(self, source_uid: str, result_type: str) -> Path:
+        return Path(self.cache_dir, f'{source_uid}-{result_type}.pickle')
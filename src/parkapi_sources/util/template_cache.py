@@ -0,0 +1,89 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional
+
+
+@dataclass
+class CachedTemplate:
+    items: list
+    import_exceptions: list
+    version: str
+    checked_at: float
+
+
+class TemplateCache:
+    """
+    Thread-safe cache for validated static templates, meant to live as long as the process. Within `ttl` seconds after
+    the last check, cached templates are returned without any I/O. After that, the template source is checked again,
+    and if its version did not change, the validated template is kept without parsing and validating it again.
+    """
+
+    _templates: dict[str, CachedTemplate]
+    _lock: Lock
+    _key_locks: defaultdict[str, Lock]
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = Lock()
+        self._key_locks = defaultdict(Lock)
+
+    def get(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[Optional[str]], tuple[str, Optional[bytes]]],
+        parse: Callable[[bytes], tuple[list, list]],
+    ) -> tuple[list, list]:
+        """
+        `fetch` gets the known version, or None if there is none, and returns the current version and the raw data. It
+        can skip loading the data and return None instead if the current version is the known version. `parse` turns
+        the raw data into validated items and import exceptions.
+
+        Cached items are shared, so they must not be modified. The returned lists are copies, so callers can extend
+        them.
+        """
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        with key_lock:
+            cached_template = self._templates.get(key)
+            if cached_template is None or cached_template.checked_at + ttl <= monotonic():
+                cached_template = self._refresh(key, cached_template, fetch, parse)
+
+            return list(cached_template.items), list(cached_template.import_exceptions)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates = {}
+
+    def _refresh(
+        self,
+        key: str,
+        cached_template: Optional[CachedTemplate],
+        fetch: Callable[[Optional[str]], tuple[str, Optional[bytes]]],
+        parse: Callable[[bytes], tuple[list, list]],
+    ) -> CachedTemplate:
+        checked_at = monotonic()
+        version, data = fetch(None if cached_template is None else cached_template.version)
+
+        if cached_template is not None and version == cached_template.version:
+            cached_template.checked_at = checked_at
+            return cached_template
+
+        items, import_exceptions = parse(data)  # type: ignore
+        cached_template = CachedTemplate(
+            items=items,
+            import_exceptions=import_exceptions,
+            version=version,
+            checked_at=checked_at,
+        )
+        self._templates[key] = cached_template
+
+        return cached_template
@@ -0,0 +1,82 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional
+
+
+@dataclass
+class CachedToken:
+    token: str
+    expires_at: float
+
+
+class TokenCache:
+    """
+    Thread-safe cache for access tokens. Tokens are stored by a key which should contain the source and the
+    credentials, so changed credentials lead to a new token. Concurrent requests for the same key just fetch one token.
+    """
+
+    _tokens: dict[str, CachedToken]
+    _lock: Lock
+    _key_locks: defaultdict[str, Lock]
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = Lock()
+        self._key_locks = defaultdict(Lock)
+
+    @staticmethod
+    def build_key(*parts: Optional[str]) -> str:
+        # Credentials are hashed, so they are not kept in plain text as dict keys
+        return sha256('\x00'.join('' if part is None else str(part) for part in parts).encode()).hexdigest()
+
+    def get(
+        self,
+        key: str,
+        fetch_token: Callable[[], tuple[str, Optional[float]]],
+        default_lifetime: float,
+        refresh_margin: float,
+    ) -> str:
+        """
+        Returns a cached token, or fetches a new one if there is none or if it expires within `refresh_margin`
+        seconds. `fetch_token` returns the token and its lifetime in seconds, or None if the lifetime is unknown.
+        """
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        with key_lock:
+            cached_token = self._tokens.get(key)
+            if cached_token is not None and cached_token.expires_at - refresh_margin > monotonic():
+                return cached_token.token
+
+            fetched_at = monotonic()
+            token, lifetime = fetch_token()
+            self._tokens[key] = CachedToken(
+                token=token,
+                expires_at=fetched_at + (default_lifetime if lifetime is None else lifetime),
+            )
+
+            return token
+
+    def invalidate(self, key: str, token: Optional[str] = None) -> None:
+        """
+        Removes a token from the cache. If `token` is given, the token is just removed if it's still the cached one, so
+        a token which was already refreshed by another thread is kept.
+        """
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        with key_lock:
+            cached_token = self._tokens.get(key)
+            if cached_token is None:
+                return
+            if token is not None and cached_token.token != token:
+                return
+            del self._tokens[key]
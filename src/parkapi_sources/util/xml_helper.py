@@ -3,11 +3,135 @@ Copyright 2023 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from collections import defaultdict
-from typing import List, Optional, Tuple
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
 
 from lxml import etree
 
+XSI_NAMESPACE_PREFIX = '{http://www.w3.org/2001/XMLSchema-instance}'
+
+
+class XMLToDictConverter:
+    """
+    Compiled version of 'XMLHelper.xml_to_dict': the option lists are turned into frozen sets once, and local tag names
+    are cached per tag, so the per-node work is reduced to set and dict lookups. Converters which parse the same kind
+    of document repeatedly should create one instance and re-use it. See 'XMLHelper.xml_to_dict' for the semantics of
+    the options.
+    """
+
+    ensure_array_keys: frozenset[tuple[str, str]]
+    remote_type_tags: frozenset[str]
+    conditional_remote_type_tags: frozenset[tuple[str, str]]
+    ignore_attributes: frozenset[str]
+    _local_name_by_tag: dict[str, str]
+
+    def __init__(
+        self,
+        ensure_array_keys: Optional[Iterable[Tuple[str, str]]] = None,
+        remote_type_tags: Optional[Iterable[str]] = None,
+        conditional_remote_type_tags: Optional[Iterable[Tuple[str, str]]] = None,
+        ignore_attributes: Optional[Iterable[str]] = None,
+    ):
+        self.ensure_array_keys = frozenset(ensure_array_keys or ())
+        self.remote_type_tags = frozenset(remote_type_tags or ())
+        self.conditional_remote_type_tags = frozenset(conditional_remote_type_tags or ())
+        self.ignore_attributes = frozenset(ignore_attributes or ())
+        self._local_name_by_tag = {}
+
+    def convert(self, tag: etree.Element) -> dict:
+        key, value = self._convert(tag)
+        # A key of None means that the tag itself is a remote type tag, so its value is already the result dict
+        return value if key is None else {key: value}
+
+    def iter_records(
+        self,
+        xml_source: IO[bytes],
+        record_tag: str,
+        parent_tag: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Compiled version of 'XMLHelper.iter_xml_records'.
+        """
+        for _, element in etree.iterparse(
+            xml_source,
+            events=('end',),
+            tag=f'{{*}}{record_tag}',
+            encoding=encoding,
+            resolve_entities=False,
+        ):
+            parent = element.getparent()
+            # Nested tags with the same name as the record are part of the record and not a record on their own
+            if parent_tag is not None and (parent is None or self._get_local_name(parent.tag) != parent_tag):
+                continue
+
+            record_dict = self.convert(element)
+            yield record_dict.get(record_tag, record_dict)
+
+            # Free the processed record and all siblings before it, as they are not needed anymore
+            element.clear(keep_tail=True)
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    def _get_local_name(self, tag: str) -> str:
+        local_name = self._local_name_by_tag.get(tag)
+        if local_name is None:
+            local_name = etree.QName(tag).localname
+            self._local_name_by_tag[tag] = local_name
+        return local_name
+
+    def _convert(self, tag: etree.Element) -> tuple[Optional[str], Any]:
+        tag_name = self._get_local_name(tag.tag)
+
+        # only parse attributes if there are any of them not in the ignore list
+        attributes: list[tuple[str, str]] = []
+        if tag.attrib:
+            attributes = [(key, value) for key, value in tag.attrib.items() if key not in self.ignore_attributes]
+
+        value: Any = {} if attributes else None
+        has_children = False
+        aggregated_children: dict[str, list] = {}
+        for child in tag:
+            has_children = True
+            child_key, child_value = self._convert(child)
+            child_items = child_value.items() if child_key is None else ((child_key, child_value),)
+            for key, item in child_items:
+                if key in aggregated_children:
+                    aggregated_children[key].append(item)
+                else:
+                    aggregated_children[key] = [item]
+
+        if has_children:
+            value = {}
+            for key, items in aggregated_children.items():
+                if key == 'class':
+                    key = 'class_'
+                value[key] = items[0] if len(items) == 1 and (tag_name, key) not in self.ensure_array_keys else items
+
+        for key, attribute_value in attributes:
+            value[key.replace(XSI_NAMESPACE_PREFIX, '')] = attribute_value
+
+        if tag.text:
+            text = tag.text.strip()
+            if has_children or attributes:
+                if text:
+                    value['_text'] = text
+            else:
+                value = text
+
+        if isinstance(value, dict):
+            # filter out remote type tags at the child level, which just works with exactly one key-value-pair
+            if len(value) == 1:
+                child_key, child_value = next(iter(value.items()))
+                if child_key in self.remote_type_tags or (tag_name, child_key) in self.conditional_remote_type_tags:
+                    value = child_value
+
+            # finally, filter out remote type tags at the top level, the return value still has to be a dict
+            if isinstance(value, dict) and tag_name in self.remote_type_tags:
+                return None, value
+
+        return tag_name, value
+
 
 class XMLHelper:
     """
@@ -184,78 +308,12 @@ class XMLHelper:
         'resultDescription': None
 
         """
-        # default empty lists for the optional arguments:
-        if ensure_array_keys is None:
-            ensure_array_keys = []
-        if remote_type_tags is None:
-            remote_type_tags = []
-        if conditional_remote_type_tags is None:
-            conditional_remote_type_tags = []
-        if ignore_attributes is None:
-            ignore_attributes = []
-
-        tag_name = etree.QName(tag).localname
-
-        # only parse attributes if there are any of them not in the ignore list
-        ignore_all_attribs: bool = False
-        if tag.attrib:
-            ignore_all_attribs = True
-            for key in tag.attrib.keys():
-                if key not in ignore_attributes:
-                    ignore_all_attribs = False
-
-        tag_dict = {tag_name: {} if (tag.attrib and not ignore_all_attribs) else None}
-        children = list(tag)
-        if children:
-            aggregated_child_dict = defaultdict(list)
-            for child in children:
-                child_dict = XMLHelper.xml_to_dict(
-                    child,
-                    ensure_array_keys,
-                    remote_type_tags,
-                    conditional_remote_type_tags,
-                    ignore_attributes,
-                )
-                for key, value in child_dict.items():
-                    aggregated_child_dict[key].append(value)
-            tag_dict = {tag_name: {}}
-            for key, value in aggregated_child_dict.items():
-                if key == 'class':
-                    key = 'class_'
-                if len(value) == 1 and (tag_name, key) not in ensure_array_keys:
-                    value = value[0]
-                tag_dict[tag_name][key] = value
-
-        if tag.attrib and not ignore_all_attribs:
-            for key, value in tag.attrib.items():
-                if key not in ignore_attributes:
-                    tag_dict[tag_name][key.replace('{http://www.w3.org/2001/XMLSchema-instance}', '')] = value
-
-        if tag.text:
-            text = tag.text.strip()
-            if children or (tag.attrib and not ignore_all_attribs):
-                if text:
-                    tag_dict[tag_name]['_text'] = text
-            else:
-                tag_dict[tag_name] = text
-
-        # filter out remote type tags at the child level:
-        if isinstance(tag_dict[tag_name], dict):
-            tag_items: list[tuple[str, str]] = [(key, value) for key, value in tag_dict[tag_name].items()]  # noqa: C416
-            # it only works if there is exactly one key-value-pair at the child level!
-            if len(tag_items) == 1:
-                child_key = tag_items[0][0]
-                child_value = tag_items[0][1]
-                # filter second level:
-                if child_key in remote_type_tags or (tag_name, child_key) in conditional_remote_type_tags:
-                    tag_dict[tag_name] = child_value
-
-        # finally, filter out remote type tags at the top level:
-        if isinstance(tag_dict[tag_name], dict) and tag_name in remote_type_tags:
-            # the return value still has to be a dict!
-            tag_dict = tag_dict[tag_name]
-
-        return tag_dict
+        return XMLToDictConverter(
+            ensure_array_keys=ensure_array_keys,
+            remote_type_tags=remote_type_tags,
+            conditional_remote_type_tags=conditional_remote_type_tags,
+            ignore_attributes=ignore_attributes,
+        ).convert(tag)
 
     @staticmethod
     def xml_string_to_dict(
@@ -277,3 +335,39 @@ class XMLHelper:
             ignore_attributes,
         )
         return result_dict
+
+    @staticmethod
+    def iter_xml_records(
+        xml_source: IO[bytes],
+        record_tag: str,
+        parent_tag: Optional[str] = None,
+        ensure_array_keys: Optional[List[Tuple[str, str]]] = None,
+        remote_type_tags: Optional[List[str]] = None,
+        conditional_remote_type_tags: Optional[List[Tuple[str, str]]] = None,
+        ignore_attributes: Optional[List[str]] = None,
+        encoding: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Streaming alternative to 'xml_to_dict' for documents which consist of a long list of records, like DATEX II
+        publications. Instead of converting the whole document, the file-like 'xml_source' is parsed incrementally and
+        each element named 'record_tag' (in any namespace) is converted with 'xml_to_dict' and yielded as the value of
+        its dict. If 'parent_tag' is given, just records which are direct children of a tag with this name are used.
+
+        The optional arguments have the same semantics as in 'xml_to_dict', but they are applied per record. Processed
+        records are removed from the tree, so the memory usage does not grow with the size of the document.
+
+        For example, with record_tag='parkingRecord' and parent_tag='parkingTable', this:
+
+            <parkingTable>
+                <parkingRecord><id>1</id></parkingRecord>
+                <parkingRecord><id>2</id></parkingRecord>
+            </parkingTable>
+
+        ... yields {'id': '1'} and {'id': '2'}.
+        """
+        return XMLToDictConverter(
+            ensure_array_keys=ensure_array_keys,
+            remote_type_tags=remote_type_tags,
+            conditional_remote_type_tags=conditional_remote_type_tags,
+            ignore_attributes=ignore_attributes,
+        ).iter_records(xml_source, record_tag=record_tag, parent_tag=parent_tag, encoding=encoding)
@@ -0,0 +1,258 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from threading import Event, Timer
+from time import sleep
+from unittest.mock import Mock
+
+import pytest
+
+from parkapi_sources import BatchRunner, RealtimeChangeType, RealtimeDeltaTracker
+from parkapi_sources.converters.base_converter.pull import ParkingSitePullConverter
+from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
+from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo
+from parkapi_sources.util import ConfigHelper, MetricsCollector
+
+
+class DummyPullConverter(ParkingSitePullConverter):
+    def __init__(self, uid: str, release: Event | None = None, exception: Exception | None = None):
+        super().__init__(config_helper=Mock(), request_helper=Mock())
+        self.uid = uid
+        self.release = release
+        self.exception = exception
+
+    # As a property, so the dummy is not picked up as a concrete converter by the registration tests
+    @property
+    def source_info(self) -> SourceInfo:
+        return SourceInfo(uid=self.uid, name=self.uid, has_realtime_data=False)
+
+    def get_static_parking_sites(self):
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        if self.exception is not None:
+            raise self.exception
+        return [], [ImportParkingSiteException(source_uid=self.source_info.uid, message='invalid')]
+
+
+class RealtimePullConverter(ParkingSitePullConverter):
+    """
+    Returns realtime data with free capacities by uid, and invalid datasets for uids with None.
+    """
+
+    def __init__(self, free_capacities: dict[str, int | None]):
+        super().__init__(config_helper=Mock(), request_helper=Mock())
+        self.free_capacities = free_capacities
+
+    @property
+    def source_info(self) -> SourceInfo:
+        return SourceInfo(uid='realtime', name='Realtime', has_realtime_data=True)
+
+    def get_static_parking_sites(self):
+        return [], []
+
+    def get_realtime_parking_sites(self):
+        realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
+        import_parking_site_exceptions: list[ImportParkingSiteException] = []
+        for uid, free_capacity in self.free_capacities.items():
+            if free_capacity is None:
+                import_parking_site_exceptions.append(
+                    ImportParkingSiteException(source_uid='realtime', parking_site_uid=uid, message='invalid'),
+                )
+                continue
+            realtime_parking_site_inputs.append(
+                RealtimeParkingSiteInput(
+                    uid=uid,
+                    realtime_data_updated_at=datetime.now(tz=timezone.utc),
+                    realtime_free_capacity=free_capacity,
+                ),
+            )
+        return realtime_parking_site_inputs, import_parking_site_exceptions
+
+
+class ProcessPullConverter(ParkingSitePullConverter):
+    """
+    Gets built by the worker processes from its class and config, so it uses the default constructor.
+    """
+
+    @property
+    def source_info(self) -> SourceInfo:
+        return SourceInfo(uid=self.config_helper.get('SOURCE_UID'), name='Process', has_realtime_data=False)
+
+    def get_static_parking_sites(self):
+        if self.config_helper.get('FAIL'):
+            raise ValueError('bug')
+        sleep(self.config_helper.get('SLEEP', 0))
+        return [], [
+            ImportParkingSiteException(source_uid=self.source_info.uid, parking_site_uid='1', message='invalid')
+        ]
+
+
+class BatchRunnerTest:
+    @staticmethod
+    def test_run_keeps_order_and_collects_exceptions():
+        converters = [
+            DummyPullConverter('first'),
+            DummyPullConverter('failing', exception=ImportSourceException(source_uid='failing', message='down')),
+            DummyPullConverter('broken', exception=ValueError('bug')),
+        ]
+
+        results = BatchRunner(parallel=3).run(converters)
+
+        assert list(results.keys()) == ['first', 'failing', 'broken']
+        assert results['first'].success
+        assert len(results['first'].import_exceptions) == 1
+        assert isinstance(results['failing'].import_exceptions[0], ImportSourceException)
+        assert results['failing'].aborted
+        assert not results['first'].aborted
+        assert isinstance(results['broken'].exception, ValueError)
+        assert not results['broken'].success
+
+    @staticmethod
+    def test_run_source_timeout():
+        release = Event()
+        converters = [DummyPullConverter('slow', release=release), DummyPullConverter('fast')]
+
+        results = BatchRunner(parallel=1, source_timeout=0.1).run(converters)
+        release.set()
+
+        assert results['slow'].timed_out
+        assert isinstance(results['slow'].import_exceptions[0], ImportSourceException)
+        assert results['fast'].success
+
+    @staticmethod
+    def test_iter_run_yields_results_when_done():
+        release = Event()
+        converters = [DummyPullConverter('slow', release=release), DummyPullConverter('fast')]
+
+        result_iterator = BatchRunner(parallel=2).iter_run(converters)
+
+        # The fast source is yielded while the slow one is still running
+        assert next(result_iterator).source_info.uid == 'fast'
+        release.set()
+        assert next(result_iterator).source_info.uid == 'slow'
+        assert next(result_iterator, None) is None
+
+    @staticmethod
+    def test_iter_run_ordered():
+        release = Event()
+        converters = [DummyPullConverter('slow', release=release), DummyPullConverter('fast')]
+
+        # The fast source is done first, but it is kept back until the slow one is done
+        Timer(0.2, release.set).start()
+        result_iterator = BatchRunner(parallel=2).iter_run(converters, ordered=True)
+
+        assert [result.source_info.uid for result in result_iterator] == ['slow', 'fast']
+
+    @staticmethod
+    def test_run_realtime_delta_tracker_skips_failed_sources():
+        tracker = RealtimeDeltaTracker()
+        tracker.get_parking_site_changes(
+            'failing',
+            [RealtimeParkingSiteInput(uid='1', realtime_data_updated_at=datetime.now(tz=timezone.utc))],
+        )
+        converters = [
+            DummyPullConverter('first'),
+            DummyPullConverter('failing', exception=ImportSourceException(source_uid='failing', message='down')),
+        ]
+
+        results = BatchRunner(realtime_delta_tracker=tracker).run(converters)
+
+        assert results['first'].realtime_parking_site_changes == []
+        # The aborted source must not report its known parking site as deleted
+        assert results['failing'].realtime_parking_site_changes == []
+        assert len(tracker.get_parking_site_changes('failing', [])) == 1
+
+    @staticmethod
+    def test_run_realtime_delta_tracker_keeps_invalid_datasets():
+        batch_runner = BatchRunner(realtime_delta_tracker=RealtimeDeltaTracker())
+        converter = RealtimePullConverter({'1': 10, '2': 20})
+
+        changes = batch_runner.run([converter])['realtime'].realtime_parking_site_changes
+        assert [(change.change_type, change.uid) for change in changes] == [
+            (RealtimeChangeType.INSERT, '1'),
+            (RealtimeChangeType.INSERT, '2'),
+        ]
+
+        # A single invalid dataset is neither deleted now nor inserted again at the next valid poll
+        converter.free_capacities = {'1': 10, '2': None}
+        assert batch_runner.run([converter])['realtime'].realtime_parking_site_changes == []
+
+        converter.free_capacities = {'1': 10, '2': 19}
+        changes = batch_runner.run([converter])['realtime'].realtime_parking_site_changes
+        assert [(change.change_type, change.uid) for change in changes] == [(RealtimeChangeType.UPDATE, '2')]
+        assert changes[0].previous_values['realtime_free_capacity'] == 20
+
+        converter.free_capacities = {'1': 10}
+        changes = batch_runner.run([converter])['realtime'].realtime_parking_site_changes
+        assert [(change.change_type, change.uid) for change in changes] == [(RealtimeChangeType.DELETE, '2')]
+
+    @staticmethod
+    def test_run_reports_metrics():
+        metrics_collector = MetricsCollector()
+        converters = [
+            DummyPullConverter('first'),
+            DummyPullConverter('broken', exception=ValueError('bug')),
+        ]
+        for converter in converters:
+            converter.request_helper.metrics_hook = metrics_collector
+
+        BatchRunner(parallel=2).run(converters)
+
+        assert metrics_collector.get_counters() == {
+            'first': {'records': 0, 'errors': 1},
+            'broken': {'records': 0, 'errors': 1},
+        }
+        assert metrics_collector.get_durations()['first']['run'].count == 1
+
+    @staticmethod
+    def test_run_use_processes():
+        converters = [
+            ProcessPullConverter(config_helper=ConfigHelper({'SOURCE_UID': uid, 'FAIL': fail}), request_helper=Mock())
+            for uid, fail in [('first', False), ('broken', True)]
+        ]
+
+        results = BatchRunner(parallel=2, use_processes=True).run(converters)
+
+        assert results['first'].success
+        import_exception = results['first'].import_exceptions[0]
+        assert isinstance(import_exception, ImportParkingSiteException)
+        assert import_exception.parking_site_uid == '1'
+        assert import_exception.message == 'invalid'
+        assert isinstance(results['broken'].exception, ValueError)
+        assert results['broken'].exception.args == ('bug',)
+
+    @staticmethod
+    def test_run_use_processes_source_timeout_starts_with_worker():
+        converters = [
+            ProcessPullConverter(
+                config_helper=ConfigHelper({'SOURCE_UID': uid, 'SLEEP': duration}), request_helper=Mock()
+            )
+            for uid, duration in [('slow', 3), ('waiting', 0)]
+        ]
+
+        with BatchRunner(parallel=1, source_timeout=1, use_processes=True) as batch_runner:
+            results = batch_runner.run(converters)
+
+        assert results['slow'].timed_out
+        # The timed out source keeps the only worker until it's done, but the waiting source gets its full budget then
+        assert results['waiting'].success
+
+    @staticmethod
+    def test_run_use_processes_reuses_executor():
+        converters = [
+            ProcessPullConverter(config_helper=ConfigHelper({'SOURCE_UID': 'first'}), request_helper=Mock()),
+        ]
+
+        with BatchRunner(use_processes=True) as batch_runner:
+            assert batch_runner.run(converters)['first'].success
+            executor = batch_runner._executor
+
+            assert batch_runner.run(converters)['first'].success
+            assert batch_runner._executor is executor
+
+        assert batch_runner._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
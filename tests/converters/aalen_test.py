@@ -3,14 +3,15 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import json
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from requests_mock import Mocker
 
 from parkapi_sources.converters import AalenPullConverter
-from parkapi_sources.util import RequestHelper
+from parkapi_sources.util import RequestHelper, TemplateCache
 from tests.converters.helper import validate_realtime_parking_site_inputs, validate_static_parking_site_inputs
 
 
@@ -55,3 +56,84 @@ class AalenPullConverterTest:
         assert len(import_parking_site_exceptions) == 0
 
         validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
+
+    @staticmethod
+    def test_get_static_parking_sites_template_cache(
+        mocked_config_helper: Mock,
+        request_helper: RequestHelper,
+        tmp_path: Path,
+    ):
+        config = {'STATIC_GEOJSON_BASE_PATH': str(tmp_path), 'STATIC_GEOJSON_CACHE_TTL': '0'}
+        mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+        aalen_pull_converter = AalenPullConverter(config_helper=mocked_config_helper, request_helper=request_helper)
+        aalen_pull_converter.static_geojson_template_cache = TemplateCache()
+
+        geojson_path = Path(tmp_path, 'aalen.geojson')
+        geojson_path.write_text(
+            json.dumps({
+                'type': 'FeatureCollection',
+                'features': [
+                    {
+                        'type': 'Feature',
+                        'properties': {'uid': 'parkhaus', 'name': 'Parkhaus', 'type': 'CAR_PARK', 'capacity': 100},
+                        'geometry': {'type': 'Point', 'coordinates': [10.09, 48.83]},
+                    },
+                ],
+            }),
+        )
+
+        with patch.object(
+            AalenPullConverter,
+            '_validate_geojson_parking_sites_features',
+            autospec=True,
+            side_effect=AalenPullConverter._validate_geojson_parking_sites_features,
+        ) as validate_features:
+            first_inputs, _ = aalen_pull_converter.get_static_parking_sites()
+            second_inputs, _ = aalen_pull_converter.get_static_parking_sites()
+
+            assert validate_features.call_count == 1
+            assert [item.name for item in first_inputs] == [item.name for item in second_inputs] == ['Parkhaus']
+
+            # Changing the file invalidates the cached template
+            geojson_path.write_text(geojson_path.read_text().replace('"Parkhaus"', '"Parkhaus Stadtmitte"'))
+            third_inputs, _ = aalen_pull_converter.get_static_parking_sites()
+
+            assert validate_features.call_count == 2
+            assert [item.name for item in third_inputs] == ['Parkhaus Stadtmitte']
+
+    @staticmethod
+    def test_get_static_parking_sites_template_cache_etag(
+        mocked_config_helper: Mock,
+        request_helper: RequestHelper,
+        requests_mock: Mocker,
+    ):
+        config = {'STATIC_GEOJSON_BASE_URL': 'https://static.example.com/sources', 'STATIC_GEOJSON_CACHE_TTL': '0'}
+        mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+        aalen_pull_converter = AalenPullConverter(config_helper=mocked_config_helper, request_helper=request_helper)
+        aalen_pull_converter.static_geojson_template_cache = TemplateCache()
+
+        geojson_data = {
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'properties': {'uid': 'parkhaus', 'name': 'Parkhaus', 'type': 'CAR_PARK', 'capacity': 100},
+                    'geometry': {'type': 'Point', 'coordinates': [10.09, 48.83]},
+                },
+            ],
+        }
+        geojson_mock = requests_mock.get(
+            'https://static.example.com/sources/aalen.geojson',
+            [
+                {'json': geojson_data, 'headers': {'ETag': '"v1"'}},
+                {'status_code': 304, 'headers': {'ETag': '"v1"'}},
+            ],
+        )
+
+        first_inputs, _ = aalen_pull_converter.get_static_parking_sites()
+        second_inputs, _ = aalen_pull_converter.get_static_parking_sites()
+
+        assert [item.name for item in first_inputs] == [item.name for item in second_inputs] == ['Parkhaus']
+        assert geojson_mock.call_count == 2
+        assert 'If-None-Match' not in geojson_mock.request_history[0].headers
+        assert geojson_mock.request_history[1].headers['If-None-Match'] == '"v1"'
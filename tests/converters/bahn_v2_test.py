@@ -47,3 +47,34 @@ class BahnV2PullConverterTest:
         assert len(import_parking_site_exceptions) == 1
 
         validate_static_parking_site_inputs(static_parking_site_inputs)
+
+    @staticmethod
+    def test_get_static_parking_sites_result_cache(
+        mocked_config_helper: Mock,
+        request_helper: RequestHelper,
+        requests_mock: Mocker,
+        tmp_path: Path,
+    ):
+        config = {
+            'PARK_API_BAHN_API_CLIENT_ID': 'de14131a-c542-445a-999b-88393df54903',
+            'PARK_API_BAHN_API_CLIENT_SECRET': '20832cbc-377d-41e4-aee8-7bc1a87dfe90',
+            'STATIC_RESULT_CACHE_DIR': str(tmp_path),
+            'STATIC_RESULT_CACHE_SOURCES': ['bahn_v2'],
+        }
+        mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+        bahn_v2_pull_converter = BahnV2PullConverter(config_helper=mocked_config_helper, request_helper=request_helper)
+
+        json_path = Path(Path(__file__).parent, 'data', 'bahn_v2.json')
+        requests_mock.get(
+            'https://apis.deutschebahn.com/db-api-marketplace/apis/parking-information/db-bahnpark/v2/parking-facilities',
+            content=json_path.read_bytes(),
+        )
+
+        first_inputs, first_exceptions = bahn_v2_pull_converter.get_static_parking_sites()
+        assert bahn_v2_pull_converter.static_data_unchanged is False
+
+        second_inputs, second_exceptions = bahn_v2_pull_converter.get_static_parking_sites()
+        assert bahn_v2_pull_converter.static_data_unchanged is True
+
+        assert second_inputs == first_inputs
+        assert [e.message for e in second_exceptions] == [e.message for e in first_exceptions]
@@ -68,3 +68,20 @@ class FreiburgDisabledSensorsConverterTest:
         assert len(import_parking_spot_exceptions) == 0
 
         validate_realtime_parking_spot_inputs(realtime_parking_spot_inputs)
+
+    @staticmethod
+    def test_get_parking_spots(
+        freiburg_disabled_sensors_pull_converter: FreiburgDisabledSensorsPullConverter,
+        requests_mock_freiburg_disabled_sensors: Mocker,
+    ):
+        static_parking_spot_inputs, realtime_parking_spot_inputs, import_parking_spot_exceptions = (
+            freiburg_disabled_sensors_pull_converter.get_parking_spots()
+        )
+
+        assert len(static_parking_spot_inputs) == 20
+        assert len(realtime_parking_spot_inputs) == 20
+        assert len(import_parking_spot_exceptions) == 0
+        assert requests_mock_freiburg_disabled_sensors.call_count == 1
+
+        validate_static_parking_spot_inputs(static_parking_spot_inputs)
+        validate_realtime_parking_spot_inputs(realtime_parking_spot_inputs)
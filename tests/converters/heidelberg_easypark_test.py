@@ -10,7 +10,7 @@ import pytest
 from requests_mock import Mocker
 
 from parkapi_sources.converters import HeidelbergEasyParkPullConverter
-from parkapi_sources.util import RequestHelper
+from parkapi_sources.util import ConfigHelper, RequestHelper
 from tests.converters.helper import validate_static_parking_site_inputs
 
 
@@ -50,3 +50,22 @@ class HeidelbergEasyparkPullConverterTest:
         assert len(import_parking_site_exceptions) == 0
 
         validate_static_parking_site_inputs(static_parking_site_inputs)
+
+    @staticmethod
+    def test_get_static_parking_sites_validation_processes(
+        request_helper: RequestHelper,
+        requests_mock_heidelberg_easypark: Mocker,
+    ):
+        # Worker processes get the config, so it has to be a real ConfigHelper
+        process_converter = HeidelbergEasyParkPullConverter(
+            config_helper=ConfigHelper({'VALIDATION_PROCESSES': '2'}),
+            request_helper=request_helper,
+        )
+        process_converter.validation_chunk_size = 10
+
+        static_parking_site_inputs, import_parking_site_exceptions = process_converter.get_static_parking_sites()
+
+        assert len(static_parking_site_inputs) == 72
+        assert len(import_parking_site_exceptions) == 0
+        # All chunks share the timestamp of the import run
+        assert len({item.static_data_updated_at for item in static_parking_site_inputs}) == 1
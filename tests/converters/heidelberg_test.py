@@ -69,3 +69,17 @@ class HeidelbergPullConverterTest:
         assert len(import_parking_site_exceptions) == 3
 
         validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
+
+    @staticmethod
+    def test_get_parking_sites(heidelberg_pull_converter: HeidelbergPullConverter, heidelberg_request_mock: Mocker):
+        static_parking_site_inputs, realtime_parking_site_inputs, import_parking_site_exceptions = (
+            heidelberg_pull_converter.get_parking_sites()
+        )
+
+        assert len(static_parking_site_inputs) == 22
+        assert len(realtime_parking_site_inputs) == 20
+        assert len(import_parking_site_exceptions) == 3
+        assert heidelberg_request_mock.call_count == 1
+
+        validate_static_parking_site_inputs(static_parking_site_inputs)
+        validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
@@ -3,6 +3,7 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import json
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -108,3 +109,97 @@ class KarlsruheDisabledConverterTest:
         assert len(import_parking_spot_exceptions) == 8
 
         validate_realtime_parking_spot_inputs(realtime_parking_spot_inputs)
+
+    @staticmethod
+    def test_get_realtime_parking_spots_paginated(
+        karlsruhe_disabled_pull_converter: KarlsruheDisabledPullConverter,
+        requests_mock_karlsruhe_disabled: Mocker,
+    ):
+        realtime_json_path = Path(Path(__file__).parent, 'data', 'karlsruhe_disabled_realtime.json')
+        with realtime_json_path.open() as realtime_json_file:
+            realtime_data = json.load(realtime_json_file)
+
+        # Splits the devices into two full pages, and the last page has no more devices
+        realtime_url = (
+            'https://mobil.trk.de/swkiot/tags/c9ac643f-aedd-4794-83fb-7b7337744480/devices?limit=99&last_readings=1'
+            '&auth=AUTH'
+        )
+        karlsruhe_disabled_pull_converter.realtime_page_size = 31
+        requests_mock_karlsruhe_disabled.get(
+            realtime_url,
+            json={'body': realtime_data['body'][:31], 'retrieve_after_id': realtime_data['body'][30]['id']},
+        )
+        requests_mock_karlsruhe_disabled.get(
+            f'{realtime_url}&retrieve_after={realtime_data["body"][30]["id"]}',
+            json={'body': realtime_data['body'][31:62], 'retrieve_after_id': realtime_data['body'][61]['id']},
+        )
+        requests_mock_karlsruhe_disabled.get(
+            f'{realtime_url}&retrieve_after={realtime_data["body"][61]["id"]}',
+            json={'body': []},
+        )
+
+        realtime_parking_spot_inputs, import_parking_spot_exceptions = (
+            karlsruhe_disabled_pull_converter.get_realtime_parking_spots()
+        )
+
+        assert len(realtime_parking_spot_inputs) == 54
+        assert len(import_parking_spot_exceptions) == 8
+        assert requests_mock_karlsruhe_disabled.call_count == 4
+
+    @staticmethod
+    def test_get_parking_spots(
+        karlsruhe_disabled_pull_converter: KarlsruheDisabledPullConverter,
+        requests_mock_karlsruhe_disabled: Mocker,
+    ):
+        static_parking_spot_inputs, realtime_parking_spot_inputs, import_parking_spot_exceptions = (
+            karlsruhe_disabled_pull_converter.get_parking_spots()
+        )
+
+        assert len(static_parking_spot_inputs) == 1165
+        assert len(realtime_parking_spot_inputs) == 54
+        assert len(import_parking_spot_exceptions) == 12
+        # The features and the devices are fetched just once
+        assert requests_mock_karlsruhe_disabled.call_count == 2
+
+        realtime_enabled_spot = next(iter(item for item in static_parking_spot_inputs if item.uid == '22_1'))
+        assert realtime_enabled_spot.has_realtime_data is True
+
+    @staticmethod
+    def test_get_parking_spots_realtime_failure(
+        karlsruhe_disabled_pull_converter: KarlsruheDisabledPullConverter,
+        requests_mock_karlsruhe_disabled: Mocker,
+    ):
+        requests_mock_karlsruhe_disabled.get(
+            'https://mobil.trk.de/swkiot/tags/c9ac643f-aedd-4794-83fb-7b7337744480/devices?limit=99&last_readings=1'
+            '&auth=AUTH',
+            json={'body': []},
+        )
+
+        static_parking_spot_inputs, realtime_parking_spot_inputs, import_parking_spot_exceptions = (
+            karlsruhe_disabled_pull_converter.get_parking_spots()
+        )
+
+        assert len(static_parking_spot_inputs) == 1165
+        assert len(realtime_parking_spot_inputs) == 0
+        assert len(import_parking_spot_exceptions) == 5
+        assert import_parking_spot_exceptions[-1].parking_spot_uid is None
+        assert 'no devices in realtime data' in import_parking_spot_exceptions[-1].message
+
+        validate_static_parking_spot_inputs(static_parking_spot_inputs)
+
+        realtime_enabled_spot = next(iter(item for item in static_parking_spot_inputs if item.uid == '22_1'))
+        assert realtime_enabled_spot.has_realtime_data is False
+
+    @staticmethod
+    def test_get_realtime_parking_spot_records(
+        karlsruhe_disabled_pull_converter: KarlsruheDisabledPullConverter,
+        requests_mock_karlsruhe_disabled: Mocker,
+    ):
+        realtime_parking_spot_records, import_parking_spot_exceptions = (
+            karlsruhe_disabled_pull_converter.get_realtime_parking_spot_records()
+        )
+        realtime_parking_spot_inputs, _ = karlsruhe_disabled_pull_converter.get_realtime_parking_spots()
+
+        assert len(realtime_parking_spot_records) == 54
+        assert len(import_parking_spot_exceptions) == 8
+        assert [item.to_input() for item in realtime_parking_spot_records] == realtime_parking_spot_inputs
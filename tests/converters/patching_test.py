@@ -3,12 +3,13 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import json
 from pathlib import Path
 from unittest.mock import Mock
 
 from requests_mock import Mocker
 
-from parkapi_sources.converters import FreiburgDisabledSensorsPullConverter, FreiburgPullConverter
+from parkapi_sources.converters import BahnV2PullConverter, FreiburgDisabledSensorsPullConverter, FreiburgPullConverter
 from parkapi_sources.models import ExternalIdentifierInput
 from parkapi_sources.util import RequestHelper
 from tests.converters.helper import validate_static_parking_site_inputs, validate_static_parking_spot_inputs
@@ -83,3 +84,73 @@ def test_get_static_parking_spots(
     assert isinstance(static_parking_spot_inputs[0].external_identifiers[0], ExternalIdentifierInput)
 
     validate_static_parking_spot_inputs(static_parking_spot_inputs)
+
+
+def test_iter_static_parking_sites_patched(
+    mocked_config_helper: Mock,
+    request_helper: RequestHelper,
+    requests_mock: Mocker,
+    tmp_path: Path,
+):
+    config = {
+        'PARK_API_BAHN_API_CLIENT_ID': 'de14131a-c542-445a-999b-88393df54903',
+        'PARK_API_BAHN_API_CLIENT_SECRET': '20832cbc-377d-41e4-aee8-7bc1a87dfe90',
+        'PARK_API_PARKING_SITE_PATCH_DIR': tmp_path,
+    }
+    mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+    bahn_v2_pull_converter = BahnV2PullConverter(config_helper=mocked_config_helper, request_helper=request_helper)
+
+    Path(tmp_path, 'bahn_v2.json').write_text(json.dumps({'items': [{'uid': '100001-parking', 'name': 'New name'}]}))
+    requests_mock.get(
+        'https://apis.deutschebahn.com/db-api-marketplace/apis/parking-information/db-bahnpark/v2/parking-facilities',
+        content=Path(Path(__file__).parent, 'data', 'bahn_v2.json').read_bytes(),
+    )
+
+    static_parking_site_inputs, import_parking_site_exceptions = bahn_v2_pull_converter.split_inputs_and_exceptions(
+        bahn_v2_pull_converter.iter_static_parking_sites(),
+    )
+
+    assert len(static_parking_site_inputs) == 342
+    assert len(import_parking_site_exceptions) == 1
+    assert [item.name for item in static_parking_site_inputs if item.uid == '100001-parking'] == ['New name']
+
+    validate_static_parking_site_inputs(static_parking_site_inputs)
+
+
+def test_static_patch_exceptions_not_in_results(
+    mocked_config_helper: Mock,
+    request_helper: RequestHelper,
+    requests_mock: Mocker,
+    tmp_path: Path,
+):
+    config = {
+        'PARK_API_BAHN_API_CLIENT_ID': 'de14131a-c542-445a-999b-88393df54903',
+        'PARK_API_BAHN_API_CLIENT_SECRET': '20832cbc-377d-41e4-aee8-7bc1a87dfe90',
+        'PARK_API_PARKING_SITE_PATCH_DIR': tmp_path,
+    }
+    mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+    bahn_v2_pull_converter = BahnV2PullConverter(config_helper=mocked_config_helper, request_helper=request_helper)
+
+    Path(tmp_path, 'bahn_v2.json').write_text(json.dumps({'items': [{'name': 'Missing uid'}]}))
+    requests_mock.get(
+        'https://apis.deutschebahn.com/db-api-marketplace/apis/parking-information/db-bahnpark/v2/parking-facilities',
+        content=Path(Path(__file__).parent, 'data', 'bahn_v2.json').read_bytes(),
+    )
+
+    _, import_parking_site_exceptions = bahn_v2_pull_converter.split_inputs_and_exceptions(
+        bahn_v2_pull_converter.iter_static_parking_sites(),
+    )
+    static_patch_exceptions = bahn_v2_pull_converter.pop_static_patch_exceptions()
+
+    # The data itself has one invalid parking site, the patch file error is just returned separately
+    assert len(import_parking_site_exceptions) == 1
+    assert len(static_patch_exceptions) == 1
+    assert bahn_v2_pull_converter.pop_static_patch_exceptions() == []
+
+    # Other converter instances have their own patch store and report the error themselves
+    other_bahn_v2_pull_converter = BahnV2PullConverter(
+        config_helper=mocked_config_helper,
+        request_helper=request_helper,
+    )
+    other_bahn_v2_pull_converter.get_static_parking_sites()
+    assert len(other_bahn_v2_pull_converter.pop_static_patch_exceptions()) == 1
@@ -10,7 +10,7 @@ import pytest
 from requests_mock import Mocker
 
 from parkapi_sources.converters import RadvisBwPullConverter
-from parkapi_sources.util import RequestHelper
+from parkapi_sources.util import ConfigHelper, RequestHelper
 from tests.converters.helper import validate_static_parking_site_inputs
 
 
@@ -48,3 +48,64 @@ class RadvisBwConverterTest:
         assert len(import_parking_site_exceptions) == 0
 
         validate_static_parking_site_inputs(static_parking_site_inputs)
+
+    @staticmethod
+    def test_iter_static_parking_sites(radvis_bw_pull_converter: RadvisBwPullConverter, requests_mock: Mocker):
+        json_path = Path(Path(__file__).parent, 'data', 'radvis_bw.json')
+        with json_path.open() as json_file:
+            json_data = json_file.read()
+
+        requests_mock.get(
+            'https://radvis.landbw.de/api/geoserver/basicauth/radvis/wfs?service=WFS&version=2.0.0&request=GetFeature'
+            '&typeNames=radvis%3Aabstellanlage&outputFormat=application/json',
+            text=json_data,
+        )
+        # Small chunks, so records are validated and reprojected in several chunks
+        radvis_bw_pull_converter.validation_chunk_size = 100
+
+        static_parking_site_inputs, import_parking_site_exceptions = (
+            radvis_bw_pull_converter.split_inputs_and_exceptions(
+                radvis_bw_pull_converter.iter_static_parking_sites(),
+            )
+        )
+
+        assert [(item.uid, item.lat, item.lon) for item in static_parking_site_inputs] == [
+            (item.uid, item.lat, item.lon) for item in radvis_bw_pull_converter.get_static_parking_sites()[0]
+        ]
+        assert len(static_parking_site_inputs) == 692
+        assert len(import_parking_site_exceptions) == 0
+
+    @staticmethod
+    def test_get_static_parking_sites_validation_processes(
+        radvis_bw_pull_converter: RadvisBwPullConverter,
+        request_helper: RequestHelper,
+        requests_mock: Mocker,
+    ):
+        json_path = Path(Path(__file__).parent, 'data', 'radvis_bw.json')
+        with json_path.open() as json_file:
+            json_data = json_file.read()
+
+        requests_mock.get(
+            'https://radvis.landbw.de/api/geoserver/basicauth/radvis/wfs?service=WFS&version=2.0.0&request=GetFeature'
+            '&typeNames=radvis%3Aabstellanlage&outputFormat=application/json',
+            text=json_data,
+        )
+        # Worker processes get the config, so it has to be a real ConfigHelper
+        process_converter = RadvisBwPullConverter(
+            config_helper=ConfigHelper({
+                'PARK_API_RADVIS_USER': 'de14131a-c542-445a-999b-88393df54903',
+                'PARK_API_RADVIS_PASSWORD': '20832cbc-377d-41e4-aee8-7bc1a87dfe90',
+                'PARK_API_RADVIS_IGNORE_SOURCES': 'MOBIDATABW',
+                'VALIDATION_PROCESSES': '2',
+            }),
+            request_helper=request_helper,
+        )
+        process_converter.validation_chunk_size = 100
+
+        static_parking_site_inputs, import_parking_site_exceptions = process_converter.get_static_parking_sites()
+
+        # Results keep the order of the records, no matter which worker validated them
+        assert [(item.uid, item.lat, item.lon) for item in static_parking_site_inputs] == [
+            (item.uid, item.lat, item.lon) for item in radvis_bw_pull_converter.get_static_parking_sites()[0]
+        ]
+        assert len(import_parking_site_exceptions) == 0
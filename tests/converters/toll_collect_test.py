@@ -3,8 +3,9 @@ Copyright 2025 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import gzip
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from requests_mock import Mocker
@@ -98,3 +99,140 @@ class TollCollectConverterTest:
         assert any(item.realtime_free_capacity is not None for item in realtime_parking_site_inputs)
 
         validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
+
+    @staticmethod
+    def test_get_realtime_parking_sites_caches_capacities(
+        toll_collect_pull_converter: TollCollectPullConverter,
+        requests_mock: Mocker,
+    ):
+        realtime_xml_path = Path(Path(__file__).parent, 'data', 'toll-collect-realtime.xml')
+        with realtime_xml_path.open() as xml_file:
+            realtime_xml_data = xml_file.read()
+
+        requests_mock.get(
+            'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/2222222222/clientPullService?subscriptionID=2222222222',
+            text=realtime_xml_data,
+        )
+
+        # The static publication is large, so it's replaced by a stub which just sets the capacities
+        def get_static_parking_sites(converter: TollCollectPullConverter):
+            converter._set_cached_capacity_by_uid({})
+            return [], []
+
+        with patch.object(
+            TollCollectPullConverter,
+            'get_static_parking_sites',
+            autospec=True,
+            side_effect=get_static_parking_sites,
+        ) as get_static_parking_sites_mock:
+            toll_collect_pull_converter.get_realtime_parking_sites()
+            toll_collect_pull_converter.get_realtime_parking_sites()
+
+            assert get_static_parking_sites_mock.call_count == 1
+
+            # Outdated capacities are fetched again
+            toll_collect_pull_converter._capacity_by_uid_updated_at -= toll_collect_pull_converter.default_capacity_ttl
+            toll_collect_pull_converter.get_realtime_parking_sites()
+
+            assert get_static_parking_sites_mock.call_count == 2
+
+        assert requests_mock.call_count == 3
+
+    @staticmethod
+    def test_get_realtime_parking_sites_zero_capacity(
+        toll_collect_pull_converter: TollCollectPullConverter,
+        requests_mock: Mocker,
+    ):
+        realtime_xml_path = Path(Path(__file__).parent, 'data', 'toll-collect-realtime.xml')
+        with realtime_xml_path.open() as xml_file:
+            realtime_xml_data = xml_file.read()
+
+        requests_mock.get(
+            'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/1111111111/clientPullService?subscriptionID=1111111111',
+            text='',
+        )
+        requests_mock.get(
+            'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/2222222222/clientPullService?subscriptionID=2222222222',
+            text=realtime_xml_data,
+        )
+
+        def get_static_input_dict(uid: str, capacity: str) -> dict:
+            return {
+                'id': uid,
+                'parkingLocation': {
+                    'pointByCoordinates': {'pointCoordinates': {'latitude': '53.1', 'longitude': '12.1'}}
+                },
+                'parkingName': [{'_text': 'Rastplatz', 'lang': 'de'}],
+                'parkingNumberOfSpaces': capacity,
+                'parkingRecordVersionTime': '2026-06-11T05:00:00Z',
+            }
+
+        # The static publication is large, so it's replaced by two records, one of them without any spaces
+        with patch.object(
+            TollCollectPullConverter,
+            '_iter_static_xml_stream_input_dicts',
+            return_value=iter([
+                get_static_input_dict('DE-MV-001344', '0'),
+                get_static_input_dict('DE-MV-240001', '10'),
+            ]),
+        ):
+            # Static patches change static parking sites, but not the capacities of the upstream data
+            with patch.object(
+                toll_collect_pull_converter,
+                'apply_static_patches',
+                side_effect=lambda inputs: [setattr(item, 'capacity', 99) or item for item in inputs],
+            ):
+                static_parking_site_inputs, _ = toll_collect_pull_converter.get_static_parking_sites()
+            realtime_parking_site_inputs, _ = toll_collect_pull_converter.get_realtime_parking_sites()
+
+        # Parking sites without spaces are no static parking sites, but their realtime capacity is still known
+        assert [item.uid for item in static_parking_site_inputs] == ['DE-MV-240001']
+        realtime_parking_site_input_by_uid = {item.uid: item for item in realtime_parking_site_inputs}
+        assert realtime_parking_site_input_by_uid['DE-MV-001344'].realtime_capacity == 0
+        assert realtime_parking_site_input_by_uid['DE-MV-001344'].realtime_free_capacity == 0
+        assert realtime_parking_site_input_by_uid['DE-MV-240001'].realtime_capacity == 10
+
+    @staticmethod
+    def test_get_realtime_parking_sites_compressed_stream(
+        toll_collect_pull_converter: TollCollectPullConverter,
+        requests_mock: Mocker,
+    ):
+        realtime_xml_path = Path(Path(__file__).parent, 'data', 'toll-collect-realtime.xml')
+
+        # The body is parsed from the connection, so it has to be decompressed while streaming
+        requests_mock.get(
+            'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/2222222222/clientPullService?subscriptionID=2222222222',
+            content=gzip.compress(realtime_xml_path.read_bytes()),
+            headers={'Content-Encoding': 'gzip'},
+        )
+        toll_collect_pull_converter._set_cached_capacity_by_uid({})
+
+        realtime_parking_site_inputs, import_parking_site_exceptions = (
+            toll_collect_pull_converter.get_realtime_parking_sites()
+        )
+
+        assert len(realtime_parking_site_inputs) == 1820
+        assert len(import_parking_site_exceptions) == 0
+
+    @staticmethod
+    def test_get_realtime_parking_site_records(
+        toll_collect_pull_converter: TollCollectPullConverter,
+        requests_mock: Mocker,
+    ):
+        realtime_xml_path = Path(Path(__file__).parent, 'data', 'toll-collect-realtime.xml')
+        requests_mock.get(
+            'https://mobilithek.info:8443/mobilithek/api/v1.0/subscription/2222222222/clientPullService?subscriptionID=2222222222',
+            content=realtime_xml_path.read_bytes(),
+        )
+        toll_collect_pull_converter._set_cached_capacity_by_uid({})
+
+        realtime_parking_site_records, import_parking_site_exceptions = (
+            toll_collect_pull_converter.get_realtime_parking_site_records()
+        )
+        realtime_parking_site_inputs, _ = toll_collect_pull_converter.get_realtime_parking_sites()
+
+        assert len(realtime_parking_site_records) == 1820
+        assert len(import_parking_site_exceptions) == 0
+        assert [item.to_input().to_dict() for item in realtime_parking_site_records] == [
+            item.to_dict() for item in realtime_parking_site_inputs
+        ]
@@ -119,3 +119,28 @@ class UlmSensorsPullConverterTest:
         assert len(import_parking_spot_exceptions) == 0
 
         validate_realtime_parking_spot_inputs(realtime_parking_spot_inputs)
+
+    @staticmethod
+    def test_get_realtime_parking_spots_requests_one_token(
+        ulm_sensors_pull_converter: UlmSensorsPullConverter,
+        requests_mock: Mocker,
+    ):
+        token_mock = requests_mock.post(
+            'https://citysens-iot.swu.de/auth/realms/ocon/protocol/openid-connect/token',
+            json={'access_token': 'token', 'expires_in': 300},
+        )
+        requests_mock.get(
+            'https://citysens-iot.swu.de/consumer-api/v1/collections/sensors/id1/data?count=1',
+            [{'status_code': 401, 'json': {}}, {'json': []}],
+        )
+        for sensor_id in ['id2', 'id3', 'id4', 'id5']:
+            requests_mock.get(
+                f'https://citysens-iot.swu.de/consumer-api/v1/collections/sensors/{sensor_id}/data?count=1',
+                json=[],
+            )
+
+        ulm_sensors_pull_converter.get_realtime_parking_spots()
+        ulm_sensors_pull_converter.get_realtime_parking_spots()
+
+        # One initial token and one refreshed token after the HTTP 401
+        assert token_mock.call_count == 2
@@ -0,0 +1,78 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import pickle  # noqa: S403
+from datetime import datetime, timezone
+
+import pytest
+from isodate import Duration
+
+from parkapi_sources.models import (
+    OpeningStatus,
+    ParkingAudience,
+    ParkingSiteRestrictionInput,
+    ParkingSpotStatus,
+    RealtimeParkingSiteInput,
+    RealtimeParkingSiteRecord,
+    RealtimeParkingSpotInput,
+    RealtimeParkingSpotRecord,
+)
+
+
+class RealtimeRecordsTest:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'realtime_parking_site_input',
+        [
+            RealtimeParkingSiteInput(
+                uid='site-1',
+                realtime_data_updated_at=datetime(2026, 1, 1, 12, tzinfo=timezone.utc),
+            ),
+            RealtimeParkingSiteInput(
+                uid='site-2',
+                realtime_data_updated_at=datetime(2026, 1, 1, 12, tzinfo=timezone.utc),
+                realtime_opening_status=OpeningStatus.OPEN,
+                realtime_capacity=100,
+                realtime_free_capacity=42,
+                restrictions=[
+                    ParkingSiteRestrictionInput(
+                        type=ParkingAudience.DISABLED,
+                        realtime_capacity=4,
+                        max_stay=Duration(hours=2),
+                    ),
+                ],
+            ),
+            RealtimeParkingSiteInput(
+                uid='site-3',
+                realtime_data_updated_at=datetime(2026, 1, 1, 12, tzinfo=timezone.utc),
+                restrictions=None,
+            ),
+        ],
+    )
+    def test_realtime_parking_site_record(realtime_parking_site_input: RealtimeParkingSiteInput):
+        record = RealtimeParkingSiteRecord.from_input(realtime_parking_site_input)
+
+        assert not hasattr(record, '__dict__')
+        assert record.to_input() == realtime_parking_site_input
+        assert record.to_dict() == realtime_parking_site_input.to_dict()
+        assert pickle.loads(pickle.dumps(record)) == record  # noqa: S301
+
+    @staticmethod
+    def test_realtime_parking_spot_record():
+        realtime_parking_spot_input = RealtimeParkingSpotInput(
+            uid='spot-1',
+            realtime_data_updated_at=datetime(2026, 1, 1, 12, tzinfo=timezone.utc),
+            realtime_status=ParkingSpotStatus.TAKEN,
+        )
+
+        record = RealtimeParkingSpotRecord.from_input(realtime_parking_spot_input)
+
+        assert not hasattr(record, '__dict__')
+        assert record.to_input() == realtime_parking_spot_input
+        assert record.to_dict() == realtime_parking_spot_input.to_dict()
+        assert pickle.loads(pickle.dumps(record)) == record  # noqa: S301
+        assert record != RealtimeParkingSpotRecord(
+            uid='spot-1', realtime_data_updated_at=record.realtime_data_updated_at
+        )
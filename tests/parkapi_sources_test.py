@@ -3,13 +3,21 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import gc
 import importlib
+import os
 import pkgutil
+import subprocess  # noqa: S404
+import sys
 from typing import Type
 
+import pytest
+
 import parkapi_sources.converters
 from parkapi_sources import ParkAPISources
 from parkapi_sources.converters import BaseConverter
+from parkapi_sources.converters.converter_registry import ConverterRegistry
+from parkapi_sources.exceptions import MissingConverterException
 from parkapi_sources.models import SourceInfo
 
 
@@ -78,3 +86,80 @@ class ParkAPISourcesRegistrationTest:
         for uid, converter in park_api_sources.converter_by_uid.items():
             assert isinstance(converter, BaseConverter)
             assert converter.source_info.uid == uid
+
+
+class ConverterRegistryTest:
+    @staticmethod
+    def test_converter_paths_match_source_uids():
+        converter_registry = ConverterRegistry()
+
+        for uid in converter_registry.uids:
+            assert converter_registry.get_converter_class(uid).source_info.uid == uid
+
+    @staticmethod
+    def test_missing_converter():
+        with pytest.raises(MissingConverterException):
+            ParkAPISources(converter_uids=['not-existing'])
+
+    @staticmethod
+    def test_just_requested_converters_are_imported():
+        # Runs in a new interpreter, as this test process already imported all converters
+        code = (
+            'import sys\n'
+            'from parkapi_sources import ParkAPISources\n'
+            "ParkAPISources(converter_uids=['aachen'])\n"
+            "print(','.join(sorted(module for module in sys.modules if module.startswith('parkapi_sources.converters.'))))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, '-c', code],
+            env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported_modules = set(result.stdout.strip().split(','))
+
+        assert 'parkapi_sources.converters.aachen' in imported_modules
+        assert 'parkapi_sources.converters.bahn_v2' not in imported_modules
+        assert 'parkapi_sources.converters.radvis_bw' not in imported_modules
+
+    @staticmethod
+    def test_overridden_converter_classes():
+        converter_classes = ParkAPISources.converter_classes
+
+        class CustomParkAPISources(ParkAPISources):
+            converter_classes = [
+                ParkAPISources.converter_registry.get_converter_class('aachen'),
+                ParkAPISources.converter_registry.get_converter_class('bahn_v2'),
+            ]
+
+        custom_park_api_sources = CustomParkAPISources()
+
+        assert set(custom_park_api_sources.converter_by_uid.keys()) == {'aachen', 'bahn_v2'}
+        with pytest.raises(MissingConverterException):
+            CustomParkAPISources(converter_uids=['karlsruhe'])
+
+        # Overriding converter_classes in a subclass does not change ParkAPISources itself
+        assert ParkAPISources.converter_classes == converter_classes
+
+    @staticmethod
+    def test_extended_converter_classes():
+        aachen_converter_class = ParkAPISources.converter_registry.get_converter_class('aachen')
+
+        class CustomConverter(aachen_converter_class):
+            source_info = SourceInfo(uid='custom', name='Custom', has_realtime_data=False)
+
+        class CustomParkAPISources(ParkAPISources):
+            converter_classes = [*ParkAPISources.converter_classes, CustomConverter]
+
+        custom_park_api_sources = CustomParkAPISources(config={'STATIC_GEOJSON_BASE_URL': 'https://example.com'})
+
+        assert set(custom_park_api_sources.converter_by_uid.keys()) == {
+            *ParkAPISources.converter_registry.uids,
+            'custom',
+        }
+        assert isinstance(custom_park_api_sources.converter_by_uid['custom'], CustomConverter)
+
+        # Removes the custom converter from BaseConverter subclasses again, so converter discovery doesn't find it
+        del custom_park_api_sources, CustomParkAPISources, CustomConverter
+        gc.collect()
@@ -0,0 +1,112 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from parkapi_sources import RealtimeChangeType, RealtimeDeltaTracker
+from parkapi_sources.models import RealtimeParkingSiteInput
+from parkapi_sources.models.enums import OpeningStatus
+
+
+def get_realtime_parking_site_input(uid: str, realtime_free_capacity: int, minute: int = 0) -> RealtimeParkingSiteInput:
+    return RealtimeParkingSiteInput(
+        uid=uid,
+        realtime_data_updated_at=datetime(2026, 1, 1, 12, minute, tzinfo=timezone.utc),
+        realtime_opening_status=OpeningStatus.OPEN,
+        realtime_free_capacity=realtime_free_capacity,
+    )
+
+
+class RealtimeDeltaTrackerTest:
+    @staticmethod
+    def test_get_parking_site_changes():
+        tracker = RealtimeDeltaTracker()
+
+        changes = tracker.get_parking_site_changes(
+            'source',
+            [get_realtime_parking_site_input('1', 10), get_realtime_parking_site_input('2', 20)],
+        )
+
+        assert [(change.change_type, change.uid) for change in changes] == [
+            (RealtimeChangeType.INSERT, '1'),
+            (RealtimeChangeType.INSERT, '2'),
+        ]
+        assert changes[0].previous_values is None
+
+        # Changed timestamps alone are no changes
+        changes = tracker.get_parking_site_changes(
+            'source',
+            [get_realtime_parking_site_input('1', 10, minute=5), get_realtime_parking_site_input('3', 30)],
+        )
+
+        assert [(change.change_type, change.uid) for change in changes] == [
+            (RealtimeChangeType.INSERT, '3'),
+            (RealtimeChangeType.DELETE, '2'),
+        ]
+        assert changes[1].realtime_input is None
+        assert changes[1].previous_values['realtime_free_capacity'] == 20
+
+        changes = tracker.get_parking_site_changes('source', [get_realtime_parking_site_input('1', 9)])
+
+        assert [(change.change_type, change.uid) for change in changes] == [
+            (RealtimeChangeType.UPDATE, '1'),
+            (RealtimeChangeType.DELETE, '3'),
+        ]
+        assert changes[0].realtime_input.realtime_free_capacity == 9
+        assert changes[0].previous_values == {
+            'realtime_capacity': None,
+            'realtime_free_capacity': 10,
+            'realtime_opening_status': 'OPEN',
+            'restrictions': [],
+        }
+
+    @staticmethod
+    def test_get_parking_site_changes_failed_uids():
+        tracker = RealtimeDeltaTracker()
+        tracker.get_parking_site_changes(
+            'source',
+            [get_realtime_parking_site_input('1', 10), get_realtime_parking_site_input('2', 20)],
+        )
+
+        changes = tracker.get_parking_site_changes(
+            'source', [get_realtime_parking_site_input('1', 9)], failed_uids={'2'}
+        )
+
+        assert [(change.change_type, change.uid) for change in changes] == [(RealtimeChangeType.UPDATE, '1')]
+
+        changes = tracker.get_parking_site_changes('source', [], keep_missing=True)
+
+        assert changes == []
+
+        changes = tracker.get_parking_site_changes('source', [get_realtime_parking_site_input('2', 20)])
+
+        assert [(change.change_type, change.uid) for change in changes] == [(RealtimeChangeType.DELETE, '1')]
+
+    @staticmethod
+    def test_get_parking_site_changes_separates_sources_and_data_types():
+        tracker = RealtimeDeltaTracker()
+
+        tracker.get_parking_site_changes('source-a', [get_realtime_parking_site_input('1', 10)])
+
+        assert len(tracker.get_parking_site_changes('source-b', [get_realtime_parking_site_input('1', 10)])) == 1
+        assert tracker.get_parking_spot_changes('source-a', []) == []
+
+    @staticmethod
+    def test_state_dir(tmp_path: Path):
+        RealtimeDeltaTracker(state_dir=tmp_path).get_parking_site_changes(
+            'source',
+            [get_realtime_parking_site_input('1', 10)],
+        )
+
+        assert Path(tmp_path, 'source-parking_sites.json').exists()
+
+        changes = RealtimeDeltaTracker(state_dir=tmp_path).get_parking_site_changes(
+            'source',
+            [get_realtime_parking_site_input('1', 11)],
+        )
+
+        assert [(change.change_type, change.uid) for change in changes] == [(RealtimeChangeType.UPDATE, '1')]
+        assert changes[0].previous_values['realtime_free_capacity'] == 10
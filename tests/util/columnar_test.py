@@ -0,0 +1,160 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from parkapi_sources.models import (
+    OpeningStatus,
+    ParkAndRideType,
+    ParkingAudience,
+    ParkingSiteRestrictionInput,
+    ParkingSiteType,
+    ParkingSpotStatus,
+    PurposeType,
+    RealtimeParkingSiteInput,
+    RealtimeParkingSpotInput,
+    RealtimeParkingSpotRecord,
+    StaticParkingSiteInput,
+)
+from parkapi_sources.util import ColumnarReader, ColumnarWriter
+
+
+def get_static_parking_site_input(uid: str, **kwargs) -> StaticParkingSiteInput:
+    return StaticParkingSiteInput(
+        uid=uid,
+        name=f'Parking site {uid}',
+        purpose=PurposeType.CAR,
+        type=ParkingSiteType.CAR_PARK,
+        has_realtime_data=True,
+        static_data_updated_at=datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+        lat=Decimal('48.7758459'),
+        lon=Decimal('9.1829321'),
+        capacity=100,
+        **kwargs,
+    )
+
+
+class ColumnarTest:
+    @staticmethod
+    def test_write_and_read_static_parking_sites(tmp_path: Path):
+        path = Path(tmp_path, 'result.pkcol')
+        static_parking_site_inputs = [
+            get_static_parking_site_input(
+                'site-1',
+                max_height=210,
+                has_fee=False,
+                park_and_ride_type=[ParkAndRideType.YES],
+                restrictions=[ParkingSiteRestrictionInput(type=ParkingAudience.DISABLED, capacity=4)],
+            ),
+            get_static_parking_site_input('site-2', description='Überdacht'),
+        ]
+
+        with ColumnarWriter(path) as columnar_writer:
+            columnar_writer.write_table(
+                'static_parking_sites',
+                StaticParkingSiteInput,
+                static_parking_site_inputs[:1],
+                constant_columns={'source_uid': 'source-1'},
+            )
+            columnar_writer.write_table(
+                'static_parking_sites',
+                StaticParkingSiteInput,
+                static_parking_site_inputs[1:],
+                constant_columns={'source_uid': 'source-2'},
+            )
+
+        with ColumnarReader(path) as columnar_reader:
+            column_types = columnar_reader.get_column_types('static_parking_sites')
+            assert column_types['source_uid'] == 'dictionary'
+            assert column_types['type'] == 'dictionary'
+            assert column_types['lat'] == 'float64'
+            assert column_types['static_data_updated_at'] == 'timestamp'
+            assert column_types['restrictions'] == 'json'
+
+            assert columnar_reader.get_row_count('static_parking_sites') == 2
+            assert columnar_reader.read_column('static_parking_sites', 'source_uid') == ['source-1', 'source-2']
+            assert columnar_reader.read_column('static_parking_sites', 'lat') == [48.7758459, 48.7758459]
+            assert columnar_reader.read_column('static_parking_sites', 'max_height') == [210, None]
+            assert columnar_reader.read_column('static_parking_sites', 'has_fee') == [False, None]
+            assert columnar_reader.read_column('static_parking_sites', 'description') == [None, 'Überdacht']
+
+            rows = columnar_reader.read_table('static_parking_sites')
+            assert rows[0]['uid'] == 'site-1'
+            assert rows[0]['type'] == 'CAR_PARK'
+            assert rows[0]['static_data_updated_at'] == datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+            assert rows[0]['park_and_ride_type'] == ['YES']
+            assert rows[0]['restrictions'][0]['type'] == 'DISABLED'
+            assert rows[0]['restrictions'][0]['capacity'] == 4
+            assert rows[1]['restrictions'] == []
+
+            # Buffers are aligned, so they can be used without copying them
+            lon_buffer = columnar_reader.get_buffer('static_parking_sites', 0, 'lon', 'data')
+            assert lon_buffer.cast('d').tolist() == [9.1829321]
+            lon_buffer.release()
+
+    @staticmethod
+    def test_write_and_read_realtime_data(tmp_path: Path):
+        path = Path(tmp_path, 'result.pkcol')
+        realtime_data_updated_at = datetime(2026, 1, 1, 12, 30, 15, tzinfo=timezone.utc)
+
+        with ColumnarWriter(path) as columnar_writer:
+            columnar_writer.write_table(
+                'realtime_parking_sites',
+                RealtimeParkingSiteInput,
+                [
+                    RealtimeParkingSiteInput(
+                        uid='site-1',
+                        realtime_data_updated_at=realtime_data_updated_at,
+                        realtime_opening_status=OpeningStatus.OPEN,
+                        realtime_free_capacity=12,
+                    ),
+                ],
+            )
+            # Realtime records have the same attributes, so they can be written without converting them
+            columnar_writer.write_table(
+                'realtime_parking_spots',
+                RealtimeParkingSpotInput,
+                [
+                    RealtimeParkingSpotRecord(uid='spot-1', realtime_data_updated_at=realtime_data_updated_at),
+                    RealtimeParkingSpotRecord(
+                        uid='spot-2',
+                        realtime_data_updated_at=realtime_data_updated_at,
+                        realtime_status=ParkingSpotStatus.TAKEN,
+                    ),
+                ],
+            )
+
+        with ColumnarReader(path) as columnar_reader:
+            assert columnar_reader.read_table('realtime_parking_sites') == [
+                {
+                    'uid': 'site-1',
+                    'realtime_data_updated_at': realtime_data_updated_at,
+                    'realtime_opening_status': 'OPEN',
+                    'realtime_capacity': None,
+                    'realtime_free_capacity': 12,
+                    'restrictions': [],
+                },
+            ]
+            assert columnar_reader.read_column('realtime_parking_spots', 'realtime_status') == [None, 'TAKEN']
+
+    @staticmethod
+    def test_write_table_with_other_columns(tmp_path: Path):
+        with ColumnarWriter(Path(tmp_path, 'result.pkcol')) as columnar_writer:
+            columnar_writer.write_table('parking_sites', StaticParkingSiteInput, [])
+
+            with pytest.raises(ValueError):
+                columnar_writer.write_table('parking_sites', RealtimeParkingSiteInput, [])
+
+    @staticmethod
+    def test_read_invalid_file(tmp_path: Path):
+        path = Path(tmp_path, 'result.json')
+        path.write_text('{"parking_sites": []}')
+
+        with pytest.raises(ValueError):
+            ColumnarReader(path)
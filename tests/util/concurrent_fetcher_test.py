@@ -0,0 +1,56 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import Lock
+from time import monotonic, sleep
+
+import pytest
+
+from parkapi_sources.util import ConcurrentFetcher, HostRateLimiter
+
+
+class ConcurrentFetcherTest:
+    @staticmethod
+    def test_fetch_all_keeps_order_and_limits_in_flight():
+        lock = Lock()
+        in_flight: list[int] = [0, 0]
+
+        def fetch(url: str, delay: float) -> str:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            sleep(delay)
+            with lock:
+                in_flight[0] -= 1
+            return url
+
+        request_kwargs_list = [{'url': f'https://example.com/{i}', 'delay': 0.05 - i * 0.005} for i in range(8)]
+
+        results = ConcurrentFetcher(max_in_flight=3).fetch_all(fetch, request_kwargs_list)
+
+        assert results == [f'https://example.com/{i}' for i in range(8)]
+        assert in_flight[1] == 3
+
+    @staticmethod
+    def test_fetch_all_raises_first_exception():
+        def fetch(url: str) -> str:
+            if url.endswith('fail'):
+                raise ValueError(url)
+            return url
+
+        with pytest.raises(ValueError):
+            ConcurrentFetcher(max_in_flight=2).fetch_all(fetch, [{'url': 'https://example.com/fail'}, {'url': 'a'}])
+
+    @staticmethod
+    def test_host_rate_limiter():
+        rate_limiter = HostRateLimiter(requests_per_second=20)
+
+        start = monotonic()
+        for _ in range(3):
+            rate_limiter.wait('example.com')
+        rate_limiter.wait('example.org')
+
+        # Three requests to the same host need two intervals, other hosts are not delayed
+        assert 0.09 <= monotonic() - start < 0.5
@@ -6,14 +6,16 @@ All rights reserved.
 
 import json
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
 import pytest
+from isodate import Duration
 
-from parkapi_sources.util.encoding import DefaultJSONEncoder, convert_to_serializable_value
+from parkapi_sources.models import ParkingAudience, ParkingSiteRestrictionInput, StaticParkingSitePatchInput
+from parkapi_sources.util.encoding import DefaultJSONEncoder, convert_to_serializable_value, to_serializable_dict
 
 
 class TestEnum(Enum):
@@ -69,3 +71,27 @@ def test_convert_to_serializable_value(input_data: Any, output_data: str):
 )
 def test_json_encoder(input_data: Any, output_data: str):
     assert json.dumps(input_data, cls=DefaultJSONEncoder) == output_data
+
+
+def test_to_serializable_dict():
+    static_parking_site_input = StaticParkingSitePatchInput(
+        uid='site-1',
+        lat=Decimal('48.7758459'),
+        static_data_updated_at=datetime(2024, 6, 1, 12, tzinfo=timezone.utc),
+        restrictions=[ParkingSiteRestrictionInput(type=ParkingAudience.DISABLED, max_stay=Duration(hours=2))],
+    )
+
+    serializable_dict = to_serializable_dict(static_parking_site_input)
+
+    # Unset values are filtered like at to_dict(), and the JSON output is the same
+    assert serializable_dict.keys() == static_parking_site_input.to_dict().keys()
+    assert serializable_dict['lat'] == '48.7758459'
+    assert json.dumps(serializable_dict, cls=DefaultJSONEncoder) == json.dumps(
+        static_parking_site_input.to_dict(),
+        cls=DefaultJSONEncoder,
+    )
+    assert convert_to_serializable_value(static_parking_site_input) == serializable_dict
+
+
+def test_to_serializable_dict_without_validataclass():
+    assert to_serializable_dict(TestToDictClass(key='TEST')) == {'key': 'TEST'}
@@ -0,0 +1,74 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from parkapi_sources.util import MetricsCollector, PhaseTimer
+
+
+class MetricsCollectorTest:
+    @staticmethod
+    def test_collects_durations_and_counters():
+        metrics_collector = MetricsCollector()
+
+        metrics_collector.observe_duration('source-a', 'fetch', 0.5)
+        metrics_collector.observe_duration('source-a', 'fetch', 1.5)
+        metrics_collector.increment('source-a', 'records', 3)
+        metrics_collector.increment('source-b', 'errors')
+
+        phase_duration = metrics_collector.get_durations()['source-a']['fetch']
+        assert phase_duration.count == 2
+        assert phase_duration.sum == 2.0
+        assert phase_duration.max == 1.5
+        assert metrics_collector.get_counters() == {'source-a': {'records': 3}, 'source-b': {'errors': 1}}
+
+        metrics_collector.reset()
+
+        assert metrics_collector.get_durations() == {}
+        assert metrics_collector.get_counters() == {}
+
+    @staticmethod
+    def test_to_prometheus_text():
+        metrics_collector = MetricsCollector()
+
+        metrics_collector.observe_duration('source-a', 'parse', 0.25)
+        metrics_collector.increment('source-a', 'records', 3)
+        metrics_collector.increment('source-"b"', 'records')
+        metrics_collector.increment_labelled('source-a', 'request_errors', {'error_type': 'ReadTimeout'}, 2)
+
+        assert metrics_collector.to_prometheus_text() == (
+            '# HELP parkapi_sources_phase_duration_seconds Time spent per source and phase.\n'
+            '# TYPE parkapi_sources_phase_duration_seconds summary\n'
+            'parkapi_sources_phase_duration_seconds_count{source="source-a",phase="parse"} 1\n'
+            'parkapi_sources_phase_duration_seconds_sum{source="source-a",phase="parse"} 0.25\n'
+            '# TYPE parkapi_sources_records_total counter\n'
+            'parkapi_sources_records_total{source="source-\\"b\\""} 1\n'
+            'parkapi_sources_records_total{source="source-a"} 3\n'
+            '# TYPE parkapi_sources_request_errors_total counter\n'
+            'parkapi_sources_request_errors_total{source="source-a",error_type="ReadTimeout"} 2\n'
+        )
+
+
+class PhaseTimerTest:
+    @staticmethod
+    def test_accumulates_interleaved_phases():
+        metrics_collector = MetricsCollector()
+        phase_timer = PhaseTimer(metrics_collector, 'source-a', 'validate')
+
+        for _ in range(3):
+            phase_timer.switch('map')
+            phase_timer.switch('validate')
+        phase_timer.pause()
+        phase_timer.stop()
+
+        durations = metrics_collector.get_durations()['source-a']
+        assert set(durations.keys()) == {'validate', 'map'}
+        # Each phase is reported once per timer, not once per switch
+        assert durations['validate'].count == 1
+        assert durations['map'].count == 1
+
+    @staticmethod
+    def test_without_metrics_hook():
+        phase_timer = PhaseTimer(None, 'source-a', 'validate')
+        phase_timer.switch('map')
+        phase_timer.stop()
@@ -0,0 +1,64 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pyproj
+from shapely import LineString, Point
+
+from parkapi_sources.util import (
+    UTM32_PROJ_KWARGS,
+    reproject_utm32_lat_lon,
+    round_7d,
+    round_7d_all,
+    transform_utm32_coordinates,
+    transform_utm32_geometries,
+)
+
+EASTINGS: list[float] = [513226.54, 497850.0, 461327.9]
+NORTHINGS: list[float] = [5402867.01, 5403950.5, 5287214.3]
+
+
+class ProjectionHelperTest:
+    @staticmethod
+    def test_transform_utm32_coordinates_matches_proj():
+        proj = pyproj.Proj(**UTM32_PROJ_KWARGS)
+
+        longitudes, latitudes = transform_utm32_coordinates(EASTINGS, NORTHINGS)
+
+        assert [proj(x, y, inverse=True) for x, y in zip(EASTINGS, NORTHINGS)] == list(zip(longitudes, latitudes))
+
+    @staticmethod
+    def test_transform_utm32_coordinates_empty():
+        assert transform_utm32_coordinates([], []) == ([], [])
+
+    @staticmethod
+    def test_transform_utm32_geometries():
+        longitudes, latitudes = transform_utm32_coordinates(EASTINGS, NORTHINGS)
+
+        point, line_string = transform_utm32_geometries([
+            Point(EASTINGS[0], NORTHINGS[0]),
+            LineString(zip(EASTINGS, NORTHINGS)),
+        ])
+
+        assert (point.x, point.y) == (longitudes[0], latitudes[0])
+        assert list(line_string.coords) == list(zip(longitudes, latitudes))
+
+    @staticmethod
+    def test_reproject_utm32_lat_lon():
+        items = [SimpleNamespace(lat=Decimal(str(y)), lon=Decimal(str(x))) for x, y in zip(EASTINGS, NORTHINGS)]
+        longitudes, latitudes = transform_utm32_coordinates(EASTINGS, NORTHINGS)
+
+        reproject_utm32_lat_lon(items)
+
+        assert [item.lon for item in items] == [round_7d(lon) for lon in longitudes]
+        assert [item.lat for item in items] == [round_7d(lat) for lat in latitudes]
+
+    @staticmethod
+    def test_round_7d_all():
+        values = [9.123456749, 9.12345675, Decimal('48.00000005'), 1.0]
+
+        assert round_7d_all(values) == [round_7d(value) for value in values]
@@ -3,6 +3,7 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+import gzip
 import shutil
 from pathlib import Path
 
@@ -11,7 +12,7 @@ import requests
 
 from parkapi_sources.exceptions import MissingConfigException
 from parkapi_sources.models import SourceInfo
-from parkapi_sources.util import ConfigHelper, RequestHelper
+from parkapi_sources.util import ConfigHelper, MetricsCollector, RequestHelper
 
 
 @pytest.fixture
@@ -96,3 +97,126 @@ class RequestHelperTest:
 
         with pytest.raises(MissingConfigException):
             request_helper._handle_request_response(source_info, response)
+
+    @staticmethod
+    def test_session_is_reused_per_source_and_host(source_info: SourceInfo):
+        request_helper = RequestHelper(config_helper=ConfigHelper({}))
+        other_source_info = SourceInfo(uid='other-source', name='Other Source', has_realtime_data=False)
+
+        session = request_helper._get_session(source_info, 'https://example.com/first')
+
+        assert request_helper._get_session(source_info, 'https://example.com/second') is session
+        assert request_helper._get_session(source_info, 'https://example.org/first') is not session
+        assert request_helper._get_session(other_source_info, 'https://example.com/first') is not session
+
+        request_helper.close()
+
+        assert request_helper._get_session(source_info, 'https://example.com/first') is not session
+
+    @staticmethod
+    def test_session_adapter_config(source_info: SourceInfo):
+        request_helper = RequestHelper(
+            config_helper=ConfigHelper({'REQUEST_POOL_MAXSIZE': '4', 'REQUEST_MAX_RETRIES': '0'}),
+        )
+
+        adapter = request_helper._get_session(source_info, 'https://example.com').get_adapter('https://example.com')
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+
+    @staticmethod
+    def test_request_does_not_persist_cookies(source_info: SourceInfo, requests_mock):
+        request_helper = RequestHelper(config_helper=ConfigHelper({}))
+        requests_mock.get('https://example.com/login', text='ok', headers={'Set-Cookie': 'session=secret; Path=/'})
+
+        request_helper.get(source_info=source_info, url='https://example.com/login')
+
+        assert len(request_helper._get_session(source_info, 'https://example.com').cookies) == 0
+
+    @staticmethod
+    def test_http_cache_returns_cached_body_on_not_modified(source_info: SourceInfo, requests_mock, tmp_path: Path):
+        request_helper = RequestHelper(
+            config_helper=ConfigHelper({'HTTP_CACHE_DIR': str(tmp_path), 'HTTP_CACHE_SOURCES': ['test-source']}),
+        )
+        requests_mock.get(
+            'https://example.com/static.json',
+            [
+                {
+                    'json': {'key': 'value'},
+                    'headers': {'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'},
+                },
+                {'status_code': 304, 'headers': {'ETag': '"v1"'}},
+            ],
+        )
+
+        first_response = request_helper.get(
+            source_info=source_info, url='https://example.com/static.json', http_cache=True
+        )
+        second_response = request_helper.get(
+            source_info=source_info, url='https://example.com/static.json', http_cache=True
+        )
+
+        assert first_response.json() == {'key': 'value'}
+        assert requests_mock.request_history[1].headers['If-None-Match'] == '"v1"'
+        assert requests_mock.request_history[1].headers['If-Modified-Since'] == 'Wed, 01 Jan 2025 00:00:00 GMT'
+        assert second_response.status_code == 200
+        assert second_response.json() == {'key': 'value'}
+
+    @staticmethod
+    def test_http_cache_is_opt_in_per_source(source_info: SourceInfo, requests_mock, tmp_path: Path):
+        request_helper = RequestHelper(
+            config_helper=ConfigHelper({'HTTP_CACHE_DIR': str(tmp_path), 'HTTP_CACHE_SOURCES': ['other-source']}),
+        )
+        requests_mock.get('https://example.com/static.json', json={'key': 'value'}, headers={'ETag': '"v1"'})
+
+        request_helper.get(source_info=source_info, url='https://example.com/static.json', http_cache=True)
+        request_helper.get(source_info=source_info, url='https://example.com/static.json', http_cache=True)
+
+        assert 'If-None-Match' not in requests_mock.request_history[1].headers
+        assert list(tmp_path.iterdir()) == []
+
+    @staticmethod
+    def test_request_metrics(source_info: SourceInfo, requests_mock):
+        metrics_collector = MetricsCollector()
+        request_helper = RequestHelper(config_helper=ConfigHelper({}), metrics_hook=metrics_collector)
+        requests_mock.get('https://example.com/static.json', text='0123456789')
+        requests_mock.get('https://example.com/missing.json', status_code=404, text='')
+
+        request_helper.get(source_info=source_info, url='https://example.com/static.json')
+        request_helper.get(source_info=source_info, url='https://example.com/missing.json')
+
+        assert metrics_collector.get_counters() == {
+            'test-source': {'requests': 2, 'bytes_received': 10, 'http_errors': 1},
+        }
+        assert metrics_collector.get_durations()['test-source']['fetch'].count == 2
+
+    @staticmethod
+    def test_request_metrics_compressed(source_info: SourceInfo, requests_mock):
+        metrics_collector = MetricsCollector()
+        request_helper = RequestHelper(config_helper=ConfigHelper({}), metrics_hook=metrics_collector)
+        compressed_body = gzip.compress(b'0123456789' * 100)
+        requests_mock.get(
+            'https://example.com/static.json',
+            content=compressed_body,
+            headers={'Content-Encoding': 'gzip'},
+        )
+
+        response = request_helper.get(source_info=source_info, url='https://example.com/static.json')
+
+        assert len(response.content) == 1000
+        assert metrics_collector.get_counters()['test-source']['bytes_received'] == len(compressed_body)
+
+    @staticmethod
+    def test_request_metrics_error(source_info: SourceInfo, requests_mock):
+        metrics_collector = MetricsCollector()
+        request_helper = RequestHelper(config_helper=ConfigHelper({}), metrics_hook=metrics_collector)
+        requests_mock.get('https://example.com/static.json', exc=requests.exceptions.ConnectTimeout)
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            request_helper.get(source_info=source_info, url='https://example.com/static.json')
+
+        assert metrics_collector.get_counters() == {'test-source': {'request_errors': 1}}
+        assert metrics_collector.get_labelled_counters() == {
+            'test-source': {'request_errors': {(('error_type', 'ConnectTimeout'),): 1}},
+        }
+        assert metrics_collector.get_durations()['test-source']['fetch'].count == 1
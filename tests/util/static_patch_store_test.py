@@ -0,0 +1,86 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+from validataclass.validators import DataclassValidator
+
+from parkapi_sources.exceptions import ImportSourceException
+from parkapi_sources.models import StaticParkingSitePatchInput, StaticPatchInput
+from parkapi_sources.util import StaticPatchStore
+
+
+def get_field_updates_by_uid(static_patch_store: StaticPatchStore, path: Path, patch_validator=None) -> dict:
+    return static_patch_store.get_field_updates_by_uid(
+        path,
+        'source',
+        DataclassValidator(StaticPatchInput),
+        patch_validator or DataclassValidator(StaticParkingSitePatchInput),
+    )
+
+
+class StaticPatchStoreTest:
+    @staticmethod
+    def test_get_field_updates_by_uid(tmp_path: Path):
+        path = Path(tmp_path, 'source.json')
+        path.write_text(json.dumps({'items': [{'uid': '1', 'name': 'First'}, {'uid': '1', 'description': 'Second'}]}))
+        static_patch_store = StaticPatchStore()
+        patch_validator = Mock(wraps=DataclassValidator(StaticParkingSitePatchInput))
+
+        for _ in range(3):
+            field_updates_by_uid = get_field_updates_by_uid(static_patch_store, path, patch_validator)
+
+        assert list(field_updates_by_uid.keys()) == ['1']
+        assert field_updates_by_uid['1']['name'] == 'First'
+        assert field_updates_by_uid['1']['description'] == 'Second'
+        assert patch_validator.validate.call_count == 2
+
+    @staticmethod
+    def test_get_field_updates_by_uid_reloads_changed_files(tmp_path: Path):
+        path = Path(tmp_path, 'source.json')
+        path.write_text(json.dumps({'items': [{'uid': '1', 'name': 'Old'}]}))
+        static_patch_store = StaticPatchStore()
+
+        assert get_field_updates_by_uid(static_patch_store, path)['1']['name'] == 'Old'
+
+        path.write_text(json.dumps({'items': [{'uid': '1', 'name': 'New name'}]}))
+        # Make sure the mtime changes even on file systems with coarse timestamps
+        stat_result = path.stat()
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+        assert get_field_updates_by_uid(static_patch_store, path)['1']['name'] == 'New name'
+
+        path.unlink()
+
+        assert get_field_updates_by_uid(static_patch_store, path) == {}
+
+    @staticmethod
+    def test_pop_import_exceptions_once(tmp_path: Path):
+        path = Path(tmp_path, 'source.json')
+        path.write_text(json.dumps({'items': [{'uid': '1', 'name': 'Valid'}, {'uid': '2', 'lat': 'invalid'}]}))
+        static_patch_store = StaticPatchStore()
+
+        get_field_updates_by_uid(static_patch_store, path)
+        get_field_updates_by_uid(static_patch_store, path)
+
+        import_exceptions = static_patch_store.pop_import_exceptions(path)
+        assert len(import_exceptions) == 1
+        assert isinstance(import_exceptions[0], ImportSourceException)
+        assert static_patch_store.pop_import_exceptions(path) == []
+
+        get_field_updates_by_uid(static_patch_store, path)
+        assert static_patch_store.pop_import_exceptions(path) == []
+
+    @staticmethod
+    def test_invalid_json(tmp_path: Path):
+        path = Path(tmp_path, 'source.json')
+        path.write_text('{')
+        static_patch_store = StaticPatchStore()
+
+        assert get_field_updates_by_uid(static_patch_store, path) == {}
+        assert len(static_patch_store.pop_import_exceptions(path)) == 1
@@ -0,0 +1,53 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from pathlib import Path
+
+from parkapi_sources.exceptions import ImportParkingSiteException
+from parkapi_sources.util import StaticResultCache
+
+
+class StaticResultCacheTest:
+    @staticmethod
+    def test_set_and_get(tmp_path: Path):
+        static_result_cache = StaticResultCache(tmp_path)
+        key = static_result_cache.build_key(b'{"data": []}', None)
+
+        static_result_cache.set(
+            'test-source',
+            'parking_sites',
+            key,
+            [{'uid': 'site-1'}],
+            [ImportParkingSiteException(source_uid='test-source', parking_site_uid='site-2', message='invalid')],
+        )
+        inputs, import_exceptions = static_result_cache.get('test-source', 'parking_sites', key)
+
+        assert inputs == [{'uid': 'site-1'}]
+        assert len(import_exceptions) == 1
+        assert isinstance(import_exceptions[0], ImportParkingSiteException)
+        assert import_exceptions[0].parking_site_uid == 'site-2'
+        assert import_exceptions[0].message == 'invalid'
+
+    @staticmethod
+    def test_changed_key(tmp_path: Path):
+        static_result_cache = StaticResultCache(tmp_path)
+        key = static_result_cache.build_key(b'{"data": []}', b'{"items": []}')
+        static_result_cache.set('test-source', 'parking_sites', key, [], [])
+
+        assert static_result_cache.get('test-source', 'parking_sites', key) == ([], [])
+        assert static_result_cache.get('test-source', 'parking_spots', key) is None
+        for changed_key in [
+            static_result_cache.build_key(b'{"data": [1]}', b'{"items": []}'),
+            static_result_cache.build_key(b'{"data": []}', None),
+            static_result_cache.build_key(b'{"data": []}', b'{"items": []}', key_data=True),
+        ]:
+            assert static_result_cache.get('test-source', 'parking_sites', changed_key) is None
+
+    @staticmethod
+    def test_broken_entry(tmp_path: Path):
+        static_result_cache = StaticResultCache(tmp_path)
+        Path(tmp_path, 'test-source-parking_sites.pickle').write_bytes(b'broken')
+
+        assert static_result_cache.get('test-source', 'parking_sites', 'key') is None
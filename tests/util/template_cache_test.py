@@ -0,0 +1,55 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from typing import Optional
+from unittest.mock import Mock
+
+from parkapi_sources.util import TemplateCache
+
+
+class TemplateCacheTest:
+    @staticmethod
+    def test_get_within_ttl():
+        template_cache = TemplateCache()
+        fetch = Mock(return_value=('v1', b'data'))
+        parse = Mock(return_value=(['item'], []))
+
+        for _ in range(3):
+            assert template_cache.get('key', 60, fetch, parse) == (['item'], [])
+
+        assert fetch.call_count == 1
+        assert parse.call_count == 1
+
+    @staticmethod
+    def test_get_revalidates_after_ttl():
+        template_cache = TemplateCache()
+        versions = ['v1', 'v1', 'v2']
+        known_versions: list[Optional[str]] = []
+
+        def fetch(known_version: Optional[str]) -> tuple[str, Optional[bytes]]:
+            known_versions.append(known_version)
+            version = versions.pop(0)
+            return version, None if version == known_version else version.encode()
+
+        parse = Mock(side_effect=lambda data: ([data], []))
+
+        assert template_cache.get('key', 0, fetch, parse) == ([b'v1'], [])
+        assert template_cache.get('key', 0, fetch, parse) == ([b'v1'], [])
+        assert template_cache.get('key', 0, fetch, parse) == ([b'v2'], [])
+
+        assert known_versions == [None, 'v1', 'v1']
+        assert parse.call_count == 2
+
+    @staticmethod
+    def test_get_returns_copies():
+        template_cache = TemplateCache()
+        fetch = Mock(return_value=('v1', b'data'))
+        parse = Mock(return_value=(['item'], ['exception']))
+
+        items, import_exceptions = template_cache.get('key', 60, fetch, parse)
+        items.append('other item')
+        import_exceptions.append('other exception')
+
+        assert template_cache.get('key', 60, fetch, parse) == (['item'], ['exception'])
@@ -0,0 +1,44 @@
+"""
+Copyright 2026 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from unittest.mock import Mock
+
+from parkapi_sources.util import TokenCache
+
+
+class TokenCacheTest:
+    @staticmethod
+    def test_get_caches_token():
+        token_cache = TokenCache()
+        fetch_token = Mock(return_value=('token', 3600))
+
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'token'
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'token'
+        assert fetch_token.call_count == 1
+
+    @staticmethod
+    def test_get_refreshes_token_before_expiry():
+        token_cache = TokenCache()
+        fetch_token = Mock(side_effect=[('first-token', 20), ('second-token', 20)])
+
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'first-token'
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'second-token'
+
+    @staticmethod
+    def test_invalidate_keeps_refreshed_token():
+        token_cache = TokenCache()
+        fetch_token = Mock(side_effect=[('first-token', None), ('second-token', None)])
+
+        token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30)
+        token_cache.invalidate('key', token='other-token')
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'first-token'
+
+        token_cache.invalidate('key', token='first-token')
+        assert token_cache.get('key', fetch_token, default_lifetime=300, refresh_margin=30) == 'second-token'
+
+    @staticmethod
+    def test_build_key_depends_on_all_parts():
+        assert TokenCache.build_key('source', 'user', 'password') == TokenCache.build_key('source', 'user', 'password')
+        assert TokenCache.build_key('source', 'user', 'password') != TokenCache.build_key('source', 'user', 'other')
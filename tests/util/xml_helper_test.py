@@ -3,12 +3,14 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from io import BytesIO
+from pathlib import Path
 from typing import List, Optional, Tuple
 
 import pytest
 from lxml import etree
 
-from parkapi_sources.util import XMLHelper
+from parkapi_sources.util import XMLHelper, XMLToDictConverter
 from tests.util.data_xml_helper import (
     conditional_remote_type_tags_2a,
     conditional_remote_type_tags_3a,
@@ -157,3 +159,76 @@ def test_xml_to_dict(
     )
 
     assert result_dict == expected_output
+
+
+def test_xml_to_dict_converter_reuse():
+    xml_to_dict_converter = XMLToDictConverter(
+        ensure_array_keys=[('parkingStatusPublication', 'parkingRecordStatus')],
+    )
+    results: list[dict] = []
+    for filename in ['aachen-realtime.xml', 'stuttgart-realtime.xml', 'aachen-realtime.xml']:
+        xml_data = Path(Path(__file__).parent.parent, 'converters', 'data', filename).read_bytes()
+        input_tag = etree.fromstring(xml_data, parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+
+        result_dict = xml_to_dict_converter.convert(input_tag)
+
+        assert result_dict == XMLHelper.xml_to_dict(
+            input_tag,
+            ensure_array_keys=[('parkingStatusPublication', 'parkingRecordStatus')],
+        )
+        results.append(result_dict)
+
+    # Results must not share state between documents
+    assert results[0] == results[2]
+    assert results[0] is not results[2]
+
+
+@pytest.mark.parametrize(
+    'filename, path, record_tag, parent_tag, ensure_array_keys',
+    [
+        (
+            'aachen-realtime.xml',
+            ['payloadPublication', 'genericPublicationExtension', 'parkingStatusPublication'],
+            'parkingRecordStatus',
+            'parkingStatusPublication',
+            [('parkingStatusPublication', 'parkingRecordStatus')],
+        ),
+        (
+            # Nested parkingFacilityStatus tags are part of the record
+            'stuttgart-realtime.xml',
+            ['payloadPublication', 'genericPublicationExtension', 'parkingFacilityTableStatusPublication'],
+            'parkingFacilityStatus',
+            'parkingFacilityTableStatusPublication',
+            [
+                ('parkingFacilityTableStatusPublication', 'parkingFacilityStatus'),
+                ('parkingFacilityStatus', 'parkingFacilityStatus'),
+            ],
+        ),
+    ],
+)
+def test_iter_xml_records(
+    filename: str,
+    path: list[str],
+    record_tag: str,
+    parent_tag: str,
+    ensure_array_keys: List[Tuple[str, str]],
+):
+    xml_data = Path(Path(__file__).parent.parent, 'converters', 'data', filename).read_bytes()
+
+    expected_dict = XMLHelper.xml_to_dict(
+        etree.fromstring(xml_data, parser=etree.XMLParser(resolve_entities=False)),  # noqa: S320
+        ensure_array_keys=ensure_array_keys,
+    )['d2LogicalModel']
+    for key in path:
+        expected_dict = expected_dict[key]
+
+    result = list(
+        XMLHelper.iter_xml_records(
+            BytesIO(xml_data),
+            record_tag=record_tag,
+            parent_tag=parent_tag,
+            ensure_array_keys=ensure_array_keys,
+        ),
+    )
+
+    assert result == expected_dict[record_tag]